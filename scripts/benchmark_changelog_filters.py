@@ -0,0 +1,155 @@
+# ruff: noqa: T201, allow print statements in non-prod scripts
+"""
+Benchmark the rendering of the default changelogs over a synthetic commit history,
+comparing the plain template filters with the memoized filters of the changelog context.
+
+The history is built in memory (no git repository) so large histories are cheap to create.
+
+Usage: python -m scripts.benchmark_changelog_filters [COMMITS] [RELEASES] [ROUNDS]
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import replace
+from datetime import datetime, timezone
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from timeit import repeat
+from typing import TYPE_CHECKING, NamedTuple
+
+from git import Actor
+
+from semantic_release.changelog.context import (
+    ChangelogMode,
+    autofit_text_width,
+    convert_md_to_rst,
+    create_pypi_url,
+    make_changelog_context,
+    read_file,
+)
+from semantic_release.changelog.release_history import Release, ReleaseHistory
+from semantic_release.cli.changelog_writer import render_default_changelog_file
+from semantic_release.cli.config import ChangelogOutputFormat
+from semantic_release.commit_parser.token import ParsedCommit
+from semantic_release.enums import LevelBump
+from semantic_release.helpers import sort_numerically
+from semantic_release.hvcs.github import Github
+from semantic_release.version.version import Version
+
+if TYPE_CHECKING:
+    from semantic_release.changelog.context import ChangelogContext
+    from semantic_release.commit_parser.token import ParseResult
+
+# Constants
+COMMIT_TYPES = ("feature", "fix", "performance improvement", "documentation")
+AUTHOR = Actor("benchmark", "benchmark@example.com")
+
+
+class SyntheticCommit(NamedTuple):
+    hexsha: str
+    message: str
+
+
+def build_history(num_commits: int, num_releases: int) -> ReleaseHistory:
+    commits_per_release = max(num_commits // num_releases, 1)
+    released: dict[Version, Release] = {}
+
+    for release_num in range(num_releases, 0, -1):
+        version = Version.parse(f"0.{release_num}.0")
+        elements: dict[str, list[ParseResult]] = {}
+
+        for i in range(commits_per_release):
+            commit_num = (release_num - 1) * commits_per_release + i
+            commit_type = COMMIT_TYPES[commit_num % len(COMMIT_TYPES)]
+            description = f"change number {commit_num} of the __synthetic__ history"
+            elements.setdefault(commit_type, []).append(
+                ParsedCommit(
+                    bump=LevelBump.PATCH,
+                    type=commit_type,
+                    scope=f"scope-{commit_num % 7}",
+                    descriptions=[description],
+                    breaking_descriptions=[],
+                    commit=SyntheticCommit(  # type: ignore[arg-type]
+                        hexsha=f"{commit_num:040x}",
+                        message=f"fix: {description}",
+                    ),
+                    linked_merge_request=f"#{commit_num % 500}",
+                )
+            )
+
+        released[version] = Release(
+            tagger=AUTHOR,
+            committer=AUTHOR,
+            tagged_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            elements=elements,
+            version=version,
+        )
+
+    return ReleaseHistory(unreleased={}, released=released)
+
+
+def benchmark(num_commits: int, num_releases: int, rounds: int) -> None:
+    hvcs_client = Github("https://github.com/example/example.git")
+    release_history = build_history(num_commits, num_releases)
+
+    with TemporaryDirectory() as tmp_dir:
+        memoized_context = make_changelog_context(
+            hvcs_client=hvcs_client,
+            release_history=release_history,
+            mode=ChangelogMode.INIT,
+            prev_changelog_file=Path(tmp_dir, "CHANGELOG.md"),
+            insertion_flag="<!-- version list -->",
+            mask_initial_release=False,
+        )
+        plain_context = replace(
+            memoized_context,
+            filters=(
+                *hvcs_client.get_changelog_context_filters(),
+                create_pypi_url,
+                read_file,
+                convert_md_to_rst,
+                autofit_text_width,
+                sort_numerically,
+            ),
+        )
+
+        print(
+            f"Rendering changelogs for {num_commits} commits in {num_releases} releases"
+        )
+
+        for output_format in (
+            ChangelogOutputFormat.MARKDOWN,
+            ChangelogOutputFormat.RESTRUCTURED_TEXT,
+        ):
+            timings: dict[str, float] = {}
+            for label, changelog_context in (
+                ("plain", plain_context),
+                ("memoized", memoized_context),
+            ):
+
+                def render(
+                    ctx: ChangelogContext = changelog_context,
+                    fmt: ChangelogOutputFormat = output_format,
+                ) -> str:
+                    return render_default_changelog_file(
+                        output_format=fmt,
+                        changelog_context=ctx,
+                        changelog_style="angular",
+                    )
+
+                timings[label] = min(repeat(render, number=1, repeat=rounds))
+                print(
+                    f"  {output_format.value:>3} {label:>8}: {timings[label]:.3f}s",
+                    f"(best of {rounds})",
+                )
+
+            print(
+                f"  {output_format.value:>3}  speedup: "
+                f"{timings['plain'] / timings['memoized']:.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:4]]
+    benchmark(*[*args, *(50_000, 500, 3)[len(args) :]])
@@ -0,0 +1,91 @@
+# ruff: noqa: T201, allow print statements in non-prod scripts
+"""
+Benchmark the rendering of a full history CHANGELOG.md with the default templates,
+comparing the sandboxed environment (previous behavior) with the trusted one.
+
+Usage: python -m scripts.benchmark_default_changelog [COMMITS] [RELEASES] [ROUNDS]
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from timeit import repeat
+
+from git import Actor, Repo
+
+from semantic_release.changelog.context import ChangelogMode, make_changelog_context
+from semantic_release.changelog.release_history import ReleaseHistory
+from semantic_release.changelog.template import environment
+from semantic_release.cli.changelog_writer import get_default_tpl_dir
+from semantic_release.commit_parser.conventional import ConventionalCommitParser
+from semantic_release.hvcs.github import Github
+from semantic_release.version.translator import VersionTranslator
+
+# Constants
+COMMIT_TYPES = ("feat", "fix", "perf", "docs", "refactor")
+AUTHOR = Actor("benchmark", "benchmark@example.com")
+
+
+def build_repo(repo_dir: Path, num_commits: int, num_releases: int) -> Repo:
+    repo = Repo.init(repo_dir)
+    commits_per_release = max(num_commits // num_releases, 1)
+
+    for i in range(1, num_commits + 1):
+        commit_type = COMMIT_TYPES[i % len(COMMIT_TYPES)]
+        repo.index.commit(
+            f"{commit_type}(scope-{i % 7}): change number {i}\n\nRelated to #{i}",
+            author=AUTHOR,
+            committer=AUTHOR,
+        )
+        if i % commits_per_release == 0:
+            repo.create_tag(f"v0.{i // commits_per_release}.0")
+
+    return repo
+
+
+def benchmark(num_commits: int, num_releases: int, rounds: int) -> None:
+    with TemporaryDirectory() as tmp_dir:
+        repo = build_repo(Path(tmp_dir), num_commits, num_releases)
+        release_history = ReleaseHistory.from_git_history(
+            repo=repo,
+            translator=VersionTranslator(),
+            commit_parser=ConventionalCommitParser(),
+        )
+        repo.close()
+
+        changelog_context = make_changelog_context(
+            hvcs_client=Github("https://github.com/example/example.git"),
+            release_history=release_history,
+            mode=ChangelogMode.INIT,
+            prev_changelog_file=Path(tmp_dir, "CHANGELOG.md"),
+            insertion_flag="<!-- version list -->",
+            mask_initial_release=False,
+        )
+
+        print(
+            f"Rendering CHANGELOG.md for {num_commits} commits in {num_releases} releases"
+        )
+
+        timings: dict[str, float] = {}
+        for label, sandboxed in (("sandboxed", True), ("trusted", False)):
+            template = changelog_context.bind_to_environment(
+                environment(
+                    template_dir=get_default_tpl_dir(style="angular", sub_dir="md"),
+                    autoescape=False,
+                    sandboxed=sandboxed,
+                )
+            ).get_template("CHANGELOG.md.j2")
+
+            # Compile & warm up before measuring
+            template.render()
+            timings[label] = min(repeat(template.render, number=1, repeat=rounds))
+            print(f"  {label:>9}: {timings[label]:.3f}s (best of {rounds})")
+
+        print(f"  speedup: {timings['sandboxed'] / timings['trusted']:.2f}x")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:4]]
+    benchmark(*[*args, *(2000, 50, 5)[len(args) :]])
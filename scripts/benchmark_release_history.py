@@ -0,0 +1,61 @@
+# ruff: noqa: T201, allow print statements in non-prod scripts
+"""
+Benchmark walking the git history into a ReleaseHistory, comparing the default
+verbosity (per-commit logging disabled) with DEBUG logging enabled.
+
+Usage: python -m scripts.benchmark_release_history [COMMITS] [RELEASES] [ROUNDS]
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from timeit import repeat
+
+from scripts.benchmark_default_changelog import build_repo
+from semantic_release.changelog import release_history as release_history_module
+from semantic_release.changelog.release_history import ReleaseHistory
+from semantic_release.commit_parser.conventional import ConventionalCommitParser
+from semantic_release.version.translator import VersionTranslator
+
+
+def benchmark(num_commits: int, num_releases: int, rounds: int) -> None:
+    logger = logging.getLogger(release_history_module.__name__)
+    # Discard the records, only the cost of producing them is measured
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+
+    with TemporaryDirectory() as tmp_dir:
+        repo = build_repo(Path(tmp_dir), num_commits, num_releases)
+        translator = VersionTranslator()
+        commit_parser = ConventionalCommitParser()
+
+        def walk_history() -> ReleaseHistory:
+            return ReleaseHistory.from_git_history(
+                repo=repo,
+                translator=translator,
+                commit_parser=commit_parser,
+            )
+
+        print(
+            f"Walking the history of {num_commits} commits in {num_releases} releases"
+        )
+
+        timings: dict[str, float] = {}
+        for label, level in (("debug", logging.DEBUG), ("default", logging.WARNING)):
+            logger.setLevel(level)
+            # Warm up the git object caches before measuring
+            walk_history()
+            timings[label] = min(repeat(walk_history, number=1, repeat=rounds))
+            print(f"  {label:>7}: {timings[label]:.3f}s (best of {rounds})")
+
+        repo.close()
+
+    print(f"  speedup: {timings['debug'] / timings['default']:.2f}x")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:4]]
+    benchmark(*[*args, *(2000, 50, 5)[len(args) :]])
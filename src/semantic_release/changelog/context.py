@@ -4,9 +4,10 @@ import logging
 import os
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache, wraps
 from pathlib import Path, PurePosixPath
 from re import compile as regexp
-from typing import TYPE_CHECKING, Any, Callable, Literal
+from typing import TYPE_CHECKING, Any, Callable, Literal, TypeVar
 
 from urllib3.util import Url
 
@@ -20,6 +21,11 @@ if TYPE_CHECKING:  # pragma: no cover
     from semantic_release.hvcs._base import HvcsBase
     from semantic_release.version.version import Version
 
+_T = TypeVar("_T")
+
+FILTER_CACHE_SIZE = 4096
+"""The maximum number of results cached per memoized template filter"""
+
 
 @dataclass
 class ReleaseNotesContext:
@@ -79,6 +85,13 @@ def make_changelog_context(
     insertion_flag: str,
     mask_initial_release: bool,
 ) -> ChangelogContext:
+    pure_filters: tuple[Callable[..., Any], ...] = (
+        *hvcs_client.get_changelog_context_filters(),
+        create_pypi_url,
+        convert_md_to_rst,
+        autofit_text_width,
+    )
+
     return ChangelogContext(
         repo_name=hvcs_client.repo_name,
         repo_owner=hvcs_client.owner,
@@ -89,16 +102,34 @@ def make_changelog_context(
         prev_changelog_file=str(prev_changelog_file),
         hvcs_type=hvcs_client.__class__.__name__.lower(),
         filters=(
-            *hvcs_client.get_changelog_context_filters(),
-            create_pypi_url,
+            *map(memoize_filter, pure_filters),
             read_file,
-            convert_md_to_rst,
-            autofit_text_width,
             sort_numerically,
         ),
     )
 
 
+def memoize_filter(filter_fn: Callable[..., _T]) -> Callable[..., _T]:
+    """
+    Wrap a pure template filter with a bounded LRU cache, as the same filter is
+    commonly called with the same arguments thousands of times in a changelog render.
+
+    Calls with unhashable arguments (e.g. a list) are passed through to the filter.
+    """
+    cached_filter_fn = lru_cache(maxsize=FILTER_CACHE_SIZE)(filter_fn)
+
+    @wraps(filter_fn)
+    def memoized_filter(*args: Any, **kwargs: Any) -> _T:
+        try:
+            hash((args, *kwargs.items()))
+        except TypeError:
+            return filter_fn(*args, **kwargs)
+
+        return cached_filter_fn(*args, **kwargs)
+
+    return memoized_filter
+
+
 def create_pypi_url(package_name: str, version: str = "") -> str:
     project_name = package_name.strip("/").strip()
     if not project_name:
@@ -123,25 +154,25 @@ def read_file(filepath: str) -> str:
         return ""
 
 
+# Markdown to reStructuredText replacements, in the order they are applied
+_MD_TO_RST_REPLACEMENTS = (
+    # Replace markdown doubleunder bold with rst bold
+    (regexp(r"(?<=\s)__(.+?)__(?=\s|$)"), r"**\1**"),
+    # Replace markdown italics with rst italics
+    (regexp(r"(?<=\s)_([^_].+?[^_])_(?=\s|$)"), r"*\1*"),
+    # Replace markdown bullets with rst bullets
+    (regexp(r"^(\s*)-(\s)"), r"\1*\2"),
+    # Replace markdown inline raw content with rst inline raw content
+    (regexp(r"(?<=\s)(`[^`]+`)(?![`_])"), r"`\1`"),
+    # Replace markdown inline link with rst inline link
+    (regexp(r"(?<=\s)\[([^\]]+)\]\(([^)]+)\)(?=\s|$)"), r"`\1 <\2>`_"),
+)
+
+
 def convert_md_to_rst(md_content: str) -> str:
     rst_content = md_content
-    replacements = {
-        # Replace markdown doubleunder bold with rst bold
-        "bold-inline": (regexp(r"(?<=\s)__(.+?)__(?=\s|$)"), r"**\1**"),
-        # Replace markdown italics with rst italics
-        "italic-inline": (regexp(r"(?<=\s)_([^_].+?[^_])_(?=\s|$)"), r"*\1*"),
-        # Replace markdown bullets with rst bullets
-        "bullets": (regexp(r"^(\s*)-(\s)"), r"\1*\2"),
-        # Replace markdown inline raw content with rst inline raw content
-        "raw-inline": (regexp(r"(?<=\s)(`[^`]+`)(?![`_])"), r"`\1`"),
-        # Replace markdown inline link with rst inline link
-        "link-inline": (
-            regexp(r"(?<=\s)\[([^\]]+)\]\(([^)]+)\)(?=\s|$)"),
-            r"`\1 <\2>`_",
-        ),
-    }
 
-    for pattern, replacement in replacements.values():
+    for pattern, replacement in _MD_TO_RST_REPLACEMENTS:
         rst_content = pattern.sub(replacement, rst_content)
 
     return rst_content
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta, timezone
+from functools import cached_property
+from itertools import islice
 from typing import TYPE_CHECKING, TypedDict
 
 from git.objects.tag import TagObject
@@ -11,12 +13,16 @@ from semantic_release.commit_parser import ParseError
 from semantic_release.commit_parser.token import ParsedCommit
 from semantic_release.commit_parser.util import force_str
 from semantic_release.enums import LevelBump
-from semantic_release.helpers import validate_types_in_sequence
+from semantic_release.helpers import (
+    CombinedPatternMatcher,
+    sort_numerically,
+    validate_types_in_sequence,
+)
 from semantic_release.version.algorithm import tags_and_versions
 
 if TYPE_CHECKING:  # pragma: no cover
     from re import Pattern
-    from typing import Iterable, Iterator
+    from typing import Callable, Iterable, Iterator
 
     from git.repo.base import Repo
     from git.util import Actor
@@ -34,7 +40,7 @@ log = logging.getLogger(__name__)
 
 class ReleaseHistory:
     @classmethod
-    def from_git_history(
+    def from_git_history(  # noqa: C901
         cls,
         repo: Repo,
         translator: VersionTranslator,
@@ -52,6 +58,10 @@ class ReleaseHistory:
             for tag, version in all_git_tags_and_versions
         }
 
+        # Performance optimization: evaluate all the exclusion patterns with a single
+        # regex run per commit rather than one run per pattern
+        exclusion_matcher = CombinedPatternMatcher(exclude_commit_patterns)
+
         ignore_merge_commits = bool(
             hasattr(commit_parser, "options")
             and hasattr(commit_parser.options, "ignore_merge_commits")
@@ -70,19 +80,27 @@ class ReleaseHistory:
 
         the_version: Version | None = None
 
+        # Performance optimization: the logging level cannot change while we walk
+        # the history, so check it once instead of building log arguments for every
+        # commit. Per-commit details are only logged at DEBUG level, otherwise they
+        # are summarized as counts per release once the history has been walked.
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
+        release_stats: dict[Version | None, Counter[str]] = defaultdict(Counter)
+
         for commit in repo.iter_commits("HEAD", topo_order=True):
             # Determine if we have found another release
-            log.debug("checking if commit %s matches any tags", commit.hexsha[:7])
             t_v = tag_sha_2_version_lookup.get(commit.hexsha, None)
 
             if t_v is None:
-                log.debug("no tags correspond to commit %s", commit.hexsha)
+                if debug_enabled:
+                    log.debug("no tags correspond to commit %s", commit.hexsha)
             else:
                 # Unpack the tuple (overriding the current version)
                 tag, the_version = t_v
                 # we have found the latest commit introduced by this tag
                 # so we create a new Release entry
-                log.debug("found commit %s for tag %s", commit.hexsha, tag.name)
+                if debug_enabled:
+                    log.debug("found commit %s for tag %s", commit.hexsha, tag.name)
 
                 # tag.object is a Commit if the tag is lightweight, otherwise
                 # it is a TagObject with additional metadata about the tag
@@ -110,11 +128,12 @@ class ReleaseHistory:
 
                 released.setdefault(the_version, release)
 
-            log.info(
-                "parsing commit [%s] %s",
-                commit.hexsha[:8],
-                str(commit.message).replace("\n", " ")[:54],
-            )
+            if debug_enabled:
+                log.debug(
+                    "parsing commit [%s] %s",
+                    commit.hexsha[:8],
+                    str(commit.message).replace("\n", " ")[:54],
+                )
             # returns a ParseResult or list of ParseResult objects,
             # it is usually one, but we split a commit if a squashed merge is detected
             parse_results = commit_parser.parse(commit)
@@ -144,6 +163,7 @@ class ReleaseHistory:
             ]
 
             is_squash_commit = bool(len(results) > 1)
+            stats = release_stats[the_version]
 
             # iterate through parsed commits to add to changelog definition
             for parsed_result in results:
@@ -153,11 +173,13 @@ class ReleaseHistory:
                     if isinstance(parsed_result, ParseError)
                     else parsed_result.type
                 )
-                log.debug("commit has type '%s'", commit_type)
+                if debug_enabled:
+                    log.debug("commit has type '%s'", commit_type)
 
-                has_exclusion_match = any(
-                    pattern.match(commit_message) for pattern in exclude_commit_patterns
-                )
+                if isinstance(parsed_result, ParseError):
+                    stats["unparsable"] += 1
+
+                exclusion_match = exclusion_matcher.match(commit_message)
 
                 commit_level_bump = (
                     LevelBump.NO_RELEASE
@@ -166,56 +188,81 @@ class ReleaseHistory:
                 )
 
                 if ignore_merge_commits and parsed_result.is_merge_commit():
-                    log.info("Excluding merge commit[%s]", parsed_result.short_hash)
+                    stats["merge commits excluded"] += 1
+                    if debug_enabled:
+                        log.debug(
+                            "Excluding merge commit[%s]", parsed_result.short_hash
+                        )
                     continue
 
                 # Skip excluded commits except for any commit causing a version bump
                 # Reasoning: if a commit causes a version bump, and no other commits
                 # are included, then the changelog will be empty. Even if ther was other
                 # commits included, the true reason for a version bump would be missing.
-                if has_exclusion_match and commit_level_bump == LevelBump.NO_RELEASE:
-                    log.info(
-                        "Excluding %s commit[%s] %s",
-                        "piece of squashed" if is_squash_commit else "",
-                        parsed_result.short_hash,
-                        commit_message.split("\n", maxsplit=1)[0][:20],
-                    )
+                if (
+                    exclusion_match is not None
+                    and commit_level_bump == LevelBump.NO_RELEASE
+                ):
+                    stats["excluded by pattern"] += 1
+                    if debug_enabled:
+                        log.debug(
+                            "Excluding %s commit[%s] %s (matched pattern %r)",
+                            "piece of squashed" if is_squash_commit else "",
+                            parsed_result.short_hash,
+                            commit_message.split("\n", maxsplit=1)[0][:20],
+                            exclusion_match.pattern,
+                        )
                     continue
 
                 if (
                     isinstance(parsed_result, ParsedCommit)
                     and not parsed_result.include_in_changelog
                 ):
-                    log.info(
-                        str.join(
-                            " ",
-                            [
-                                "Excluding commit[%s] because parser determined",
-                                "it should not included in the changelog",
-                            ],
-                        ),
-                        parsed_result.short_hash,
-                    )
+                    stats["excluded by parser"] += 1
+                    if debug_enabled:
+                        log.debug(
+                            str.join(
+                                " ",
+                                [
+                                    "Excluding commit[%s] because parser determined",
+                                    "it should not included in the changelog",
+                                ],
+                            ),
+                            parsed_result.short_hash,
+                        )
                     continue
 
+                stats["added"] += 1
+
                 if the_version is None:
-                    log.info(
-                        "[Unreleased] adding commit[%s] to unreleased '%s'",
+                    if debug_enabled:
+                        log.debug(
+                            "[Unreleased] adding commit[%s] to unreleased '%s'",
+                            parsed_result.short_hash,
+                            commit_type,
+                        )
+                    unreleased[commit_type].append(parsed_result)
+                    continue
+
+                if debug_enabled:
+                    log.debug(
+                        "[%s] adding commit[%s] to release '%s'",
+                        the_version,
                         parsed_result.short_hash,
                         commit_type,
                     )
-                    unreleased[commit_type].append(parsed_result)
-                    continue
 
+                released[the_version]["elements"][commit_type].append(parsed_result)
+
+        if log.isEnabledFor(logging.INFO):
+            for version, stats in release_stats.items():
                 log.info(
-                    "[%s] adding commit[%s] to release '%s'",
-                    the_version,
-                    parsed_result.short_hash,
-                    commit_type,
+                    "[%s] parsed %s commits: %s",
+                    version or "Unreleased",
+                    sum(stats.values()) - stats["unparsable"],
+                    str.join(", ", (f"{count} {key}" for key, count in stats.items())),
                 )
 
-                released[the_version]["elements"][commit_type].append(parsed_result)
-
         return cls(unreleased=unreleased, released=released)
 
     def __init__(
@@ -223,6 +270,7 @@ class ReleaseHistory:
     ) -> None:
         self.released = released
         self.unreleased = unreleased
+        self._views: dict[int, ReleaseViews] = {}
 
     def __iter__(
         self,
@@ -236,6 +284,38 @@ class ReleaseHistory:
         yield self.unreleased
         yield self.released
 
+    def views(self, elements: dict[str, list[ParseResult]]) -> ReleaseViews:
+        """
+        Get the derived views of a group of commits, i.e. the ``unreleased`` commits
+        or the ``elements`` of a release. The views are built once per group and then
+        shared by every template render of this history.
+        """
+        cached_views = self._views.get(id(elements))
+
+        # The views keep a reference to their commits, so the id cannot be reused by
+        # another object while it is cached
+        if cached_views is None or cached_views.elements is not elements:
+            cached_views = self._views[id(elements)] = ReleaseViews(elements)
+
+        return cached_views
+
+    @property
+    def unreleased_views(self) -> ReleaseViews:
+        return self.views(self.unreleased)
+
+    def release_views(self, version: Version) -> ReleaseViews:
+        return self.views(self.released[version]["elements"])
+
+    def latest_releases(self, count: int) -> ReleaseHistory:
+        """
+        Get the history of the unreleased commits and only the ``count`` latest
+        releases, the commits are shared with this history and not copied.
+        """
+        return ReleaseHistory(
+            unreleased=self.unreleased,
+            released=dict(islice(self.released.items(), count)),
+        )
+
     def release(
         self, version: Version, tagger: Actor, committer: Actor, tagged_date: datetime
     ) -> ReleaseHistory:
@@ -266,6 +346,113 @@ class ReleaseHistory:
         )
 
 
+class ReleaseViews:
+    """
+    Grouped & sorted views of a group of commits, which templates can use instead of
+    re-grouping and re-sorting the commits on every render. Each view is computed on
+    first access and then reused, so the commits must not be modified afterwards.
+
+    Commits are ordered like the default templates do: commits without a scope first,
+    then by scope, and then by the first line of the sorted text, ignoring case.
+    Parse errors are left out of every view but ``commits_by_type``.
+    """
+
+    def __init__(self, elements: dict[str, list[ParseResult]]) -> None:
+        self.elements = elements
+
+    @cached_property
+    def commits_by_type(self) -> list[tuple[str, list[ParseResult]]]:
+        """The commits grouped by type, sorted by type like jinja's ``dictsort`` filter"""
+        return sorted(self.elements.items(), key=lambda item: item[0].lower())
+
+    @cached_property
+    def parsed_commits(self) -> list[ParsedCommit]:
+        return [
+            commit
+            for _, commits in self.commits_by_type
+            for commit in commits
+            if not isinstance(commit, ParseError)
+        ]
+
+    @cached_property
+    def ordered_commits_by_type(self) -> dict[str, list[ParsedCommit]]:
+        """The commits of each type, ordered by scope & description"""
+        return {
+            commit_type: _order_by_scope(
+                (commit for commit in commits if not isinstance(commit, ParseError)),
+                lambda commit: commit.descriptions,
+            )
+            for commit_type, commits in self.commits_by_type
+        }
+
+    @cached_property
+    def commits_by_scope(self) -> dict[str, list[ParsedCommit]]:
+        """The commits grouped by scope (an empty string for none), sorted by scope"""
+        commits_by_scope: dict[str, list[ParsedCommit]] = defaultdict(list)
+        for commit in self.parsed_commits:
+            commits_by_scope[commit.scope].append(commit)
+
+        return {
+            scope: commits_by_scope[scope]
+            for scope in sorted(commits_by_scope, key=str.lower)
+        }
+
+    @cached_property
+    def breaking_commits(self) -> list[ParsedCommit]:
+        """The commits with a breaking change description, ordered by scope & description"""
+        return _order_by_scope(
+            (commit for commit in self.parsed_commits if commit.breaking_descriptions),
+            lambda commit: commit.breaking_descriptions,
+        )
+
+    @cached_property
+    def release_notice_commits(self) -> list[ParsedCommit]:
+        """The commits with a release notice, ordered by scope & notice"""
+        return _order_by_scope(
+            (commit for commit in self.parsed_commits if commit.release_notices),
+            lambda commit: commit.release_notices,
+        )
+
+    @cached_property
+    def linked_issues(self) -> list[str]:
+        """The unique issues linked by the commits, sorted numerically"""
+        return sort_numerically(
+            {issue for commit in self.parsed_commits for issue in commit.linked_issues}
+        )
+
+    @cached_property
+    def linked_merge_requests(self) -> list[str]:
+        """The unique merge requests linked by the commits, sorted numerically"""
+        return sort_numerically(
+            {
+                commit.linked_merge_request
+                for commit in self.parsed_commits
+                if commit.linked_merge_request
+            }
+        )
+
+
+def _order_by_scope(
+    commits: Iterable[ParsedCommit],
+    get_texts: Callable[[ParsedCommit], Iterable[str]],
+) -> list[ParsedCommit]:
+    def first_text(commit: ParsedCommit) -> str:
+        return next(iter(get_texts(commit)), "").lower()
+
+    unscoped_commits: list[ParsedCommit] = []
+    scoped_commits: list[ParsedCommit] = []
+    for commit in commits:
+        (scoped_commits if commit.scope else unscoped_commits).append(commit)
+
+    return [
+        *sorted(unscoped_commits, key=first_text),
+        *sorted(
+            scoped_commits,
+            key=lambda commit: (commit.scope.lower(), first_text(commit)),
+        ),
+    ]
+
+
 class Release(TypedDict):
     tagger: Actor
     committer: Actor
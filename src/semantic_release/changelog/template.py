@@ -3,18 +3,31 @@ from __future__ import annotations
 import logging
 import os
 import shutil
+from functools import partial
+from hashlib import sha256
 from pathlib import Path, PurePosixPath
 from typing import TYPE_CHECKING
 
-from jinja2 import FileSystemLoader
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    __version__ as jinja_version,
+)
+from jinja2.bccache import Bucket
 from jinja2.sandbox import SandboxedEnvironment
 
-from semantic_release.helpers import dynamic_import
+from semantic_release.helpers import (
+    atomic_open_text,
+    dynamic_import,
+    files_have_same_content,
+    run_ordered_in_pool,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Callable, Iterable, Literal
+    from typing import Callable, Iterable, Literal, TextIO
 
-    from jinja2 import Environment
+    from jinja2 import Template
 
 
 log = logging.getLogger(__name__)
@@ -37,7 +50,9 @@ def environment(
     keep_trailing_newline: bool = False,
     extensions: Iterable[str] = (),
     autoescape: bool | str = True,
-) -> SandboxedEnvironment:
+    bytecode_cache_dir: Path | str | None = None,
+    sandboxed: bool = True,
+) -> Environment:
     """
     Create a jinja2.sandbox.SandboxedEnvironment with certain parameter resrictions.
 
@@ -48,6 +63,12 @@ def environment(
     ``module:attr``, in this instance it will be dynamically imported.
     See https://jinja.palletsprojects.com/en/3.1.x/api/#jinja2.Environment for full
     parameter descriptions
+
+    When ``bytecode_cache_dir`` is provided, the compiled templates are persisted in
+    that directory with a `TemplateBytecodeCache` so they are not recompiled every run.
+
+    ``sandboxed`` must only be disabled for the templates bundled with this package,
+    which are trusted and render faster without the sandbox's per-access checks.
     """
     autoescape_value: bool | Callable[[str | None], bool]
     if isinstance(autoescape, str):
@@ -55,7 +76,13 @@ def environment(
     else:
         autoescape_value = autoescape
 
-    return ComplexDirectorySandboxedEnvironment(
+    env_class = (
+        ComplexDirectorySandboxedEnvironment
+        if sandboxed
+        else ComplexDirectoryEnvironment
+    )
+
+    return env_class(
         block_start_string=block_start_string,
         block_end_string=block_end_string,
         variable_start_string=variable_start_string,
@@ -68,18 +95,131 @@ def environment(
         lstrip_blocks=lstrip_blocks,
         newline_sequence=newline_sequence,
         keep_trailing_newline=keep_trailing_newline,
-        extensions=extensions,
+        extensions=tuple(extensions),
         autoescape=autoescape_value,
         loader=FileSystemLoader(template_dir, encoding="utf-8"),
+        bytecode_cache=(
+            TemplateBytecodeCache(bytecode_cache_dir)
+            if bytecode_cache_dir is not None
+            else None
+        ),
+    )
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """
+    Persistent cache of compiled templates, stored as files in a directory.
+
+    Jinja's default cache key is only the template name & filename, and it relies on
+    a separate cache directory per environment configuration. Here, the key also
+    covers the Jinja version, the environment settings that change the compiled code
+    and the template source hash. This makes one directory safe to share between the
+    user's template environment and the default template environments.
+
+    Failing to read or write the cache is never fatal, the template is compiled instead.
+
+    Since the key changes with every edit of a template, the entries of outdated
+    templates are never read again. Reading an entry marks it as recently used, and
+    only the `max_entries` most recently used entries are kept whenever a new one is
+    written.
+    """
+
+    DEFAULT_MAX_ENTRIES = 256
+
+    _COMPILE_SETTINGS = (
+        "block_start_string",
+        "block_end_string",
+        "variable_start_string",
+        "variable_end_string",
+        "comment_start_string",
+        "comment_end_string",
+        "line_statement_prefix",
+        "line_comment_prefix",
+        "trim_blocks",
+        "lstrip_blocks",
+        "newline_sequence",
+        "keep_trailing_newline",
+        "optimized",
     )
 
+    def __init__(
+        self, directory: Path | str, max_entries: int = DEFAULT_MAX_ENTRIES
+    ) -> None:
+        super().__init__(str(directory), pattern="psr-%s.cache")
+        self.max_entries = max_entries
 
-class ComplexDirectorySandboxedEnvironment(SandboxedEnvironment):
+    def get_bucket(
+        self,
+        environment: Environment,
+        name: str,
+        filename: str | None,
+        source: str,
+    ) -> Bucket:
+        checksum = self.get_source_checksum(source)
+        # The autoescape value is resolved at compile time and baked into the code
+        autoescape = (
+            environment.autoescape(name)
+            if callable(environment.autoescape)
+            else environment.autoescape
+        )
+        cache_key = str.join(
+            "\0",
+            [
+                jinja_version,
+                type(environment).__qualname__,
+                *(repr(getattr(environment, attr)) for attr in self._COMPILE_SETTINGS),
+                repr(autoescape),
+                *sorted(environment.extensions),
+                name,
+                filename or "",
+                checksum,
+            ],
+        )
+        bucket = Bucket(
+            environment, sha256(cache_key.encode("utf-8")).hexdigest(), checksum
+        )
+        self.load_bytecode(bucket)
+        return bucket
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        super().load_bytecode(bucket)
+        if bucket.code is None:
+            return
+
+        # Mark the entry as recently used, so it outlives the entries of old templates
+        try:
+            os.utime(self._get_cache_filename(bucket))
+        except OSError as err:
+            log.debug("Unable to touch template bytecode cache entry: %s", err)
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        try:
+            Path(self.directory).mkdir(parents=True, exist_ok=True)
+            super().dump_bytecode(bucket)
+            self.prune()
+        except OSError as err:
+            log.debug("Unable to write template bytecode cache: %s", err)
+
+    def prune(self) -> None:
+        """Remove the least recently used entries beyond `max_entries`"""
+        entries_by_mtime = sorted(
+            (
+                (entry.stat().st_mtime, entry)
+                for entry in Path(self.directory).glob(self.pattern % "*")
+            ),
+            reverse=True,
+        )
+        for _, stale_entry in entries_by_mtime[self.max_entries :]:
+            log.debug("Removing stale template bytecode cache entry %s", stale_entry)
+            stale_entry.unlink(missing_ok=True)
+
+
+class ComplexDirectoryEnvironment(Environment):
     def join_path(self, template: str, parent: str) -> str:
         """
         Add support for complex directory structures in the template directory.
 
-        This method overrides the default functionality of the SandboxedEnvironment
+        This method overrides the default functionality of the Environment
         where all 'include' keywords expect to be in the same directory as the calling
         template, however this is unintuitive when using a complex directory structure.
 
@@ -91,12 +231,40 @@ class ComplexDirectorySandboxedEnvironment(SandboxedEnvironment):
         return str(PurePosixPath(parent).parent / template)
 
 
+class ComplexDirectorySandboxedEnvironment(
+    ComplexDirectoryEnvironment, SandboxedEnvironment
+):
+    """The sandboxed variant of `ComplexDirectoryEnvironment` for untrusted templates"""
+
+
 def recursive_render(
     template_dir: Path,
     environment: Environment,
     _root_dir: str | os.PathLike[str] = ".",
+    max_workers: int | None = None,
 ) -> list[str]:
-    rendered_paths: list[str] = []
+    """
+    Render every template of the template directory to the same relative location in
+    the root directory and copy every other file as is, skipping hidden files & folders.
+
+    The directory is walked and every template is loaded (compiled) up front, then the
+    files are rendered & copied concurrently on a thread pool as they are independent
+    of each other. Once loaded, the environment and the globals it shares between the
+    renders are only read from, while jinja's template cache is thread-safe for the
+    templates loaded by includes.
+
+    Results are collected in walk order, so the returned paths and any raised error
+    (the one of the first failing file) do not depend on which thread finishes first.
+
+    Existing files whose content would not change are left untouched, so they are not
+    rewritten on disk nor reported as modified.
+
+    :param max_workers: The maximum number of threads used to render the files, the
+        default of `ThreadPoolExecutor` is used when not provided
+
+    :returns: The paths of the files which were written, in walk order
+    """
+    render_jobs: list[Callable[[], str | None]] = []
     for root, file in (
         (Path(root), file)
         for root, _, files in os.walk(template_dir)
@@ -117,23 +285,110 @@ def recursive_render(
             src_file_path = str((root / file).relative_to(template_dir))
             output_file_path = str((output_path / output_filename).resolve())
 
-            # Although, file stream rendering is possible and preferred in most
-            # situations, here it is not desired as you cannot read the previous
-            # contents of a file during the rendering of the template. This mechanism
-            # is used for inserting into a current changelog. When using stream rendering
-            # of the same file, it always came back empty
-            log.debug("rendering %s to %s", src_file_path, output_file_path)
-            rendered_file = environment.get_template(src_file_path).render().rstrip()
-            with open(output_file_path, "w", encoding="utf-8") as output_file:
-                output_file.write(f"{rendered_file}\n")
-
-            rendered_paths.append(output_file_path)
+            render_jobs.append(
+                partial(
+                    _render_template_file,
+                    environment.get_template(src_file_path),
+                    output_file_path,
+                )
+            )
         else:
-            src_file = str((root / file).resolve())
-            target_file = str((output_path / file).resolve())
-            log.debug(
-                "source file %s is not a template, copying to %s", src_file, target_file
+            render_jobs.append(
+                partial(
+                    _copy_file,
+                    str((root / file).resolve()),
+                    str((output_path / file).resolve()),
+                )
             )
-            shutil.copyfile(src_file, target_file)
-            rendered_paths.append(target_file)
-    return rendered_paths
+
+    written_paths = run_ordered_in_pool(
+        _run_render_job,
+        render_jobs,
+        max_workers=max_workers,
+        thread_name_prefix="psr-render",
+    )
+    return [path for path in written_paths if path is not None]
+
+
+def _run_render_job(render_job: Callable[[], str | None]) -> str | None:
+    return render_job()
+
+
+def _render_template_file(template: Template, output_file_path: str) -> str | None:
+    log.debug("rendering %s to %s", template.name, output_file_path)
+
+    if Path(output_file_path).exists():
+        # The previous content stays readable by the template while the
+        # new content is streamed, as the file is only replaced at the end
+        if not render_template_to_file(template, output_file_path, skip_unchanged=True):
+            return None
+    else:
+        # A template which reads the file it renders to, e.g. to insert into
+        # a changelog, would otherwise see the partially written content
+        rendered_file = template.render().rstrip()
+        with open(output_file_path, "w", encoding="utf-8") as output_file:
+            output_file.write(f"{rendered_file}\n")
+
+    return output_file_path
+
+
+def _copy_file(src_file: str, target_file: str) -> str | None:
+    if os.path.isfile(target_file) and files_have_same_content(src_file, target_file):
+        log.debug("%s is already a copy of %s, skipping", target_file, src_file)
+        return None
+
+    log.debug("source file %s is not a template, copying to %s", src_file, target_file)
+    shutil.copyfile(src_file, target_file)
+    return target_file
+
+
+def write_rendered_chunks(
+    chunks: Iterable[str],
+    output_file: TextIO,
+    remove_carriage_returns: bool = False,
+) -> None:
+    """
+    Write the chunks of a template render as they are generated, with the same result
+    as writing the right stripped concatenation of the chunks and a final newline.
+
+    Trailing whitespace is held back until the next non-whitespace text, so only the
+    whitespace at the very end of the output is dropped.
+    """
+    pending_whitespace = ""
+
+    for chunk in chunks:
+        text = chunk.replace("\r", "") if remove_carriage_returns else chunk
+        if not (stripped := text.rstrip()):
+            pending_whitespace += text
+            continue
+
+        output_file.write(f"{pending_whitespace}{stripped}")
+        pending_whitespace = text[len(stripped) :]
+
+    output_file.write("\n")
+
+
+def render_template_to_file(
+    template: Template,
+    output_file_path: Path | str,
+    remove_carriage_returns: bool = False,
+    skip_unchanged: bool = False,
+) -> bool:
+    """
+    Stream the render of a template into a file, so the rendered document is never
+    held in memory as a whole. The file is written atomically, see `AtomicTextFile`.
+
+    :returns: Whether the file was written, which is only False with ``skip_unchanged``
+        when the rendered content is identical to the existing file
+    """
+    atomic_file = atomic_open_text(
+        output_file_path, encoding="utf-8", skip_unchanged=skip_unchanged
+    )
+    with atomic_file as output_file:
+        write_rendered_chunks(
+            template.generate(),
+            output_file,
+            remove_carriage_returns=remove_carriage_returns,
+        )
+
+    return atomic_file.changed
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import os
 from contextlib import suppress
+from dataclasses import replace
+from itertools import chain
 from logging import getLogger
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -11,12 +13,18 @@ from importlib_resources import files
 
 import semantic_release
 from semantic_release.changelog.context import (
+    ChangelogMode,
     ReleaseNotesContext,
     autofit_text_width,
     create_pypi_url,
     make_changelog_context,
 )
-from semantic_release.changelog.template import environment, recursive_render
+from semantic_release.changelog.template import (
+    environment,
+    recursive_render,
+    render_template_to_file,
+    write_rendered_chunks,
+)
 from semantic_release.cli.config import ChangelogOutputFormat
 from semantic_release.cli.const import (
     DEFAULT_CHANGELOG_NAME_STEM,
@@ -25,10 +33,16 @@ from semantic_release.cli.const import (
 )
 from semantic_release.cli.util import noop_report
 from semantic_release.errors import InternalError
-from semantic_release.helpers import sort_numerically
+from semantic_release.helpers import (
+    atomic_open_text,
+    atomic_write_text,
+    sort_numerically,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
-    from jinja2 import Environment
+    from typing import Iterable, Iterator
+
+    from jinja2 import Environment, Template
 
     from semantic_release.changelog.context import ChangelogContext
     from semantic_release.changelog.release_history import Release, ReleaseHistory
@@ -38,6 +52,19 @@ if TYPE_CHECKING:  # pragma: no cover
 
 log = getLogger(__name__)
 
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Renders only the section which the default update template inserts after the
+# insertion flag, see ".components/changelog_update.*.j2"
+_NEW_CHANGES_TEMPLATE = str.join(
+    "",
+    [
+        "{{% set unreleased_commits = ctx.history.unreleased | dictsort %}}",
+        "{{% set releases = ctx.history.released.values() | list %}}",
+        '{{% include ".components/changelog_new_changes.{output_format}.j2" %}}',
+    ],
+)
+
 
 def get_default_tpl_dir(style: str, sub_dir: str | None = None) -> Path:
     module_base_path = Path(str(files(semantic_release.__name__)))
@@ -60,28 +87,59 @@ def get_default_tpl_dir(style: str, sub_dir: str | None = None) -> Path:
     )
 
 
-def render_default_changelog_file(
+def get_default_changelog_environment(
     output_format: ChangelogOutputFormat,
     changelog_context: ChangelogContext,
     changelog_style: str,
-) -> str:
+    template_cache_dir: Path | None = None,
+) -> Environment:
     tpl_dir = get_default_tpl_dir(style=changelog_style, sub_dir=output_format.value)
-    changelog_tpl_file = Path(DEFAULT_CHANGELOG_NAME_STEM).with_suffix(
-        str.join(".", ["", output_format.value, JINJA2_EXTENSION.lstrip(".")])
-    )
 
     # Create a new environment as we don't want user's configuration as it might
-    # not match our default template structure
-    template_env = changelog_context.bind_to_environment(
+    # not match our default template structure. Our own templates are trusted, so
+    # they skip the overhead of the sandbox
+    return changelog_context.bind_to_environment(
         environment(
             autoescape=False,
             newline_sequence="\n",
             template_dir=tpl_dir,
+            bytecode_cache_dir=template_cache_dir,
+            sandboxed=False,
         )
     )
 
+
+def get_default_changelog_template(
+    output_format: ChangelogOutputFormat,
+    changelog_context: ChangelogContext,
+    changelog_style: str,
+    template_cache_dir: Path | None = None,
+) -> Template:
+    changelog_tpl_file = Path(DEFAULT_CHANGELOG_NAME_STEM).with_suffix(
+        str.join(".", ["", output_format.value, JINJA2_EXTENSION.lstrip(".")])
+    )
+    template_env = get_default_changelog_environment(
+        output_format=output_format,
+        changelog_context=changelog_context,
+        changelog_style=changelog_style,
+        template_cache_dir=template_cache_dir,
+    )
+    return template_env.get_template(str(changelog_tpl_file))
+
+
+def render_default_changelog_file(
+    output_format: ChangelogOutputFormat,
+    changelog_context: ChangelogContext,
+    changelog_style: str,
+    template_cache_dir: Path | None = None,
+) -> str:
     # Using the proper enviroment with the changelog context, render the template
-    template = template_env.get_template(str(changelog_tpl_file))
+    template = get_default_changelog_template(
+        output_format=output_format,
+        changelog_context=changelog_context,
+        changelog_style=changelog_style,
+        template_cache_dir=template_cache_dir,
+    )
     changelog_content = template.render().rstrip()
 
     # Normalize line endings to ensure universal newlines because that is what is expected
@@ -94,6 +152,160 @@ def render_default_changelog_file(
     )
 
 
+def _iter_file_chunks(
+    filepath: Path, start: int = 0, stop: int | None = None
+) -> Iterator[str]:
+    """
+    Stream the text of a file between the `start` & `stop` character offsets in
+    bounded chunks. Line endings are read the same way as the `read_file` filter.
+    """
+    position = 0
+    with filepath.open(encoding="utf-8", newline=os.linesep) as rfd:
+        while (stop is None or position < stop) and (
+            chunk := rfd.read(_STREAM_CHUNK_SIZE)
+        ):
+            chunk_start, position = position, position + len(chunk)
+            if position <= start:
+                continue
+
+            yield chunk[
+                max(start - chunk_start, 0) : None
+                if stop is None
+                else stop - chunk_start
+            ]
+
+
+def _find_in_file(filepath: Path, text: str, start: int = 0) -> int:
+    """
+    Find the character offset of the first occurrence of `text` in a file at or
+    after `start`, without loading the whole file. Returns -1 when not found.
+    """
+    overlap = ""
+    window_end = start
+
+    for chunk in _iter_file_chunks(filepath, start=start):
+        window = overlap + chunk
+        window_end += len(chunk)
+
+        if (index := window.find(text)) >= 0:
+            return window_end - len(window) + index
+
+        # Keep enough of the end to find the text when it spans two chunks
+        overlap = window[max(len(window) - len(text) + 1, 0) :] if len(text) > 1 else ""
+
+    return -1
+
+
+def _strip_chunks(chunks: Iterable[str]) -> Iterator[str]:
+    """Stream text chunks as if `str.strip()` was applied to their concatenation"""
+    pending_whitespace = ""
+    leading = True
+
+    for chunk in chunks:
+        if leading and not (chunk := chunk.lstrip()):
+            continue
+
+        leading = False
+        if not (stripped := chunk.rstrip()):
+            pending_whitespace += chunk
+            continue
+
+        yield f"{pending_whitespace}{stripped}"
+        pending_whitespace = chunk[len(stripped) :]
+
+
+class _FileSection:
+    """
+    The text of a file after a character offset, which only supports the `in`
+    operator so templates can search it without the file being loaded into memory.
+    """
+
+    def __init__(self, filepath: Path, start: int) -> None:
+        self.filepath = filepath
+        self.start = start
+
+    def __contains__(self, text: str) -> bool:
+        return _find_in_file(self.filepath, text, start=self.start) >= 0
+
+
+def update_default_changelog_file(
+    changelog_file: Path,
+    output_format: ChangelogOutputFormat,
+    changelog_context: ChangelogContext,
+    changelog_style: str,
+    template_cache_dir: Path | None = None,
+) -> bool | None:
+    """
+    Insert the new changes at the insertion flag of the previous changelog, like the
+    default update template does, without rendering the whole document.
+
+    Only the new section is rendered, the previous changelog is streamed around it
+    into the updated file so memory stays bounded regardless of the changelog size.
+    The result is identical to `render_default_changelog_file()` in update mode.
+
+    The context still carries the full release history of the caller, only its
+    latest releases are rendered. The history walk is not bounded to the commits
+    since the last tag on purpose: whether this update applies is only known once
+    the previous changelog is inspected, and both the fallback to the full template
+    and the user templates need every release anyway.
+
+    :returns: Whether the changelog file was written, it is left untouched when the
+        updated changelog is identical. None when there is no previous changelog with
+        the insertion flag, in which case the full template must be rendered instead
+    """
+    prev_changelog_file = Path(changelog_context.prev_changelog_file)
+    insertion_flag = changelog_context.changelog_insertion_flag
+
+    if not insertion_flag or not prev_changelog_file.is_file():
+        return None
+
+    if (flag_start := _find_in_file(prev_changelog_file, insertion_flag)) < 0:
+        return None
+
+    flag_end = flag_start + len(insertion_flag)
+
+    # The new changes are at most the unreleased commits & the latest release, the
+    # release before it is only kept so that a first release is still detected
+    template_env = get_default_changelog_environment(
+        output_format=output_format,
+        changelog_context=replace(
+            changelog_context, history=changelog_context.history.latest_releases(2)
+        ),
+        changelog_style=changelog_style,
+        template_cache_dir=template_cache_dir,
+    )
+    new_changes = template_env.from_string(
+        _NEW_CHANGES_TEMPLATE.format(output_format=output_format.value)
+    ).render(prev_changelog_bottom=_FileSection(prev_changelog_file, flag_end))
+
+    header = _strip_chunks(_iter_file_chunks(prev_changelog_file, stop=flag_start))
+    footer = _strip_chunks(_iter_file_chunks(prev_changelog_file, start=flag_end))
+
+    first_header_chunk = next(header, None)
+    first_footer_chunk = next(footer, None)
+
+    atomic_file = atomic_open_text(
+        changelog_file, encoding="utf-8", skip_unchanged=True
+    )
+    with atomic_file as wfd:
+        # Normalize the output like the rendered changelog: no carriage returns
+        # and no trailing whitespace apart from a final newline
+        write_rendered_chunks(
+            chain(
+                [first_header_chunk] if first_header_chunk is not None else [],
+                header,
+                ["\n\n"] if first_header_chunk is not None else [],
+                [f"{insertion_flag.strip()}\n", new_changes],
+                ["\n", first_footer_chunk] if first_footer_chunk is not None else [],
+                footer,
+            ),
+            wfd,
+            remove_carriage_returns=True,
+        )
+
+    return atomic_file.changed
+
+
 def render_release_notes(
     release_notes_template_file: str,
     template_env: Environment,
@@ -114,6 +326,7 @@ def apply_user_changelog_template_directory(
     environment: Environment,
     destination_dir: Path,
     noop: bool = False,
+    max_workers: int | None = None,
 ) -> list[str]:
     if noop:
         noop_report(
@@ -130,7 +343,10 @@ def apply_user_changelog_template_directory(
         return []
 
     return recursive_render(
-        template_dir, environment=environment, _root_dir=destination_dir
+        template_dir,
+        environment=environment,
+        _root_dir=destination_dir,
+        max_workers=max_workers,
     )
 
 
@@ -141,7 +357,14 @@ def write_default_changelog(
     changelog_context: ChangelogContext,
     changelog_style: str,
     noop: bool = False,
-) -> str:
+    template_cache_dir: Path | None = None,
+) -> str | None:
+    """
+    Write the changelog with the default templates, the file is only written when its
+    content changes.
+
+    :returns: The path of the changelog file, or None when it was left unchanged
+    """
     if noop:
         noop_report(
             str.join(
@@ -154,15 +377,49 @@ def write_default_changelog(
         )
         return str(changelog_file)
 
+    if changelog_context.changelog_mode == ChangelogMode.UPDATE.value and (
+        (
+            changed := update_default_changelog_file(
+                changelog_file=changelog_file,
+                output_format=output_format,
+                changelog_context=changelog_context,
+                changelog_style=changelog_style,
+                template_cache_dir=template_cache_dir,
+            )
+        )
+        is not None
+    ):
+        return str(changelog_file) if changed else None
+
+    if changelog_context.changelog_mode == ChangelogMode.INIT.value:
+        # The default init templates never read the previous changelog, so the
+        # render is streamed into the file instead of being built up in memory
+        changed = render_template_to_file(
+            get_default_changelog_template(
+                output_format=output_format,
+                changelog_context=changelog_context,
+                changelog_style=changelog_style,
+                template_cache_dir=template_cache_dir,
+            ),
+            changelog_file,
+            remove_carriage_returns=True,
+            skip_unchanged=True,
+        )
+        return str(changelog_file) if changed else None
+
     changelog_text = render_default_changelog_file(
         output_format=output_format,
         changelog_context=changelog_context,
         changelog_style=changelog_style,
+        template_cache_dir=template_cache_dir,
+    )
+    # The file is written in text mode which will automatically normalize newlines to
+    # the OS, so we just use an universal newline here
+    changed = atomic_write_text(
+        changelog_file, f"{changelog_text}\n", encoding="utf-8", skip_unchanged=True
     )
-    # write_text() will automatically normalize newlines to the OS, so we just use an universal newline here
-    changelog_file.write_text(f"{changelog_text}\n", encoding="utf-8")
 
-    return str(changelog_file)
+    return str(changelog_file) if changed else None
 
 
 def write_changelog_files(
@@ -208,48 +465,69 @@ def write_changelog_files(
             ),
             destination_dir=project_dir,
             noop=noop,
+            max_workers=runtime_ctx.max_file_workers,
         )
 
     log.info("No contents found in %r, using default changelog template", template_dir)
-    return [
-        write_default_changelog(
-            changelog_file=runtime_ctx.changelog_file,
-            destination_dir=project_dir,
-            output_format=runtime_ctx.changelog_output_format,
-            changelog_context=changelog_context,
-            changelog_style=runtime_ctx.changelog_style,
-            noop=noop,
-        )
-    ]
+    changelog_path = write_default_changelog(
+        changelog_file=runtime_ctx.changelog_file,
+        destination_dir=project_dir,
+        output_format=runtime_ctx.changelog_output_format,
+        changelog_context=changelog_context,
+        changelog_style=runtime_ctx.changelog_style,
+        noop=noop,
+        template_cache_dir=runtime_ctx.template_cache_dir,
+    )
+    return [changelog_path] if changelog_path is not None else []
 
 
-def generate_release_notes(
-    hvcs_client: HvcsBase,
-    release: Release,
+def get_release_notes_environment(
     template_dir: Path,
-    history: ReleaseHistory,
     style: str,
-    mask_initial_release: bool,
-    license_name: str = "",
-) -> str:
+    template_cache_dir: Path | None = None,
+) -> Environment:
+    """
+    Create the environment which renders the release notes template, which is the
+    user's template when one exists in `template_dir` or the default one of `style`.
+
+    The environment can be shared by `generate_release_notes()` calls to render the
+    notes of many releases while only loading & compiling the template once.
+    """
     users_tpl_file = template_dir / DEFAULT_RELEASE_NOTES_TPL_FILE
+    use_users_tpl = users_tpl_file.is_file()
 
     # Determine if the user has a custom release notes template or we should use
     # the default template directory with our default release notes template
     tpl_dir = (
         template_dir
-        if users_tpl_file.is_file()
+        if use_users_tpl
         else get_default_tpl_dir(
             style=style, sub_dir=ChangelogOutputFormat.MARKDOWN.value
         )
     )
 
-    release_notes_tpl_file = (
-        users_tpl_file.name
-        if users_tpl_file.is_file()
-        else DEFAULT_RELEASE_NOTES_TPL_FILE
+    # Use a new, non-configurable environment for release notes -
+    # not user-configurable at the moment
+    return environment(
+        autoescape=False,
+        template_dir=tpl_dir,
+        bytecode_cache_dir=template_cache_dir,
+        # Only the user's release notes template is untrusted
+        sandboxed=use_users_tpl,
     )
 
+
+def generate_release_notes(
+    hvcs_client: HvcsBase,
+    release: Release,
+    template_dir: Path,
+    history: ReleaseHistory,
+    style: str,
+    mask_initial_release: bool,
+    license_name: str = "",
+    template_cache_dir: Path | None = None,
+    template_env: Environment | None = None,
+) -> str:
     release_notes_env = ReleaseNotesContext(
         repo_name=hvcs_client.repo_name,
         repo_owner=hvcs_client.owner,
@@ -265,9 +543,12 @@ def generate_release_notes(
             sort_numerically,
         ),
     ).bind_to_environment(
-        # Use a new, non-configurable environment for release notes -
-        # not user-configurable at the moment
-        environment(autoescape=False, template_dir=tpl_dir)
+        template_env
+        or get_release_notes_environment(
+            template_dir=template_dir,
+            style=style,
+            template_cache_dir=template_cache_dir,
+        )
     )
 
     # TODO: Remove in v10
@@ -277,6 +558,7 @@ def generate_release_notes(
     }
 
     return render_release_notes(
-        release_notes_template_file=release_notes_tpl_file,
+        # NOTE: the user's template has the same name as the default template
+        release_notes_template_file=DEFAULT_RELEASE_NOTES_TPL_FILE,
         template_env=release_notes_env,
     )
@@ -1,64 +1,134 @@
 from __future__ import annotations
 
 import logging
-from contextlib import suppress
+from contextlib import closing
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import click
 import tomlkit
-from git import GitCommandError, Repo
+from git import Repo
+from git.exc import BadName
 
 from semantic_release.changelog.release_history import ReleaseHistory
 from semantic_release.cli.changelog_writer import (
     generate_release_notes,
+    get_release_notes_environment,
     write_changelog_files,
 )
 from semantic_release.cli.util import noop_report
-from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
+from semantic_release.helpers import tomllib
+from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase, RemoteReleaseJob
+from semantic_release.hvcs.util import get_request_scheduler
 
 if TYPE_CHECKING:  # pragma: no cover
+    from typing import Sequence
+
+    from semantic_release.changelog.release_history import Release
     from semantic_release.cli.cli_context import CliContextObj
+    from semantic_release.cli.config import RuntimeContext
+    from semantic_release.version.translator import VersionTranslator
+    from semantic_release.version.version import Version
 
 
 log = logging.getLogger(__name__)
 
 
-def get_license_name_for_release(tag_name: str, project_root: Path) -> str:
-    # Retrieve the license name at the time of the specific release tag
-    project_metadata: dict[str, str] = {}
-    curr_dir = Path.cwd().resolve()
-    allowed_directories = [
-        dir_path
-        for dir_path in [curr_dir, *curr_dir.parents]
-        if str(project_root) in str(dir_path)
-    ]
-    for allowed_dir in allowed_directories:
-        proj_toml = allowed_dir.joinpath("pyproject.toml")
-        with Repo(project_root) as git_repo, suppress(GitCommandError):
-            toml_contents = git_repo.git.show(
-                f"{tag_name}:{proj_toml.relative_to(project_root)}"
-            )
-            config_toml = tomlkit.parse(toml_contents)
-            project_metadata = config_toml.unwrap().get("project", project_metadata)
-            break
-
-    license_cfg = project_metadata.get(
-        "license-expression",
-        project_metadata.get(
-            "license",
-            "",
-        ),
-    )
+class ProjectMetadataReader:
+    """
+    Read the ``[project]`` metadata of the ``pyproject.toml`` at the time of release
+    tags, sharing a single repository (and its persistent ``git cat-file --batch``
+    process) between the lookups.
 
-    if not isinstance(license_cfg, (str, dict)) or license_cfg is None:
-        return ""
+    The metadata is cached by the SHA of the ``pyproject.toml`` blob, so when many
+    tags share the same file content, it is only read & parsed once.
+    """
+
+    def __init__(self, project_root: Path) -> None:
+        self.project_root = project_root
+        self._repo: Repo | None = None
+        self._metadata_by_blob_sha: dict[str, dict[str, Any]] = {}
+
+        # The candidate files from the current directory up to the project root
+        curr_dir = Path.cwd().resolve()
+        self._pyproject_paths = [
+            dir_path.joinpath("pyproject.toml").relative_to(project_root).as_posix()
+            for dir_path in [curr_dir, *curr_dir.parents]
+            if str(project_root) in str(dir_path)
+        ]
+
+    @property
+    def repo(self) -> Repo:
+        if self._repo is None:
+            self._repo = Repo(self.project_root)
+        return self._repo
+
+    def close(self) -> None:
+        if self._repo is not None:
+            self._repo.close()
+            self._repo = None
+
+    def get_project_metadata(self, tag_name: str) -> dict[str, Any]:
+        try:
+            tree = self.repo.commit(tag_name).tree
+        except (BadName, ValueError):
+            return {}
+
+        for pyproject_path in self._pyproject_paths:
+            try:
+                blob = tree / pyproject_path
+            except KeyError:
+                continue
+
+            if blob.hexsha not in self._metadata_by_blob_sha:
+                toml_contents = blob.data_stream.read().decode("utf-8")
+                config_toml = (
+                    tomllib.loads(toml_contents)
+                    if tomllib is not None
+                    else tomlkit.parse(toml_contents).unwrap()
+                )
+                self._metadata_by_blob_sha[blob.hexsha] = config_toml.get("project", {})
+
+            return self._metadata_by_blob_sha[blob.hexsha]
+
+        return {}
+
+    def get_license_name(self, tag_name: str) -> str:
+        project_metadata = self.get_project_metadata(tag_name)
+        license_cfg = project_metadata.get(
+            "license-expression",
+            project_metadata.get(
+                "license",
+                "",
+            ),
+        )
+
+        if not isinstance(license_cfg, (str, dict)) or license_cfg is None:
+            return ""
+
+        return (
+            license_cfg.get("text", "")  # type: ignore[attr-defined]
+            if isinstance(license_cfg, dict)
+            else license_cfg or ""
+        )
 
-    return (
-        license_cfg.get("text", "")  # type: ignore[attr-defined]
-        if isinstance(license_cfg, dict)
-        else license_cfg or ""
-    )
+
+def get_license_name_for_release(
+    tag_name: str,
+    project_root: Path,
+    metadata_reader: ProjectMetadataReader | None = None,
+) -> str:
+    """
+    Retrieve the license name at the time of the specific release tag
+
+    :param metadata_reader: A reader shared between the lookups of many tags, so the
+        repository is opened once and the unchanged metadata is only parsed once
+    """
+    if metadata_reader is not None:
+        return metadata_reader.get_license_name(tag_name)
+
+    with closing(ProjectMetadataReader(project_root)) as reader:
+        return reader.get_license_name(tag_name)
 
 
 def post_release_notes(
@@ -89,6 +159,153 @@ def post_release_notes(
     )
 
 
+def resolve_release_tag_range(
+    tag_range: str,
+    translator: VersionTranslator,
+    release_history: ReleaseHistory,
+) -> list[tuple[str, Release]]:
+    """
+    Select the releases of the history whose tags are within an inclusive
+    ``START..END`` range, where either bound can be omitted to leave it open.
+
+    :raises ValueError: When the range or one of its tags is malformed
+
+    :returns: The tag & release pairs, from the oldest to the newest release
+    """
+    if ".." not in tag_range:
+        raise ValueError(f"Tag range {tag_range!r} is not in the form START..END")
+
+    bounds: list[Version | None] = []
+    for tag in tag_range.split("..", maxsplit=1):
+        if not tag:
+            bounds.append(None)
+            continue
+
+        if not (version := translator.from_tag(tag)):
+            raise ValueError(
+                str.join(
+                    " ",
+                    [
+                        f"Tag {tag!r} does not match the tag format",
+                        repr(translator.tag_format),
+                    ],
+                )
+            )
+        bounds.append(version)
+
+    start, end = bounds
+    return [
+        (translator.str_to_tag(str(version)), release_history.released[version])
+        for version in sorted(release_history.released)
+        if (start is None or version >= start) and (end is None or version <= end)
+    ]
+
+
+def post_release_notes_concurrently(
+    release_notes: Sequence[tuple[str, str, bool]],
+    hvcs_client: RemoteHvcsBase,
+    noop: bool = False,
+    max_concurrent_jobs: int = RemoteHvcsBase.DEFAULT_MAX_RELEASE_JOBS,
+) -> list[str]:
+    """
+    Post the release notes of many releases as release jobs of the client, which
+    posts at most `max_concurrent_jobs` releases at the same time.
+
+    The requests of the jobs are paced by the request scheduler of the client's
+    session, which holds them off while the remote's rate limit is reached.
+
+    :param release_notes: The (tag, release notes, prerelease) of each release
+    :param max_concurrent_jobs: The maximum number of releases posted at the same time
+
+    :returns: The tags whose release notes could not be posted, in the given order
+    """
+    if noop:
+        for release_tag, notes, prerelease in release_notes:
+            post_release_notes(release_tag, notes, prerelease, hvcs_client, noop=noop)
+        return []
+
+    results = hvcs_client.publish_releases(
+        [
+            RemoteReleaseJob(release_tag, notes, prerelease, update_existing=True)
+            for release_tag, notes, prerelease in release_notes
+        ],
+        max_concurrent_jobs=max_concurrent_jobs,
+    )
+
+    failed_tags = []
+    for result in results:
+        if result.error is not None:
+            log.error(
+                "failed to post release notes of %s: %s", result.tag, result.error
+            )
+            failed_tags.append(result.tag)
+
+    return failed_tags
+
+
+def post_release_notes_for_tag_range(
+    ctx: click.Context,
+    runtime: RuntimeContext,
+    hvcs_client: RemoteHvcsBase,
+    release_history: ReleaseHistory,
+    tag_range: str,
+) -> None:
+    """
+    Render the release notes of every release within the tag range from the same
+    history & template environment, then post them concurrently.
+    """
+    try:
+        releases = resolve_release_tag_range(
+            tag_range, runtime.version_translator, release_history
+        )
+    except ValueError as err:
+        click.echo(str(err), err=True)
+        ctx.exit(1)
+
+    if not releases:
+        click.echo(f"no tags of {tag_range} in release history", err=True)
+        ctx.exit(2)
+
+    release_notes_env = get_release_notes_environment(
+        template_dir=runtime.template_dir,
+        style=runtime.changelog_style,
+        template_cache_dir=runtime.template_cache_dir,
+    )
+    with closing(ProjectMetadataReader(runtime.repo_dir)) as metadata_reader:
+        all_release_notes = [
+            (
+                tag,
+                generate_release_notes(
+                    hvcs_client,
+                    release,
+                    runtime.template_dir,
+                    release_history,
+                    style=runtime.changelog_style,
+                    mask_initial_release=runtime.changelog_mask_initial_release,
+                    license_name=get_license_name_for_release(
+                        tag_name=tag,
+                        project_root=runtime.repo_dir,
+                        metadata_reader=metadata_reader,
+                    ),
+                    template_env=release_notes_env,
+                ),
+                release["version"].is_prerelease,
+            )
+            for tag, release in releases
+        ]
+
+    if failed_tags := post_release_notes_concurrently(
+        all_release_notes,
+        hvcs_client=hvcs_client,
+        noop=runtime.global_cli_options.noop,
+    ):
+        click.echo(
+            f"Failed to post release notes to remote for {str.join(', ', failed_tags)}",
+            err=True,
+        )
+        ctx.exit(1)
+
+
 @click.command(
     short_help="Generate a changelog",
     context_settings={
@@ -101,10 +318,29 @@ def post_release_notes(
     default=None,
     help="Post the generated release notes to the remote VCS's release for this tag",
 )
+@click.option(
+    "--post-to-release-range",
+    "release_tag_range",
+    default=None,
+    metavar="[START]..[END]",
+    help=(
+        "Post the generated release notes to the remote VCS's releases of every tag"
+        " within this inclusive range"
+    ),
+)
 @click.pass_obj
-def changelog(cli_ctx: CliContextObj, release_tag: str | None) -> None:
+def changelog(
+    cli_ctx: CliContextObj, release_tag: str | None, release_tag_range: str | None
+) -> None:
     """Generate and optionally publish a changelog for your project"""
     ctx = click.get_current_context()
+    ctx.call_on_close(get_request_scheduler().log_stats)
+
+    if release_tag and release_tag_range:
+        raise click.UsageError(
+            "--post-to-release-tag and --post-to-release-range are mutually exclusive"
+        )
+
     runtime = cli_ctx.runtime_ctx
     translator = runtime.version_translator
     hvcs_client = runtime.hvcs_client
@@ -124,7 +360,7 @@ def changelog(cli_ctx: CliContextObj, release_tag: str | None) -> None:
         noop=runtime.global_cli_options.noop,
     )
 
-    if not release_tag:
+    if not release_tag and not release_tag_range:
         return
 
     if not isinstance(hvcs_client, RemoteHvcsBase):
@@ -134,6 +370,19 @@ def changelog(cli_ctx: CliContextObj, release_tag: str | None) -> None:
         )
         return
 
+    if release_tag_range:
+        post_release_notes_for_tag_range(
+            ctx,
+            runtime,
+            hvcs_client=hvcs_client,
+            release_history=release_history,
+            tag_range=release_tag_range,
+        )
+        return
+
+    if not release_tag:
+        return
+
     if not (version := translator.from_tag(release_tag)):
         click.echo(
             str.join(
@@ -164,6 +413,7 @@ def changelog(cli_ctx: CliContextObj, release_tag: str | None) -> None:
             tag_name=release_tag,
             project_root=runtime.repo_dir,
         ),
+        template_cache_dir=runtime.template_cache_dir,
     )
 
     try:
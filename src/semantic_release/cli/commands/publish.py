@@ -8,6 +8,7 @@ from git import Repo
 
 from semantic_release.cli.util import noop_report
 from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
+from semantic_release.hvcs.util import get_request_scheduler
 from semantic_release.version.algorithm import tags_and_versions
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -57,6 +58,7 @@ def publish_distributions(
 def publish(cli_ctx: CliContextObj, tag: str) -> None:
     """Build and publish a distribution to a VCS release."""
     ctx = click.get_current_context()
+    ctx.call_on_close(get_request_scheduler().log_stats)
     runtime = cli_ctx.runtime_ctx
     hvcs_client = runtime.hvcs_client
     translator = runtime.version_translator
@@ -27,14 +27,22 @@ from semantic_release.errors import (
     BuildDistributionsError,
     GitCommitEmptyIndexError,
     InternalError,
+    InvalidVersion,
     UnexpectedResponse,
 )
 from semantic_release.gitproject import GitProject
 from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
+from semantic_release.hvcs.util import get_request_scheduler
 from semantic_release.version.algorithm import (
     next_version,
     tags_and_versions,
 )
+from semantic_release.version.declarations.pattern import PatternVersionDeclaration
+from semantic_release.version.declarations.stamping import (
+    read_versions_in_files,
+    stamp_version_in_files,
+)
+from semantic_release.version.declarations.toml import TomlVersionDeclaration
 from semantic_release.version.translator import VersionTranslator
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -138,6 +146,7 @@ def apply_version_to_source_files(
     version_declarations: Sequence[IVersionReplacer],
     version: Version,
     noop: bool = False,
+    max_workers: int | None = None,
 ) -> list[str]:
     if len(version_declarations) < 1:
         return []
@@ -145,20 +154,12 @@ def apply_version_to_source_files(
     if not noop:
         log.debug("Updating version %s in repository files...", version)
 
-    paths = list(
-        map(
-            lambda decl, new_version=version, noop=noop: (  # type: ignore[misc]
-                decl.update_file_w_version(new_version=new_version, noop=noop)
-            ),
-            version_declarations,
-        )
+    # Declarations are grouped per file so each file is read & written only once
+    paths = stamp_version_in_files(
+        version_declarations, new_version=version, noop=noop, max_workers=max_workers
     )
 
-    repo_filepaths = [
-        str(updated_file.relative_to(repo_dir))
-        for updated_file in paths
-        if updated_file is not None
-    ]
+    repo_filepaths = [str(updated_file.relative_to(repo_dir)) for updated_file in paths]
 
     if noop:
         noop_report(
@@ -174,6 +175,49 @@ def apply_version_to_source_files(
     return repo_filepaths
 
 
+def verify_version_declarations(
+    repo_dir: Path,
+    version_declarations: Sequence[IVersionReplacer],
+    expected_version: Version,
+    max_workers: int | None = None,
+) -> list[str]:
+    """
+    Check that every version declaration currently holds `expected_version`.
+
+    :returns: A description of each declaration that does not match, in the order
+        the files were first declared. Empty when all of the declarations match.
+    """
+    mismatches: list[str] = []
+
+    for declaration, versions in read_versions_in_files(
+        version_declarations, max_workers=max_workers
+    ):
+        if (
+            not isinstance(versions, InvalidVersion)
+            and versions
+            and all(version == expected_version for version in versions)
+        ):
+            continue
+
+        location = (
+            os.path.relpath(declaration.path, repo_dir)
+            if isinstance(
+                declaration, (PatternVersionDeclaration, TomlVersionDeclaration)
+            )
+            else repr(declaration)
+        )
+        found = (
+            f"an invalid version ({versions})"
+            if isinstance(versions, InvalidVersion)
+            else str.join(", ", sorted(str(version) for version in versions))
+        )
+        mismatches.append(
+            f"{location}: found {found or 'no version'}, expected {expected_version}"
+        )
+
+    return mismatches
+
+
 def shell(
     cmd: str, *, env: Mapping[str, str] | None = None, check: bool = True
 ) -> subprocess.CompletedProcess:
@@ -326,6 +370,12 @@ def build_distributions(
     is_flag=True,
     help="Print the last released version tag and exit",
 )
+@click.option(
+    "--verify",
+    "verify_only",
+    is_flag=True,
+    help="Verify all version declarations match the last released version and exit",
+)
 @click.option(
     "--as-prerelease",
     "as_prerelease",
@@ -412,6 +462,7 @@ def version(  # noqa: C901
     print_only_tag: bool,
     print_last_released: bool,
     print_last_released_tag: bool,
+    verify_only: bool,
     as_prerelease: bool,
     prerelease_token: str | None,
     commit_changes: bool,
@@ -443,6 +494,7 @@ def version(  # noqa: C901
     * Create a release (if supported) in the remote VCS for this tag
     """
     ctx = click.get_current_context()
+    ctx.call_on_close(get_request_scheduler().log_stats)
 
     # Enable any cli overrides of configuration before asking for the runtime context
     config = cli_ctx.raw_config
@@ -459,6 +511,51 @@ def version(  # noqa: C901
         click.echo(last_release[0] if print_last_released_tag else last_release[1])
         return
 
+    # Verification only compares the files against the last release, so it does not
+    # need to evaluate the commit history
+    if verify_only:
+        if not (
+            last_release := last_released(config.repo_dir, tag_format=config.tag_format)
+        ):
+            click.echo("No release tags found to verify against.", err=True)
+            ctx.exit(1)
+
+        last_tag, last_version = last_release
+        version_declarations = cli_ctx.runtime_ctx.version_declarations
+
+        if not version_declarations:
+            log.warning("No version declarations are configured, nothing to verify.")
+            return
+
+        try:
+            mismatches = verify_version_declarations(
+                repo_dir=config.repo_dir,
+                version_declarations=version_declarations,
+                expected_version=last_version,
+                max_workers=cli_ctx.runtime_ctx.max_file_workers,
+            )
+        except FileNotFoundError as err:
+            click.echo(str(err), err=True)
+            ctx.exit(1)
+
+        if mismatches:
+            click.echo(
+                str.join(
+                    "\n",
+                    [
+                        f"Version declarations do not match the last release {last_tag}:",
+                        *[f"    {mismatch}" for mismatch in mismatches],
+                    ],
+                ),
+                err=True,
+            )
+            ctx.exit(1)
+
+        rprint(
+            f"[bold green]All version declarations match the last release {last_tag}"
+        )
+        return
+
     # TODO: figure out --print of next version with & without branch validation
     # do you always need a prerelease token if its not --as-prerelease?
     runtime = cli_ctx.runtime_ctx
@@ -619,6 +716,7 @@ def version(  # noqa: C901
         version_declarations=runtime.version_declarations,
         version=new_version,
         noop=opts.noop,
+        max_workers=runtime.max_file_workers,
     )
     all_paths_to_add.extend(files_with_new_version_written)
     all_paths_to_add.extend(assets or [])
@@ -739,6 +837,7 @@ def version(  # noqa: C901
         style=runtime.changelog_style,
         mask_initial_release=runtime.changelog_mask_initial_release,
         license_name=license_name,
+        template_cache_dir=runtime.template_cache_dir,
     )
 
     exception: Exception | None = None
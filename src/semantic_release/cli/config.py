@@ -5,7 +5,7 @@ import os
 from collections.abc import Mapping
 from dataclasses import dataclass, is_dataclass
 from enum import Enum
-from functools import reduce
+from functools import cached_property, partial, reduce
 from pathlib import Path
 from re import (
     Pattern,
@@ -13,7 +13,19 @@ from re import (
     error as RegExpError,  # noqa: N812
     escape as regex_escape,
 )
-from typing import Any, ClassVar, Dict, List, Literal, Optional, Tuple, Type, Union
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 # typing_extensions is for Python 3.8, 3.9, 3.10 compatibility
 import tomlkit
@@ -69,6 +81,7 @@ class HvcsClient(str, Enum):
     GITHUB = "github"
     GITLAB = "gitlab"
     GITEA = "gitea"
+    LOCAL = "local"
 
 
 _known_commit_parsers: Dict[str, type[CommitParser]] = {
@@ -85,6 +98,7 @@ _known_hvcs: Dict[HvcsClient, Type[hvcs.HvcsBase]] = {
     HvcsClient.GITHUB: hvcs.Github,
     HvcsClient.GITLAB: hvcs.Gitlab,
     HvcsClient.GITEA: hvcs.Gitea,
+    HvcsClient.LOCAL: hvcs.Local,
 }
 
 
@@ -161,6 +175,8 @@ class ChangelogConfig(BaseModel):
     mode: ChangelogMode = ChangelogMode.INIT
     insertion_flag: str = ""
     template_dir: str = "templates"
+    template_cache_dir: str = ""
+    """Where compiled templates are cached, defaults to inside the git directory"""
 
     @field_validator("exclude_commit_patterns", mode="after")
     @classmethod
@@ -262,6 +278,7 @@ class RemoteConfig(BaseModel):
     api_domain: Optional[str] = None
     ignore_token_for_push: bool = False
     insecure: bool = False
+    max_upload_workers: Annotated[int, Field(ge=1)] = 4
 
     @field_validator("url", "domain", "api_domain", "token", mode="before")
     @classmethod
@@ -360,6 +377,7 @@ class RawConfig(BaseModel):
     commit_parser_options: Dict[str, Any] = {}
     logging_use_named_masks: bool = False
     major_on_zero: bool = True
+    max_file_workers: Optional[Annotated[int, Field(ge=1)]] = None
     allow_zero_version: bool = True
     repo_dir: Annotated[Path, Field(validate_default=True)] = Path(".")
     remote: RemoteConfig = RemoteConfig()
@@ -547,13 +565,14 @@ class RuntimeContext:
     version_translator: VersionTranslator
     major_on_zero: bool
     allow_zero_version: bool
+    max_file_workers: Optional[int]
     prerelease: bool
     no_git_verify: bool
     assets: List[str]
     commit_author: Actor
     commit_message: str
     changelog_excluded_commit_patterns: Tuple[Pattern[str], ...]
-    version_declarations: Tuple[IVersionReplacer, ...]
+    version_declaration_sources: Tuple[Callable[[], Sequence[IVersionReplacer]], ...]
     hvcs_client: hvcs.HvcsBase
     changelog_insertion_flag: str
     changelog_mask_initial_release: bool
@@ -564,6 +583,7 @@ class RuntimeContext:
     ignore_token_for_push: bool
     template_environment: Environment
     template_dir: Path
+    template_cache_dir: Path
     build_command: Optional[str]
     build_command_env: dict[str, str]
     dist_glob_patterns: Tuple[str, ...]
@@ -573,6 +593,18 @@ class RuntimeContext:
     # can accept the filter as an argument and call
     masker: MaskingFilter
 
+    @cached_property
+    def version_declarations(self) -> Tuple[IVersionReplacer, ...]:
+        """
+        The configured version declarations, whose glob patterns are expanded on first
+        use so that commands which do not stamp or verify versions skip the search
+        """
+        return tuple(
+            declaration
+            for expand_declarations in self.version_declaration_sources
+            for declaration in expand_declarations()
+        )
+
     @staticmethod
     def resolve_from_env(param: Optional[MaybeFromEnv]) -> Optional[str]:
         if isinstance(param, EnvConfigVar):
@@ -643,6 +675,7 @@ class RuntimeContext:
                     "get-url", raw.remote.name
                 )
                 active_branch = git_repo.active_branch.name
+                git_common_dir = Path(git_repo.common_dir).resolve()
             except ValueError as err:
                 raise MissingGitRemote(
                     f"Unable to locate remote named '{raw.remote.name}'."
@@ -736,13 +769,21 @@ class RuntimeContext:
 
         commit_author = Actor(*_commit_author_valid.groups())
 
-        version_declarations: list[IVersionReplacer] = []
+        # The glob patterns of the definitions are only expanded (and the matching
+        # files searched) when the version declarations are first used
+        version_declaration_sources: list[Callable[[], Sequence[IVersionReplacer]]] = []
 
         try:
-            version_declarations.extend(
+            for definition in iter(raw.version_toml or ()):
+                # validate the definition up front
                 TomlVersionDeclaration.from_string_definition(definition)
-                for definition in iter(raw.version_toml or ())
-            )
+                version_declaration_sources.append(
+                    partial(
+                        TomlVersionDeclaration.from_glob_definition,
+                        definition,
+                        root_dir=raw.repo_dir,
+                    )
+                )
         except ValueError as err:
             raise InvalidConfiguration(
                 str.join(
@@ -755,12 +796,19 @@ class RuntimeContext:
             ) from err
 
         try:
-            version_declarations.extend(
+            for definition in iter(raw.version_variables or ()):
+                # validate the definition up front
                 PatternVersionDeclaration.from_string_definition(
                     definition, raw.tag_format
                 )
-                for definition in iter(raw.version_variables or ())
-            )
+                version_declaration_sources.append(
+                    partial(
+                        PatternVersionDeclaration.from_glob_definition,
+                        definition,
+                        raw.tag_format,
+                        root_dir=raw.repo_dir,
+                    )
+                )
         except ValueError as err:
             raise InvalidConfiguration(
                 str.join(
@@ -787,6 +835,7 @@ class RuntimeContext:
             hvcs_api_domain=raw.remote.api_domain,
             token=raw.remote.token,
             allow_insecure=raw.remote.insecure,
+            max_upload_workers=raw.remote.max_upload_workers,
         )
 
         # changelog_file
@@ -819,8 +868,26 @@ class RuntimeContext:
                 "Template directory must be inside of the repository directory."
             )
 
+        # Kept inside the git directory so the cache never shows up as untracked files
+        # in the working tree, a relative path is from the repo root
+        template_cache_dir = (
+            raw.repo_dir.joinpath(Path(raw.changelog.template_cache_dir).expanduser())
+            .resolve()
+            .absolute()
+            if raw.changelog.template_cache_dir
+            else git_common_dir.joinpath("semantic-release", "template-cache")
+        )
+
+        # The cached bytecode is executed as is, bypassing the template sandbox, so
+        # only a directory which is as trusted as the git hooks may hold it
+        if git_common_dir not in (template_cache_dir, *template_cache_dir.parents):
+            raise InvalidConfiguration(
+                "Template cache directory must be inside of the repository's git directory."
+            )
+
         template_environment = environment(
             template_dir=template_dir,
+            bytecode_cache_dir=template_cache_dir,
             **raw.changelog.environment.model_dump(),
         )
 
@@ -873,9 +940,10 @@ class RuntimeContext:
             version_translator=version_translator,
             major_on_zero=raw.major_on_zero,
             allow_zero_version=raw.allow_zero_version,
+            max_file_workers=raw.max_file_workers,
             build_command=raw.build_command,
             build_command_env=build_cmd_env,
-            version_declarations=tuple(version_declarations),
+            version_declaration_sources=tuple(version_declaration_sources),
             hvcs_client=hvcs_client,
             changelog_file=changelog_file,
             changelog_mode=raw.changelog.mode,
@@ -894,6 +962,7 @@ class RuntimeContext:
             ignore_token_for_push=raw.remote.ignore_token_for_push,
             template_dir=template_dir,
             template_environment=template_environment,
+            template_cache_dir=template_cache_dir,
             dist_glob_patterns=raw.publish.dist_glob_patterns,
             upload_to_vcs_release=raw.publish.upload_to_vcs_release,
             global_cli_options=global_cli_options,
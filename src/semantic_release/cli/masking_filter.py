@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import re
 from collections import defaultdict
-from typing import Iterable
+from typing import Any, Iterable
 
 log = logging.getLogger(__name__)
 
@@ -13,6 +13,7 @@ log = logging.getLogger(__name__)
 class MaskingFilter(logging.Filter):
     REPLACE_STR = "*" * 4
     _UNWANTED = frozenset([s for obj in ("", None) for s in (repr(obj), str(obj))])
+    _UNMASKED_TYPES = (bool, int, float)
 
     def __init__(
         self,
@@ -24,14 +25,82 @@ class MaskingFilter(logging.Filter):
         for k, vs in patterns.items():
             self._redact_patterns[k] = {v for v in vs if v and v not in self._UNWANTED}
         self._use_named_masks = _use_named_masks
+        self._literal_matcher: re.Pattern[str] | None = None
+        self._literal_masks: dict[str, str] | None = None
 
     def add_mask_for(self, data: str, name: str = "redacted") -> MaskingFilter:
         if data and data not in self._UNWANTED:
             log.debug("Adding redact pattern '%r' to redact_patterns", name)
             self._redact_patterns[name].add(data)
+            # Invalidate the compiled matcher so it is rebuilt on next use
+            self._literal_masks = None
         return self
 
-    def filter(self, record: logging.LogRecord) -> bool:
+    def _get_literal_matcher(self) -> tuple[re.Pattern[str] | None, dict[str, str]]:
+        """
+        Compile all the literal secrets into a single alternation, where each
+        secret is captured by a named group that maps back to its mask name.
+
+        Longer secrets are placed first so that a secret which contains another
+        (e.g. the ``repr()`` of a token contains the token) is replaced as a whole.
+        """
+        if self._literal_masks is not None:
+            return self._literal_matcher, self._literal_masks
+
+        literals = sorted(
+            (
+                (data, mask)
+                for mask, values in self._redact_patterns.items()
+                for data in values
+                if isinstance(data, str)
+            ),
+            key=lambda literal: (-len(literal[0]), literal[0]),
+        )
+        self._literal_masks = {f"_m{i}": mask for i, (_, mask) in enumerate(literals)}
+        self._literal_matcher = (
+            re.compile(
+                str.join(
+                    "|",
+                    (
+                        f"(?P<_m{i}>{re.escape(data)})"
+                        for i, (data, _) in enumerate(literals)
+                    ),
+                )
+            )
+            if literals
+            else None
+        )
+        return self._literal_matcher, self._literal_masks
+
+    def _replacement_for(self, mask: str) -> str:
+        return (
+            self.REPLACE_STR
+            if not self._use_named_masks
+            else f"<{mask!r} (value removed)>"
+        )
+
+    def _contains_secret(self, msg: str) -> bool:
+        matcher, _ = self._get_literal_matcher()
+        if matcher is not None and matcher.search(msg):
+            return True
+
+        return any(
+            data.search(msg)
+            for values in self._redact_patterns.values()
+            for data in values
+            if isinstance(data, re.Pattern)
+        )
+
+    def _record_contains_secret(self, msg: Any, str_args: Iterable[Any]) -> bool:
+        if isinstance(msg, str) and self._contains_secret(msg):
+            return True
+
+        return any(
+            self._contains_secret(arg) for arg in str_args if isinstance(arg, str)
+        )
+
+    @classmethod
+    def _stringify_arg(cls, arg: Any) -> Any:
         # Note if we blindly mask all types, we will actually cast arguments to
         # log functions from external libraries to strings before they are
         # formatted into the message - for example, a dependency calling
@@ -41,18 +110,41 @@ class MaskingFilter(logging.Filter):
         # here: https://github.com/urllib3/urllib3/blob/a5b29ac1025f9bb30f2c9b756f3b171389c2c039/src/urllib3/connectionpool.py#L1003
         # Anything which could reasonably be expected to be logged without being
         # cast to a string should be excluded from the cast here.
+        if type(arg) in cls._UNMASKED_TYPES or isinstance(arg, str):
+            return arg
+        return str(arg)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # Performance optimization: most records do not contain any secret, so
+        # leave them untouched rather than rewriting their arguments.
+        # As a handler filter, logging only calls this for records at or above
+        # the handler's level.
+        if not self._redact_patterns:
+            return True
+
+        # Each argument is stringified once, for both the search and the masking
+        str_args: tuple[Any, ...] | dict[str, Any] | None = None
+        if isinstance(record.args, dict):
+            str_args = {k: self._stringify_arg(v) for k, v in record.args.items()}
+        elif record.args:
+            str_args = tuple(map(self._stringify_arg, record.args))
+
+        if not self._record_contains_secret(
+            record.msg,
+            str_args.values() if isinstance(str_args, dict) else str_args or (),
+        ):
+            return True
+
         record.msg = self.mask(record.msg)
-        if record.args is None:
-            pass
-        elif isinstance(record.args, dict):
+        if isinstance(str_args, dict):
             record.args = {
-                k: v if type(v) in (bool, int, float) else self.mask(str(v))
-                for k, v in record.args.items()
+                k: v if type(v) in self._UNMASKED_TYPES else self.mask(v)
+                for k, v in str_args.items()
             }
-        else:
+        elif str_args is not None:
             record.args = tuple(
-                arg if type(arg) in (bool, int, float) else self.mask(str(arg))
-                for arg in record.args
+                arg if type(arg) in self._UNMASKED_TYPES else self.mask(arg)
+                for arg in str_args
             )
         return True
 
@@ -62,15 +154,16 @@ class MaskingFilter(logging.Filter):
                 "cannot mask object of type %s", type(msg)
             )
             return msg
-        for mask, values in self._redact_patterns.items():
-            repl_string = (
-                self.REPLACE_STR
-                if not self._use_named_masks
-                else f"<{mask!r} (value removed)>"
+
+        matcher, group_2_mask = self._get_literal_matcher()
+        if matcher is not None:
+            msg = matcher.sub(
+                lambda match: self._replacement_for(group_2_mask[str(match.lastgroup)]),
+                msg,
             )
+
+        for mask, values in self._redact_patterns.items():
             for data in values:
-                if isinstance(data, str):
-                    msg = msg.replace(data, repl_string)
-                elif isinstance(data, re.Pattern):
-                    msg = data.sub(repl_string, msg)
+                if isinstance(data, re.Pattern):
+                    msg = data.sub(self._replacement_for(mask), msg)
         return msg
@@ -31,7 +31,7 @@ from semantic_release.commit_parser.util import (
 )
 from semantic_release.enums import LevelBump
 from semantic_release.errors import InvalidParserOptions
-from semantic_release.helpers import sort_numerically, text_reducer
+from semantic_release.helpers import insert_sorted_numerically, text_reducer
 
 if TYPE_CHECKING:  # pragma: no cover
     from git.objects.commit import Commit
@@ -265,9 +265,8 @@ class AngularCommitParser(CommitParser[ParseResult, AngularParserOptions]):
                 )
             )
             if new_issue_refs:
-                accumulator["linked_issues"] = sort_numerically(
-                    set(accumulator["linked_issues"]).union(new_issue_refs)
-                )
+                # The accumulated issues are kept sorted, so only the new ones are placed
+                insert_sorted_numerically(accumulator["linked_issues"], new_issue_refs)
                 # TODO: breaking change v10, removes resolution footers from descriptions
                 # return accumulator
 
@@ -1,20 +1,35 @@
 from __future__ import annotations
 
+import glob
 import importlib.util
+import locale
 import logging
+import mmap
 import os
 import re
+import shutil
 import string
 import sys
-from functools import lru_cache, reduce, wraps
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from functools import lru_cache, wraps
+from hashlib import sha256
 from pathlib import Path, PurePosixPath
 from re import IGNORECASE, compile as regexp
 from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Sequence, TypeVar
 from urllib.parse import urlsplit
 
+if sys.version_info >= (3, 11):
+    # Fast read-only TOML parser, only available in the standard library since python 3.11
+    import tomllib
+else:  # pragma: no cover
+    tomllib = None
+
 if TYPE_CHECKING:  # pragma: no cover
     from re import Pattern
-    from typing import Iterable
+    from types import TracebackType
+    from typing import Iterable, TextIO
 
 
 log = logging.getLogger(__name__)
@@ -37,51 +52,159 @@ def get_number_from_str(
     return default
 
 
+@lru_cache(maxsize=4096)
+def natural_sort_key(
+    item: str, reverse: bool = False, allow_hex: bool = False
+) -> tuple[str, bool, int, str]:
+    """
+    Compute the sort key of a single item for `sort_numerically()`.
+
+    Items are grouped by the (alphabetized) prefix of their first number and
+    ordered by that number within a group, while items without any number are
+    alphabetized amongst the prefixes. An item without a number which equals the
+    prefix of a group is placed in front of that group, in either direction. The
+    item itself breaks any remaining tie, so the keys of distinct items never
+    compare equal.
+    """
+    if not (
+        pattern_match := (
+            (hex_number_pattern.search(item) if allow_hex else None)
+            or number_pattern.search(item)
+        )
+    ):
+        return (item, False, 0, item)
+
+    number = (
+        abs(int(pattern_match.group("number"), 16))
+        if allow_hex
+        else int(pattern_match.group("number"))
+    )
+    return (pattern_match.group("prefix"), True, -number if reverse else number, item)
+
+
 def sort_numerically(
     iterable: Iterable[str], reverse: bool = False, allow_hex: bool = False
 ) -> list[str]:
     # Alphabetically sort prefixes first, then sort by number
-    alphabetized_list = sorted(iterable)
-
-    # Extract prefixes in order to group items by prefix
-    unmatched_items = []
-    prefixes: dict[str, list[str]] = {}
-    for item in alphabetized_list:
-        if not (
-            pattern_match := (
-                (hex_number_pattern.search(item) if allow_hex else None)
-                or number_pattern.search(item)
+    return sorted(
+        iterable,
+        key=lambda item: natural_sort_key(item, reverse=reverse, allow_hex=allow_hex),
+    )
+
+
+def insert_sorted_numerically(
+    sorted_items: list[str],
+    new_items: Iterable[str],
+    reverse: bool = False,
+    allow_hex: bool = False,
+) -> list[str]:
+    """
+    Insert new items into a list already ordered by `sort_numerically()` (with the
+    same options), skipping the items which are already present.
+
+    Each item is placed with a binary search over the (cached) sort keys, so a
+    list which grows over time never needs to be sorted again from scratch.
+
+    :returns: The given list, updated in place
+    """
+    for item in new_items:
+        item_key = natural_sort_key(item, reverse=reverse, allow_hex=allow_hex)
+        low, high = 0, len(sorted_items)
+
+        while low < high:
+            middle = (low + high) // 2
+            middle_key = natural_sort_key(
+                sorted_items[middle], reverse=reverse, allow_hex=allow_hex
             )
-        ):
-            unmatched_items.append(item)
+            if middle_key < item_key:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low < len(sorted_items) and sorted_items[low] == item:
             continue
 
-        prefix = prefix if (prefix := pattern_match.group("prefix")) else ""
-
-        if prefix not in prefixes:
-            prefixes[prefix] = []
-
-        prefixes[prefix].append(item)
-
-    # Sort prefixes and items by number mixing in unmatched items as alphabetized with other prefixes
-    return reduce(
-        lambda acc, next_item: acc + next_item,
-        [
-            (
-                sorted(
-                    prefixes[prefix],
-                    key=lambda x: get_number_from_str(
-                        x, default=-1, interpret_hex=allow_hex
-                    ),
-                    reverse=reverse,
-                )
-                if prefix in prefixes
-                else [prefix]
+        sorted_items.insert(low, item)
+
+    return sorted_items
+
+
+class CombinedPatternMatcher:
+    """
+    Match a string against many regular expressions with a single regex run.
+
+    The given patterns are compiled into one alternation where each pattern is
+    wrapped in its own named group, so a match reports which pattern hit. Like
+    ``any(p.match(s) for p in patterns)``, matching is anchored at the start of
+    the string and the first pattern (in the given order) that matches wins.
+
+    Patterns which cannot be safely embedded into the alternation (numbered
+    back-references, global inline flags, ``re.VERBOSE``/``re.ASCII``/``re.LOCALE``
+    or group names which collide with another pattern) are evaluated one at a
+    time instead, so the result is always identical to matching individually.
+    """
+
+    _group_prefix = "_psr_p"
+    _unsafe_src_pattern = regexp(r"\\[1-9]|\(\?\(\d|^\(\?[aiLmsux]+\)")
+    _scoped_flags = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+    _unsupported_flags = re.VERBOSE | re.ASCII | re.LOCALE
+
+    def __init__(self, patterns: Iterable[Pattern[str]]) -> None:
+        self.patterns: tuple[Pattern[str], ...] = tuple(patterns)
+        self._fallback: list[tuple[int, Pattern[str]]] = []
+        alternatives: list[str] = []
+        used_group_names: set[str] = set()
+
+        for index, pattern in enumerate(self.patterns):
+            group_names = set(pattern.groupindex)
+            if (
+                not isinstance(pattern.pattern, str)
+                or pattern.flags & self._unsupported_flags
+                or self._unsafe_src_pattern.search(pattern.pattern)
+                or group_names & used_group_names
+                or any(name.startswith(self._group_prefix) for name in group_names)
+            ):
+                self._fallback.append((index, pattern))
+                continue
+
+            flags = str.join(
+                "", (char for flag, char in self._scoped_flags if pattern.flags & flag)
             )
-            for prefix in sorted([*prefixes.keys(), *unmatched_items])
-        ],
-        [],
-    )
+            alternatives.append(
+                f"(?P<{self._group_prefix}{index}>"
+                f"{f'(?{flags}:' if flags else '(?:'}{pattern.pattern}))"
+            )
+            used_group_names.update(group_names)
+
+        self._combined: Pattern[str] | None = None
+        try:
+            if alternatives:
+                self._combined = regexp(str.join("|", alternatives))
+        except re.error:
+            log.debug("Unable to combine patterns, matching them one at a time")
+            self._fallback = list(enumerate(self.patterns))
+
+    def match(self, string: str) -> Pattern[str] | None:
+        """
+        Return the first pattern which matches at the start of ``string``, or
+        ``None`` if none of the patterns match.
+        """
+        hit_index = len(self.patterns)
+
+        if self._combined is not None and (
+            (combined_match := self._combined.match(string)) is not None
+        ):
+            # the wrapper group is the outermost group of each alternative, so it is
+            # always the last group to close on a successful match
+            hit_index = int(str(combined_match.lastgroup)[len(self._group_prefix) :])
+
+        for index, pattern in self._fallback:
+            if index >= hit_index:
+                break
+            if pattern.match(string):
+                return pattern
+
+        return self.patterns[hit_index] if hit_index < len(self.patterns) else None
 
 
 def text_reducer(text: str, filter_pair: tuple[Pattern[str], str]) -> str:
@@ -107,6 +230,208 @@ def format_arg(value: Any) -> str:
     return str(value)
 
 
+_FILE_HASH_CHUNK_SIZE = 64 * 1024
+
+
+def file_sha256(filepath: Path | str) -> str:
+    """Hash the content of a file, reading it in bounded chunks"""
+    file_hash = sha256()
+    with open(filepath, "rb") as fd:
+        while chunk := fd.read(_FILE_HASH_CHUNK_SIZE):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def files_have_same_content(filepath: Path | str, other_filepath: Path | str) -> bool:
+    """Compare the content hash of two files, when they have the same size"""
+    return os.path.getsize(filepath) == os.path.getsize(other_filepath) and (
+        file_sha256(filepath) == file_sha256(other_filepath)
+    )
+
+
+class AtomicTextFile:
+    """
+    Open a file for writing text through a temporary sibling file which atomically
+    replaces the target once the context exits without error, so readers never
+    observe a partially written file and the previous content can still be read
+    while the new content is streamed. Symlinks are followed and the permissions of
+    an existing file are kept.
+
+    With ``skip_unchanged``, the target is left untouched when the new content is
+    identical to its current content. Once the context has exited, ``changed``
+    tells whether the target was written.
+    """
+
+    def __init__(
+        self,
+        filepath: Path | str,
+        encoding: str | None = None,
+        skip_unchanged: bool = False,
+    ) -> None:
+        self.target = Path(os.path.realpath(filepath))
+        self.encoding = encoding
+        self.skip_unchanged = skip_unchanged
+        self.changed = False
+        self._file: TextIO | None = None
+        self._tmp_path: str | None = None
+
+    def __enter__(self) -> TextIO:
+        self.changed = False
+
+        if not self.target.exists():
+            self._file = self.target.open("w", encoding=self.encoding)
+            return self._file
+
+        fd, self._tmp_path = tempfile.mkstemp(
+            dir=self.target.parent, prefix=f".{self.target.name}.", suffix=".tmp"
+        )
+        self._file = os.fdopen(fd, "w", encoding=self.encoding)
+        return self._file
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        file, self._file = self._file, None
+        tmp_path, self._tmp_path = self._tmp_path, None
+
+        if file is None:
+            return
+
+        if tmp_path is None:
+            file.close()
+            self.changed = True
+            return
+
+        try:
+            file.close()
+
+            if exc_type is not None:
+                os.unlink(tmp_path)
+                return
+
+            if self.skip_unchanged and files_have_same_content(tmp_path, self.target):
+                log.debug("%s is unchanged, skipping write", self.target)
+                os.unlink(tmp_path)
+                return
+
+            shutil.copymode(self.target, tmp_path)
+            os.replace(tmp_path, self.target)
+            self.changed = True
+
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.unlink(tmp_path)
+            raise
+
+
+def atomic_open_text(
+    filepath: Path | str, encoding: str | None = None, skip_unchanged: bool = False
+) -> AtomicTextFile:
+    """Open a file for writing text atomically, see `AtomicTextFile`"""
+    return AtomicTextFile(filepath, encoding=encoding, skip_unchanged=skip_unchanged)
+
+
+def atomic_write_text(
+    filepath: Path | str,
+    content: str,
+    encoding: str | None = None,
+    skip_unchanged: bool = False,
+) -> bool:
+    """
+    Write text to a file by writing a temporary sibling file first and then
+    atomically replacing the target, see `AtomicTextFile`.
+
+    With ``skip_unchanged``, the hash of the encoded content is compared with the
+    hash of the current file first, so an identical file is not written at all.
+
+    :returns: Whether the file was written
+    """
+    if skip_unchanged and os.path.isfile(filepath):
+        # Encode the content like the text file would, with universal newlines
+        content_bytes = content.replace("\n", os.linesep).encode(
+            encoding or locale.getpreferredencoding(False)
+        )
+        if os.path.getsize(filepath) == len(content_bytes) and (
+            sha256(content_bytes).hexdigest() == file_sha256(filepath)
+        ):
+            log.debug("%s is unchanged, skipping write", filepath)
+            return False
+
+    with atomic_open_text(filepath, encoding=encoding) as target_file:
+        target_file.write(content)
+
+    return True
+
+
+_glob_magic_pattern = regexp(r"[*?[]")
+
+
+def has_glob_pattern(path: str) -> bool:
+    """Check if a path contains any glob wildcards that need to be expanded"""
+    return bool(_glob_magic_pattern.search(path))
+
+
+def file_contains_pattern(filepath: Path | str, pattern: Pattern[bytes]) -> bool:
+    """
+    Search the raw bytes of a file for the pattern through a memory map, so the file
+    is neither read fully into memory nor decoded.
+    """
+    with open(filepath, "rb") as fd:
+        try:
+            with mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                return pattern.search(mapped_file) is not None  # type: ignore[call-overload]
+        except ValueError:
+            # empty files cannot be memory mapped (and contain nothing anyway)
+            return False
+
+
+def find_files_w_pattern(
+    path_glob: str, pattern: Pattern[bytes], root_dir: Path | str | None = None
+) -> list[Path]:
+    """
+    Expand a (recursive ``**``) glob into the sorted list of resolved file paths
+    whose content matches the given bytes pattern.
+
+    A relative glob is expanded from `root_dir` (default: the working directory).
+    A glob which matches no file logs a warning, as it is most likely mistyped.
+    """
+    full_glob = (
+        os.path.join(glob.escape(str(root_dir)), path_glob) if root_dir else path_glob
+    )
+    candidate_files = [
+        filepath
+        for filepath in map(Path, sorted(glob.glob(full_glob, recursive=True)))
+        if filepath.is_file()
+    ]
+    matched_files = [
+        filepath.resolve()
+        for filepath in candidate_files
+        if file_contains_pattern(filepath, pattern)
+    ]
+
+    if not candidate_files:
+        log.warning("glob %r did not match any file", full_glob)
+    elif not matched_files:
+        log.warning(
+            "glob %r matched %s files but none of them contain %r",
+            full_glob,
+            len(candidate_files),
+            pattern.pattern.decode(errors="replace"),
+        )
+    else:
+        log.debug(
+            "glob %r matched %s files containing %r",
+            full_glob,
+            len(matched_files),
+            pattern.pattern,
+        )
+
+    return matched_files
+
+
 def check_tag_format(tag_format: str) -> None:
     if "version" not in (f[1] for f in string.Formatter().parse(tag_format)):
         raise ValueError(
@@ -132,6 +457,10 @@ def logged_function(logger: logging.Logger) -> Callable[[_FuncType[_R]], _FuncTy
     def _logged_function(func: _FuncType[_R]) -> _FuncType[_R]:
         @wraps(func)
         def _wrapper(*args: Any, **kwargs: Any) -> _R:
+            # Only format the arguments when they will actually be logged
+            if not logger.isEnabledFor(logging.DEBUG):
+                return func(*args, **kwargs)
+
             logger.debug(
                 "%s(%s, %s)",
                 func.__name__,
@@ -151,6 +480,39 @@ def logged_function(logger: logging.Logger) -> Callable[[_FuncType[_R]], _FuncTy
     return _logged_function
 
 
+_T = TypeVar("_T")
+
+
+def run_ordered_in_pool(
+    fn: Callable[[_T], _R],
+    items: Sequence[_T],
+    max_workers: int | None = None,
+    thread_name_prefix: str = "psr",
+) -> list[_R]:
+    """
+    Call `fn` on every item concurrently on a thread pool, returning the results in
+    the order of `items`.
+
+    Every item is processed before the results are collected, so a raised error is
+    the one of the first failing item regardless of which thread finishes first.
+    The items are processed sequentially when there is nothing to overlap or when
+    `max_workers` is 1.
+
+    :param max_workers: The maximum number of threads, never more than the number
+        of items, the default of `ThreadPoolExecutor` is used when not provided
+    """
+    if len(items) < 2 or max_workers == 1:
+        return [fn(item) for item in items]
+
+    num_workers = min(max_workers or min(32, (os.cpu_count() or 1) + 4), len(items))
+    with ThreadPoolExecutor(
+        max_workers=num_workers, thread_name_prefix=thread_name_prefix
+    ) as executor:
+        futures = [executor.submit(fn, item) for item in items]
+
+    return [future.result() for future in futures]
+
+
 @logged_function(log)
 def dynamic_import(import_path: str) -> Any:
     """
@@ -3,6 +3,7 @@ from semantic_release.hvcs.bitbucket import Bitbucket
 from semantic_release.hvcs.gitea import Gitea
 from semantic_release.hvcs.github import Github
 from semantic_release.hvcs.gitlab import Gitlab
+from semantic_release.hvcs.local import Local
 from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
 from semantic_release.hvcs.token_auth import TokenAuth
 
@@ -12,6 +13,7 @@ __all__ = [
     "Github",
     "Gitlab",
     "HvcsBase",
+    "Local",
     "RemoteHvcsBase",
     "TokenAuth",
 ]
@@ -6,12 +6,14 @@ import glob
 import logging
 import mimetypes
 import os
+from contextlib import suppress
 from functools import lru_cache
 from pathlib import PurePosixPath
 from re import compile as regexp
 from typing import TYPE_CHECKING
 
 from requests import HTTPError, JSONDecodeError
+from requests.adapters import DEFAULT_POOLSIZE
 from urllib3.util.url import Url, parse_url
 
 from semantic_release.cli.util import noop_report
@@ -21,9 +23,13 @@ from semantic_release.errors import (
     UnexpectedResponse,
 )
 from semantic_release.helpers import logged_function
-from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
+from semantic_release.hvcs.remote_hvcs_base import ReleaseAsset, RemoteHvcsBase
 from semantic_release.hvcs.token_auth import TokenAuth
-from semantic_release.hvcs.util import build_requests_session, suppress_not_found
+from semantic_release.hvcs.util import (
+    build_requests_session,
+    get_remote_release_cache,
+    suppress_not_found,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
     from typing import Any, Callable
@@ -92,12 +98,18 @@ class Github(RemoteHvcsBase):
         hvcs_api_domain: str | None = None,
         token: str | None = None,
         allow_insecure: bool = False,
+        max_upload_workers: int = RemoteHvcsBase.DEFAULT_MAX_UPLOAD_WORKERS,
         **_kwargs: Any,
     ) -> None:
         super().__init__(remote_url)
         self.token = token
+        self.max_upload_workers = max_upload_workers
         auth = None if not self.token else TokenAuth(self.token)
-        self.session = build_requests_session(auth=auth)
+        # Size the connection pool so that concurrent uploads can reuse connections
+        self.session = build_requests_session(
+            auth=auth, pool_maxsize=max(max_upload_workers, DEFAULT_POOLSIZE)
+        )
+        self._release_cache = get_remote_release_cache()
 
         # ref: https://docs.github.com/en/actions/reference/environment-variables#default-environment-variables
         domain_url_str = (
@@ -272,24 +284,32 @@ class Github(RemoteHvcsBase):
         response.raise_for_status()
 
         try:
-            release_id: int = response.json()["id"]
+            release = response.json()
+            release_id: int = release["id"]
             log.info("Successfully created release with ID: %s", release_id)
+            self._release_cache.set(
+                self.create_api_url(
+                    endpoint=f"/repos/{self.owner}/{self.repo_name}/releases/{release_id}",
+                ),
+                release,
+            )
         except JSONDecodeError as err:
             raise UnexpectedResponse("Unreadable json response") from err
         except KeyError as err:
             raise UnexpectedResponse("JSON response is missing an id") from err
 
-        errors = []
-        for asset in assets or []:
+        def upload_asset(asset: str) -> bool:
             log.info("Uploading asset %s", asset)
-            try:
-                self.upload_release_asset(release_id, asset)
-            except HTTPError as err:
-                errors.append(
-                    AssetUploadError(f"Failed asset upload for {asset}").with_traceback(
-                        err.__traceback__
-                    )
-                )
+            return self.upload_release_asset(release_id, asset)
+
+        errors = [
+            AssetUploadError(f"Failed asset upload for {asset}").with_traceback(
+                err.__traceback__
+            )
+            for asset, err in self._upload_assets_concurrently(
+                upload_asset, assets or []
+            )
+        ]
 
         if len(errors) < 1:
             return release_id
@@ -313,19 +333,28 @@ class Github(RemoteHvcsBase):
         tag_endpoint = self.create_api_url(
             endpoint=f"/repos/{self.owner}/{self.repo_name}/releases/tags/{tag}",
         )
-        response = self.session.get(tag_endpoint)
-
-        # Raise an error if the request was not successful
-        response.raise_for_status()
 
+        # Always revalidated, as the release of the tag may have been created,
+        # edited or deleted by someone else since it was last read
+        # Raises an error if the request was not successful
         try:
-            data = response.json()
-            return data["id"]
+            release = self._release_cache.get_json(self.session, tag_endpoint)
         except JSONDecodeError as err:
             raise UnexpectedResponse("Unreadable json response") from err
+
+        try:
+            release_id: int = release["id"]
         except KeyError as err:
             raise UnexpectedResponse("JSON response is missing an id") from err
 
+        self._release_cache.set(
+            self.create_api_url(
+                endpoint=f"/repos/{self.owner}/{self.repo_name}/releases/{release_id}",
+            ),
+            release,
+        )
+        return release_id
+
     @logged_function(log)
     def edit_release_notes(self, release_id: int, release_notes: str) -> int:
         """
@@ -348,6 +377,10 @@ class Github(RemoteHvcsBase):
         # Raise an error if the update was unsuccessful
         response.raise_for_status()
 
+        # Keep the cached release in sync with its new release notes
+        with suppress(JSONDecodeError):
+            self._release_cache.set(release_endpoint, response.json())
+
         return release_id
 
     @logged_function(log)
@@ -391,15 +424,20 @@ class Github(RemoteHvcsBase):
         release_url = self.create_api_url(
             endpoint=f"/repos/{self.owner}/{self.repo_name}/releases/{release_id}"
         )
+        release = self._release_cache.get(release_url) or {}
 
-        response = self.session.get(release_url)
-        response.raise_for_status()
+        if "upload_url" not in release:
+            # Raises an error if the request was not successful
+            try:
+                release = self._release_cache.get_json(self.session, release_url)
+            except JSONDecodeError as err:
+                raise UnexpectedResponse("Unreadable json response") from err
+
+            self._release_cache.set(release_url, release)
 
         try:
-            upload_url: str = response.json()["upload_url"]
+            upload_url: str = release["upload_url"]
             return upload_url.replace("{?name,label}", "")
-        except JSONDecodeError as err:
-            raise UnexpectedResponse("Unreadable json response") from err
         except KeyError as err:
             raise UnexpectedResponse(
                 "JSON response is missing a key 'upload_url'"
@@ -451,13 +489,77 @@ class Github(RemoteHvcsBase):
 
         return True
 
+    @logged_function(log)
+    def get_release_assets(self, release_id: int) -> dict[str, ReleaseAsset]:
+        """
+        Get the assets attached to a release, following the pagination
+        https://docs.github.com/rest/releases/assets#list-release-assets
+        :param release_id: ID of the release to list the assets of
+        :return: The assets of the release by name
+        """
+        next_url: str | None = self.create_api_url(
+            endpoint=f"/repos/{self.owner}/{self.repo_name}/releases/{release_id}/assets",
+        )
+        params: dict[str, int] | None = {"per_page": 100}
+        assets: dict[str, ReleaseAsset] = {}
+
+        while next_url:
+            response = self.session.get(next_url, params=params)
+            response.raise_for_status()
+
+            try:
+                assets.update(
+                    (
+                        asset["name"],
+                        ReleaseAsset(
+                            id=asset["id"],
+                            name=asset["name"],
+                            size=asset["size"],
+                            digest=asset.get("digest"),
+                        ),
+                    )
+                    for asset in response.json()
+                )
+            except JSONDecodeError as err:
+                raise UnexpectedResponse("Unreadable json response") from err
+            except (KeyError, TypeError) as err:
+                raise UnexpectedResponse(
+                    "JSON response is not a list of assets"
+                ) from err
+
+            # The link to the next page already contains the query parameters
+            next_url = response.links.get("next", {}).get("url")
+            params = None
+
+        return assets
+
+    @logged_function(log)
+    def delete_release_asset(
+        self,
+        release_id: int,  # noqa: ARG002
+        asset_id: int,
+    ) -> None:
+        """
+        Delete an asset from a release
+        https://docs.github.com/rest/releases/assets#delete-a-release-asset
+        :param release_id: this parameter has no effect
+        :param asset_id: ID of the asset to delete
+        """
+        asset_url = self.create_api_url(
+            endpoint=f"/repos/{self.owner}/{self.repo_name}/releases/assets/{asset_id}",
+        )
+        response = self.session.delete(asset_url)
+
+        # Raise an error if the deletion was unsuccessful
+        response.raise_for_status()
+
     @logged_function(log)
     def upload_dists(self, tag: str, dist_glob: str) -> int:
         """
         Upload distributions to a release
         :param tag: Version to upload for
         :param dist_glob: Path to the dist directory
-        :return: The number of distributions successfully uploaded
+        :return: The number of distributions successfully uploaded or already attached
         """
         # Find the release corresponding to this version
         release_id = self.get_release_id_by_tag(tag=tag)
@@ -465,18 +567,11 @@ class Github(RemoteHvcsBase):
             log.warning("No release corresponds to tag %s, can't upload dists", tag)
             return 0
 
-        # Upload assets
-        n_succeeded = 0
-        for file_path in (
+        # Upload the assets which are not already attached to the release
+        file_paths = [
             f for f in glob.glob(dist_glob, recursive=True) if os.path.isfile(f)
-        ):
-            try:
-                self.upload_release_asset(release_id, file_path)
-                n_succeeded += 1
-            except HTTPError:  # noqa: PERF203
-                log.exception("error uploading asset %s", file_path)
-
-        return n_succeeded
+        ]
+        return self._upload_missing_assets(release_id, file_paths)
 
     def remote_url(self, use_token: bool = True) -> str:
         """Get the remote url including the token for authentication if requested"""
@@ -19,7 +19,7 @@ from semantic_release.cli.util import noop_report
 from semantic_release.errors import UnexpectedResponse
 from semantic_release.helpers import logged_function
 from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
-from semantic_release.hvcs.util import suppress_not_found
+from semantic_release.hvcs.util import build_requests_session, suppress_not_found
 
 if TYPE_CHECKING:  # pragma: no cover
     from typing import Any, Callable
@@ -75,7 +75,16 @@ class Gitlab(RemoteHvcsBase):
             ).url.rstrip("/")
         )
 
-        self._client = gitlab.Gitlab(self.hvcs_domain.url, private_token=self.token)
+        # python-gitlab handles the response statuses & retries itself (including
+        # the rate limited requests), the session only paces its requests with the
+        # shared request scheduler so that they are not retried twice
+        self._client = gitlab.Gitlab(
+            self.hvcs_domain.url,
+            private_token=self.token,
+            session=build_requests_session(
+                raise_for_status=False, retry=False, retry_rate_limited=False
+            ),
+        )
         self._api_url = parse_url(self._client.api_url)
 
     @property
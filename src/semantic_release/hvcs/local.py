@@ -0,0 +1,611 @@
+"""Helper code for publishing releases into a directory, as a stand-in for a remote VCS"""
+
+# Note: The local client does not talk to any server. It is meant to exercise the
+# release & upload code paths offline (i.e. benchmarks & load tests in CI), with
+# the latency, failures & rate limit of a real remote simulated on every operation.
+
+from __future__ import annotations
+
+import glob
+import json
+import logging
+import os
+import random
+import shutil
+import threading
+import time
+from datetime import datetime, timezone
+from io import BytesIO
+from pathlib import Path, PurePosixPath
+from re import compile as regexp
+from typing import TYPE_CHECKING
+
+from requests import HTTPError, Response
+from urllib3.util.url import Url, parse_url
+
+from semantic_release.cli.util import noop_report
+from semantic_release.errors import AssetUploadError, IncompleteReleaseError
+from semantic_release.helpers import atomic_write_text, file_sha256, logged_function
+from semantic_release.hvcs.remote_hvcs_base import ReleaseAsset, RemoteHvcsBase
+from semantic_release.hvcs.util import get_request_scheduler
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Any, Callable, NoReturn
+
+    from semantic_release.hvcs.util import RequestScheduler
+
+
+# Globals
+log = logging.getLogger(__name__)
+
+
+class Local(RemoteHvcsBase):
+    """
+    Local HVCS interface, which persists releases & their assets into a directory
+    instead of a remote VCS
+
+    The directory is read from the ``LOCAL_HVCS_DIR`` environment variable (default:
+    ``.local-hvcs`` in the working directory) and holds a ``releases.json`` index of
+    the releases, and the uploaded assets under ``assets/<release id>/``.
+
+    Every operation is a simulated request, sent through the request scheduler
+    shared by the remote VCS clients so that it is paced like a real request. Each
+    request is delayed by ``LOCAL_HVCS_LATENCY`` seconds (with +/- 50% of jitter),
+    plus the time to transfer its payload at ``LOCAL_HVCS_BANDWIDTH`` bytes/second.
+    It is rejected because of the rate limit (429 Too Many Requests, which the
+    scheduler retries once the limit resets) with a probability of
+    ``LOCAL_HVCS_RATE_LIMIT_RATE``, and fails with an ``HTTPError`` (503 Service
+    Unavailable, which is not retried) with a probability of
+    ``LOCAL_HVCS_FAILURE_RATE``. ``LOCAL_HVCS_SEED`` makes the injected latency &
+    failures reproducible.
+    """
+
+    OFFICIAL_NAME = "Local"
+    DEFAULT_DOMAIN = "localhost"
+    DEFAULT_API_PATH = "/api"
+    DEFAULT_RELEASE_DIR = ".local-hvcs"
+    ENV_RELEASE_DIR = "LOCAL_HVCS_DIR"
+    ENV_LATENCY = "LOCAL_HVCS_LATENCY"
+    ENV_BANDWIDTH = "LOCAL_HVCS_BANDWIDTH"
+    ENV_FAILURE_RATE = "LOCAL_HVCS_FAILURE_RATE"
+    ENV_RATE_LIMIT_RATE = "LOCAL_HVCS_RATE_LIMIT_RATE"
+    ENV_SEED = "LOCAL_HVCS_SEED"
+    RATE_LIMIT_RETRY_AFTER = 1
+
+    def __init__(
+        self,
+        remote_url: str,
+        *,
+        hvcs_domain: str | None = None,
+        token: str | None = None,
+        allow_insecure: bool = False,
+        max_upload_workers: int = RemoteHvcsBase.DEFAULT_MAX_UPLOAD_WORKERS,
+        release_dir: Path | str | None = None,
+        latency: float | None = None,
+        bandwidth: float | None = None,
+        failure_rate: float | None = None,
+        rate_limit_rate: float | None = None,
+        seed: int | None = None,
+        scheduler: RequestScheduler | None = None,
+        **_kwargs: Any,
+    ) -> None:
+        super().__init__(remote_url)
+        self.token = token
+        self.max_upload_workers = max_upload_workers
+
+        self.release_dir = Path(
+            release_dir or os.getenv(self.ENV_RELEASE_DIR) or self.DEFAULT_RELEASE_DIR
+        ).absolute()
+        self.latency = (
+            latency if latency is not None else float(os.getenv(self.ENV_LATENCY) or 0)
+        )
+        self.bandwidth = (
+            bandwidth
+            if bandwidth is not None
+            else float(os.getenv(self.ENV_BANDWIDTH) or 0)
+        )
+        self.failure_rate = (
+            failure_rate
+            if failure_rate is not None
+            else float(os.getenv(self.ENV_FAILURE_RATE) or 0)
+        )
+        self.rate_limit_rate = (
+            rate_limit_rate
+            if rate_limit_rate is not None
+            else float(os.getenv(self.ENV_RATE_LIMIT_RATE) or 0)
+        )
+        self.scheduler = scheduler or get_request_scheduler()
+
+        if self.latency < 0:
+            raise ValueError(f"Invalid latency {self.latency}, it must be positive")
+
+        if self.bandwidth < 0:
+            raise ValueError(
+                f"Invalid bandwidth {self.bandwidth}, it must be positive (0: unlimited)"
+            )
+
+        for name, rate in (
+            ("failure rate", self.failure_rate),
+            ("rate limit rate", self.rate_limit_rate),
+        ):
+            if not 0 <= rate <= 1:
+                raise ValueError(f"Invalid {name} {rate}, it must be between 0 & 1")
+
+        env_seed = os.getenv(self.ENV_SEED)
+        self._random = random.Random(  # noqa: S311
+            seed if seed is not None else int(env_seed) if env_seed else None
+        )
+        self._lock = threading.RLock()
+
+        domain_url = self._normalize_url(
+            hvcs_domain or f"https://{self.DEFAULT_DOMAIN}",
+            allow_insecure=allow_insecure,
+        )
+
+        # Strip any auth, query or fragment from the domain
+        self._hvcs_domain = parse_url(
+            Url(
+                scheme=domain_url.scheme,
+                host=domain_url.host,
+                port=domain_url.port,
+                path=str(PurePosixPath(domain_url.path or "/")),
+            ).url.rstrip("/")
+        )
+
+        self._api_url = parse_url(
+            Url(
+                **{
+                    **self.hvcs_domain._asdict(),
+                    "path": f"{self.hvcs_domain.path or ''}{self.DEFAULT_API_PATH}",
+                }
+            ).url
+        )
+
+    @property
+    def index_file(self) -> Path:
+        return self.release_dir / "releases.json"
+
+    def _assets_dir(self, release_id: int) -> Path:
+        return self.release_dir / "assets" / str(release_id)
+
+    def _simulate_request(self, method: str, endpoint: str, num_bytes: int = 0) -> None:
+        """
+        Send a simulated request through the request scheduler, where each attempt
+        is delayed by the configured latency (plus the transfer of `num_bytes` at the
+        configured bandwidth), then rejected at the configured rate limit rate or
+        failed at the configured failure rate
+
+        :raises HTTPError: When a failure is injected, or the request is still rate
+            limited once the scheduler gave up retrying it
+        """
+
+        def send_request() -> Response:
+            with self._lock:
+                delay = self.latency * self._random.uniform(0.5, 1.5)
+                if self.bandwidth > 0:
+                    delay += num_bytes / self.bandwidth
+                is_failure = self._random.random() < self.failure_rate
+                is_rate_limited = self._random.random() < self.rate_limit_rate
+
+            if delay > 0:
+                time.sleep(delay)
+
+            if is_failure:
+                return self._make_response(endpoint, 503, "Service Unavailable")
+
+            if is_rate_limited:
+                return self._make_response(
+                    endpoint,
+                    429,
+                    "Too Many Requests",
+                    headers={"Retry-After": str(self.RATE_LIMIT_RETRY_AFTER)},
+                )
+
+            return self._make_response(endpoint, 200, "OK")
+
+        response = self.scheduler.send(self.hvcs_domain.host or "", send_request)
+        if response.status_code >= 400:
+            self._raise_http_error(
+                method, endpoint, response.status_code, response.reason
+            )
+
+    def _make_response(
+        self,
+        endpoint: str,
+        status_code: int,
+        reason: str,
+        headers: dict[str, str] | None = None,
+    ) -> Response:
+        response = Response()
+        response.status_code = status_code
+        response.reason = reason
+        response.url = self.create_api_url(endpoint=endpoint)
+        response.headers.update(headers or {})
+        response.raw = BytesIO()
+        return response
+
+    def _raise_http_error(
+        self, method: str, endpoint: str, status_code: int, reason: str
+    ) -> NoReturn:
+        response = self._make_response(endpoint, status_code, reason)
+        raise HTTPError(
+            f"{status_code} {reason} for {method} {response.url}", response=response
+        )
+
+    def _read_releases(self) -> dict[str, dict[str, Any]]:
+        if not self.index_file.exists():
+            return {}
+
+        return json.loads(self.index_file.read_text(encoding="utf-8"))
+
+    def _write_releases(self, releases: dict[str, dict[str, Any]]) -> None:
+        self.release_dir.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(
+            self.index_file, json.dumps(releases, indent=2), encoding="utf-8"
+        )
+
+    def _get_release(
+        self, releases: dict[str, dict[str, Any]], release_id: int
+    ) -> dict[str, Any]:
+        """
+        Get a release from the index of releases
+
+        :raises HTTPError: When the release does not exist (404 Not Found)
+        """
+        if (release := releases.get(str(release_id))) is None:
+            self._raise_http_error("GET", f"/releases/{release_id}", 404, "Not Found")
+        return release
+
+    @logged_function(log)
+    def create_release(
+        self,
+        tag: str,
+        release_notes: str,
+        prerelease: bool = False,
+        assets: list[str] | None = None,
+        noop: bool = False,
+    ) -> int:
+        """
+        Create a new release
+
+        :param tag: Tag to create release for
+        :param release_notes: The release notes for this version
+        :param prerelease: Whether or not this release should be created as a prerelease
+        :param assets: a list of artifacts to upload to the release
+
+        :return: the ID of the release
+        """
+        if noop:
+            noop_report(
+                str.join(
+                    " ",
+                    [
+                        f"would have created a release for tag {tag}",
+                        "with the following notes:\n",
+                        release_notes,
+                    ],
+                )
+            )
+            if assets:
+                noop_report(
+                    str.join(
+                        "\n",
+                        [
+                            "would have uploaded the following assets to the release:",
+                            *assets,
+                        ],
+                    )
+                )
+            return -1
+
+        log.info("Creating release for tag %s", tag)
+        self._simulate_request("POST", "/releases")
+
+        with self._lock:
+            releases = self._read_releases()
+            if any(release["tag_name"] == tag for release in releases.values()):
+                # Like the remote VCS APIs, a tag can only have one release
+                self._raise_http_error("POST", "/releases", 422, "Unprocessable Entity")
+
+            release_id = max(map(int, releases), default=0) + 1
+            releases[str(release_id)] = {
+                "id": release_id,
+                "tag_name": tag,
+                "name": tag,
+                "body": release_notes,
+                "prerelease": prerelease,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "assets": [],
+            }
+            self._write_releases(releases)
+
+        log.info("Successfully created release with ID: %s", release_id)
+
+        def upload_asset(asset: str) -> bool:
+            log.info("Uploading asset %s", asset)
+            return self.upload_release_asset(release_id, asset)
+
+        errors = [
+            AssetUploadError(f"Failed asset upload for {asset}").with_traceback(
+                err.__traceback__
+            )
+            for asset, err in self._upload_assets_concurrently(
+                upload_asset, assets or []
+            )
+        ]
+
+        if len(errors) < 1:
+            return release_id
+
+        for error in errors:
+            log.exception(error)
+
+        raise IncompleteReleaseError(
+            f"Failed to upload asset{'s' if len(errors) > 1 else ''} to release!"
+        )
+
+    @logged_function(log)
+    def get_release_id_by_tag(self, tag: str) -> int | None:
+        """
+        Get a release by its tag name
+
+        :param tag: Tag to get release for
+
+        :return: ID of found release
+        """
+        self._simulate_request("GET", f"/releases/tags/{tag}")
+        return next(
+            (
+                release["id"]
+                for release in self._read_releases().values()
+                if release["tag_name"] == tag
+            ),
+            None,
+        )
+
+    @logged_function(log)
+    def edit_release_notes(self, release_id: int, release_notes: str) -> int:
+        """
+        Edit a release with updated change notes
+
+        :param release_id: ID of release to update
+        :param release_notes: The release notes for this version
+
+        :return: The ID of the release that was edited
+        """
+        log.info("Updating release %s", release_id)
+        self._simulate_request("PATCH", f"/releases/{release_id}")
+
+        with self._lock:
+            releases = self._read_releases()
+            self._get_release(releases, release_id)["body"] = release_notes
+            self._write_releases(releases)
+
+        return release_id
+
+    @logged_function(log)
+    def create_or_update_release(
+        self, tag: str, release_notes: str, prerelease: bool = False
+    ) -> int:
+        """
+        Post release changelog
+
+        :param tag: The tag of the release
+        :param release_notes: The release notes for this version
+        :param prerelease: Whether or not this release should be created as a prerelease
+
+        :return: The ID of the release that was created or updated
+        """
+        log.info("Creating release for %s", tag)
+        try:
+            return self.create_release(tag, release_notes, prerelease)
+        except HTTPError as err:
+            log.debug("error creating release: %s", err)
+            log.debug("looking for an existing release to update")
+
+        release_id = self.get_release_id_by_tag(tag)
+        if release_id is None:
+            raise ValueError(
+                f"release id for tag {tag} not found, and could not be created"
+            )
+
+        # If this errors we let it die
+        log.debug("Found existing release %s, updating", release_id)
+        return self.edit_release_notes(release_id, release_notes)
+
+    @logged_function(log)
+    def upload_release_asset(
+        self,
+        release_id: int,
+        file: str,
+        label: str | None = None,  # noqa: ARG002
+    ) -> bool:
+        """
+        Copy an asset into the assets directory of an existing release
+
+        :param release_id: ID of the release to upload to
+        :param file: Path of the file to upload
+        :param label: this parameter has no effect
+
+        :return: The status of the request
+        """
+        name = os.path.basename(file)
+        self._simulate_request(
+            "POST",
+            f"/releases/{release_id}/assets?name={name}",
+            num_bytes=os.path.getsize(file),
+        )
+        self._get_release(self._read_releases(), release_id)
+
+        assets_dir = self._assets_dir(release_id)
+        assets_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(file, assets_dir / name)
+
+        with self._lock:
+            releases = self._read_releases()
+            release = self._get_release(releases, release_id)
+            release_assets = [
+                asset for asset in release["assets"] if asset["name"] != name
+            ]
+            release["assets"] = [
+                *release_assets,
+                {
+                    "id": max((asset["id"] for asset in release_assets), default=0) + 1,
+                    "name": name,
+                    "size": os.path.getsize(file),
+                    "digest": f"sha256:{file_sha256(file)}",
+                },
+            ]
+            self._write_releases(releases)
+
+        log.info("Successfully uploaded %s to %s", file, assets_dir)
+        return True
+
+    @logged_function(log)
+    def get_release_assets(self, release_id: int) -> dict[str, ReleaseAsset]:
+        """
+        Get the assets attached to a release
+
+        :param release_id: ID of the release to list the assets of
+
+        :return: The assets of the release by name
+        """
+        self._simulate_request("GET", f"/releases/{release_id}/assets")
+        return {
+            asset["name"]: ReleaseAsset(
+                id=asset["id"],
+                name=asset["name"],
+                size=asset["size"],
+                digest=asset["digest"],
+            )
+            for asset in self._get_release(self._read_releases(), release_id)["assets"]
+        }
+
+    @logged_function(log)
+    def delete_release_asset(self, release_id: int, asset_id: int) -> None:
+        """
+        Delete an asset from a release
+
+        :param release_id: ID of the release the asset is attached to
+        :param asset_id: ID of the asset to delete
+        """
+        self._simulate_request("DELETE", f"/releases/{release_id}/assets/{asset_id}")
+
+        with self._lock:
+            releases = self._read_releases()
+            release = self._get_release(releases, release_id)
+            release_assets = release["assets"]
+            remaining_assets = [
+                asset for asset in release_assets if asset["id"] != asset_id
+            ]
+            if len(remaining_assets) == len(release_assets):
+                self._raise_http_error(
+                    "DELETE",
+                    f"/releases/{release_id}/assets/{asset_id}",
+                    404,
+                    "Not Found",
+                )
+
+            release["assets"] = remaining_assets
+            self._write_releases(releases)
+
+        for asset in release_assets:
+            if asset["id"] == asset_id:
+                self._assets_dir(release_id).joinpath(asset["name"]).unlink(
+                    missing_ok=True
+                )
+
+    @logged_function(log)
+    def upload_dists(self, tag: str, dist_glob: str) -> int:
+        """
+        Upload distributions to a release
+
+        :param tag: Tag to upload for
+        :param dist_glob: Glob of the distributions to upload
+
+        :return: The number of distributions successfully uploaded or already attached
+        """
+        # Find the release corresponding to this tag
+        release_id = self.get_release_id_by_tag(tag=tag)
+        if not release_id:
+            log.warning("No release corresponds to tag %s, can't upload dists", tag)
+            return 0
+
+        # Upload the assets which are not already attached to the release
+        file_paths = [
+            f for f in glob.glob(dist_glob, recursive=True) if os.path.isfile(f)
+        ]
+        return self._upload_missing_assets(release_id, file_paths)
+
+    def remote_url(self, use_token: bool = True) -> str:  # noqa: ARG002
+        """Get the git remote url, there is no server to authenticate to"""
+        return self._remote_url
+
+    def compare_url(self, from_rev: str, to_rev: str) -> str:
+        return self.create_repo_url(repo_path=f"/compare/{from_rev}...{to_rev}")
+
+    def commit_hash_url(self, commit_hash: str) -> str:
+        return self.create_repo_url(repo_path=f"/commit/{commit_hash}")
+
+    def issue_url(self, issue_num: str | int) -> str:
+        # Strips off any character prefix like '#' that usually exists
+        if isinstance(issue_num, str) and (
+            match := regexp(r"(\d+)$").search(issue_num)
+        ):
+            try:
+                issue_num = int(match.group(1))
+            except ValueError:
+                return ""
+
+        if isinstance(issue_num, int):
+            return self.create_repo_url(repo_path=f"/issues/{issue_num}")
+
+        return ""
+
+    def pull_request_url(self, pr_number: str | int) -> str:
+        # Strips off any character prefix like '#' that usually exists
+        if isinstance(pr_number, str) and (
+            match := regexp(r"(\d+)$").search(pr_number)
+        ):
+            try:
+                pr_number = int(match.group(1))
+            except ValueError:
+                return ""
+
+        if isinstance(pr_number, int):
+            return self.create_repo_url(repo_path=f"/pulls/{pr_number}")
+
+        return ""
+
+    def create_release_url(self, tag: str = "") -> str:
+        tag_str = tag.strip()
+        tag_path = f"tag/{tag_str}" if tag_str else ""
+        return self.create_repo_url(repo_path=f"releases/{tag_path}")
+
+    @staticmethod
+    def format_w_official_vcs_name(format_str: str) -> str:
+        if "%s" in format_str:
+            return format_str % Local.OFFICIAL_NAME
+
+        if "{}" in format_str:
+            return format_str.format(Local.OFFICIAL_NAME)
+
+        if "{vcs_name}" in format_str:
+            return format_str.format(vcs_name=Local.OFFICIAL_NAME)
+
+        return format_str
+
+    def get_changelog_context_filters(self) -> tuple[Callable[..., Any], ...]:
+        return (
+            self.create_server_url,
+            self.create_repo_url,
+            self.commit_hash_url,
+            self.compare_url,
+            self.issue_url,
+            self.pull_request_url,
+            self.create_release_url,
+            self.format_w_official_vcs_name,
+        )
+
+
+RemoteHvcsBase.register(Local)
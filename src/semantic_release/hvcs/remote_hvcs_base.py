@@ -3,22 +3,67 @@
 from __future__ import annotations
 
 import logging
+import os
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import PurePosixPath
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
+from requests import HTTPError
 from urllib3.util.url import Url, parse_url
 
+from semantic_release.cli.util import noop_report
+from semantic_release.helpers import file_sha256, run_ordered_in_pool
 from semantic_release.hvcs import HvcsBase
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Any
+    from typing import Any, Callable, Sequence
 
 
 # Globals
 logger = logging.getLogger(__name__)
 
 
+class ReleaseAsset(NamedTuple):
+    """An asset which is already attached to a release of the remote VCS"""
+
+    id: int
+    name: str
+    size: int
+    digest: str | None = None
+    """The ``<algorithm>:<hex digest>`` of the content, when exposed by the API"""
+
+    def matches_file(self, file: str) -> bool:
+        """Check if the asset has the same size (and digest if known) as the file"""
+        if self.size != os.path.getsize(file):
+            return False
+
+        algorithm, _, hex_digest = str.partition(self.digest or "", ":")
+        if algorithm != "sha256":
+            return True
+
+        return hex_digest == file_sha256(file)
+
+
+class RemoteReleaseJob(NamedTuple):
+    """The remote work to publish the release of one tag"""
+
+    tag: str
+    release_notes: str
+    prerelease: bool = False
+    assets: list[str] | None = None
+    update_existing: bool = False
+    """Update the notes of the release if it already exists, instead of creating it"""
+
+
+class RemoteReleaseResult(NamedTuple):
+    """The outcome of a `RemoteReleaseJob`"""
+
+    tag: str
+    release_id: int | str | None = None
+    error: Exception | None = None
+
+
 class RemoteHvcsBase(HvcsBase, metaclass=ABCMeta):
     """
     Interface for subclasses interacting with a remote VCS
@@ -33,11 +78,14 @@ class RemoteHvcsBase(HvcsBase, metaclass=ABCMeta):
     """
 
     DEFAULT_ENV_TOKEN_NAME = "HVCS_TOKEN"  # noqa: S105
+    DEFAULT_MAX_UPLOAD_WORKERS = 4
+    DEFAULT_MAX_RELEASE_JOBS = 4
 
     def __init__(self, remote_url: str, *_args: Any, **_kwargs: Any) -> None:
         super().__init__(remote_url)
         self._hvcs_domain: Url | None = None
         self._api_url: Url | None = None
+        self.max_upload_workers = self.DEFAULT_MAX_UPLOAD_WORKERS
 
     @property
     def hvcs_domain(self) -> Url:
@@ -51,6 +99,180 @@ class RemoteHvcsBase(HvcsBase, metaclass=ABCMeta):
             raise RuntimeError("Property 'api_url' was used before it was set!")
         return self._api_url
 
+    def _upload_assets_concurrently(
+        self, upload_asset: Callable[[str], Any], files: Sequence[str]
+    ) -> list[tuple[str, HTTPError]]:
+        """
+        Upload the files with `upload_asset` on a thread pool of at most
+        `max_upload_workers` threads, which share the client's session.
+
+        Failed uploads are collected instead of stopping the other uploads, while
+        any other error is raised once all of the uploads are done (the error of
+        the first failing file, in the given order).
+
+        :returns: The files which failed to upload with their error, in the given order
+        """
+        if len(files) < 2 or self.max_upload_workers == 1:
+            failures = []
+            for file in files:
+                try:
+                    upload_asset(file)
+                except HTTPError as err:  # noqa: PERF203
+                    failures.append((file, err))
+            return failures
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_upload_workers, thread_name_prefix="psr-upload"
+        ) as executor:
+            futures = [executor.submit(upload_asset, file) for file in files]
+
+        failures = []
+        for file, future in zip(files, futures):
+            if isinstance(upload_err := future.exception(), HTTPError):
+                failures.append((file, upload_err))
+            elif upload_err is not None:
+                raise upload_err
+
+        return failures
+
+    def _upload_missing_assets(self, release_id: int, files: Sequence[str]) -> int:
+        """
+        Upload the files which are not already attached to the release, so that
+        re-running a partially failed upload only uploads what is missing.
+
+        The assets of the release are fetched once and compared with each file by
+        name, size and digest (when the API exposes it). A file which matches an
+        asset is skipped, while an asset with the same name but another content is
+        replaced by the file.
+
+        :returns: The number of files which are attached to the release afterwards
+        """
+        try:
+            existing_assets = self.get_release_assets(release_id)
+        except HTTPError as err:
+            logger.warning(
+                "unable to list the assets of release %s, uploading all files: %s",
+                release_id,
+                err,
+            )
+            existing_assets = {}
+
+        files_to_upload = []
+        for file in files:
+            asset = existing_assets.get(os.path.basename(file))
+            if asset is not None and asset.matches_file(file):
+                logger.info("Skipping asset %s, already attached to the release", file)
+                continue
+            files_to_upload.append(file)
+
+        def upload_asset(file: str) -> bool:
+            if (outdated := existing_assets.get(os.path.basename(file))) is not None:
+                logger.info("Replacing outdated asset %s", outdated.name)
+                self.delete_release_asset(release_id, outdated.id)
+            return self.upload_release_asset(release_id, file)
+
+        failures = self._upload_assets_concurrently(upload_asset, files_to_upload)
+        for file, upload_err in failures:
+            logger.error("error uploading asset %s", file, exc_info=upload_err)
+
+        return len(files) - len(failures)
+
+    def _publish_release(
+        self, job: RemoteReleaseJob, noop: bool = False
+    ) -> RemoteReleaseResult:
+        """Publish the release of a single `RemoteReleaseJob`, with its assets"""
+        if not job.update_existing:
+            release_id = self.create_release(
+                job.tag,
+                job.release_notes,
+                prerelease=job.prerelease,
+                assets=job.assets,
+                noop=noop,
+            )
+            return RemoteReleaseResult(job.tag, release_id)
+
+        if noop:
+            noop_report(f"would have created or updated the release for tag {job.tag}")
+            return RemoteReleaseResult(job.tag, -1)
+
+        release_id = self.create_or_update_release(
+            job.tag, job.release_notes, prerelease=job.prerelease
+        )
+        if not job.assets:
+            return RemoteReleaseResult(job.tag, release_id)
+
+        if isinstance(release_id, int):
+            self._upload_missing_assets(release_id, job.assets)
+        else:
+            logger.warning(
+                "Not uploading the assets of the release for tag %s, %s did "
+                "not report a release id to attach them to",
+                job.tag,
+                self.__class__.__name__,
+            )
+
+        return RemoteReleaseResult(job.tag, release_id)
+
+    def publish_releases(
+        self,
+        jobs: Sequence[RemoteReleaseJob],
+        noop: bool = False,
+        max_concurrent_jobs: int = DEFAULT_MAX_RELEASE_JOBS,
+    ) -> list[RemoteReleaseResult]:
+        """
+        Publish the releases of many tags at the same time, on a thread pool where
+        at most `max_concurrent_jobs` releases (with their asset uploads) are in
+        progress. The threads share the connection pool of the client's session.
+
+        Only the jobs overlap with each other: within a job, the assets are uploaded
+        once the release exists as the uploads need its id. The tags must already
+        be pushed to the remote, pushing is not part of the jobs.
+
+        A failing job does not stop the other jobs, its error is returned in its
+        result instead.
+
+        :returns: The result of each job, in the given order
+        """
+
+        def publish_or_capture(job: RemoteReleaseJob) -> RemoteReleaseResult:
+            try:
+                return self._publish_release(job, noop=noop)
+            except Exception as err:  # noqa: BLE001
+                return RemoteReleaseResult(job.tag, error=err)
+
+        return run_ordered_in_pool(
+            publish_or_capture,
+            jobs,
+            max_workers=max_concurrent_jobs,
+            thread_name_prefix="psr-release",
+        )
+
+    def get_release_assets(
+        self,
+        release_id: int,  # noqa: ARG002
+    ) -> dict[str, ReleaseAsset]:
+        """Get the assets attached to a release by name, if supported"""
+        self._not_supported(self.get_release_assets.__name__)
+        return {}
+
+    def delete_release_asset(
+        self,
+        release_id: int,  # noqa: ARG002
+        asset_id: int,  # noqa: ARG002
+    ) -> None:
+        """Delete an asset from a release, if supported"""
+        self._not_supported(self.delete_release_asset.__name__)
+
+    def upload_release_asset(
+        self,
+        release_id: int,  # noqa: ARG002
+        file: str,  # noqa: ARG002
+        label: str | None = None,  # noqa: ARG002
+    ) -> bool:
+        """Upload an asset to an existing release, if supported"""
+        self._not_supported(self.upload_release_asset.__name__)
+        return False
+
     @abstractmethod
     def upload_dists(self, tag: str, dist_glob: str) -> int:
         """
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import logging
-from functools import wraps
-from typing import TYPE_CHECKING, Any, Callable, TypeVar
+import threading
+import time
+from functools import lru_cache, wraps
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, TypeVar
+from urllib.parse import urlsplit
 
 from requests import HTTPError, Session
-from requests.adapters import HTTPAdapter
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry  # type: ignore[import]
 
 if TYPE_CHECKING:  # pragma: no cover
+    from requests import PreparedRequest, Response
+
     from semantic_release.hvcs.token_auth import TokenAuth
 
 logger = logging.getLogger(__name__)
@@ -18,6 +23,9 @@ def build_requests_session(
     raise_for_status: bool = True,
     retry: bool | int | Retry = True,
     auth: TokenAuth | None = None,
+    pool_maxsize: int = DEFAULT_POOLSIZE,
+    scheduler: RequestScheduler | None = None,
+    retry_rate_limited: bool = True,
 ) -> Session:
     """
     Create a requests session.
@@ -25,9 +33,18 @@ def build_requests_session(
     :param raise_for_status: If True, a hook to invoke raise_for_status be installed
     :param retry: If true, it will use default Retry configuration. if an integer, it
         will use default Retry configuration with given integer as total retry
-        count. if Retry instance, it will use this instance.
+        count. if Retry instance, it will use this instance. The default
+        configuration only retries failed connections & reads, the responses which
+        ask to retry later (i.e. 429 with ``Retry-After``) are left to the scheduler
     :param auth: Optional TokenAuth instance to be used to provide the Authorization
         header to the session
+    :param pool_maxsize: The maximum number of connections kept open per host, which
+        should be at least the number of threads sharing the session
+    :param scheduler: The scheduler which paces the requests of the session, the
+        scheduler shared by all of the sessions is used when not provided
+    :param retry_rate_limited: If False, the scheduler still paces the requests but
+        does not send the requests rejected by the rate limit again, for clients
+        which already retry them
 
     :return: configured requests Session
     """
@@ -36,15 +53,23 @@ def build_requests_session(
         session.hooks = {"response": [lambda r, *_, **__: r.raise_for_status()]}
 
     if retry:
+        # urllib3 would otherwise sleep through a Retry-After itself, without the
+        # scheduler knowing about the rate limit while holding a slot of the host
         if isinstance(retry, bool):
-            retry = Retry()
+            retry = Retry(status=0, respect_retry_after_header=False)
         elif isinstance(retry, int):
-            retry = Retry(retry)
+            retry = Retry(retry, status=0, respect_retry_after_header=False)
         elif not isinstance(retry, Retry):
             raise ValueError("retry should be a bool, int or Retry instance.")
-        adapter = HTTPAdapter(max_retries=retry)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
+
+    adapter = ScheduledHTTPAdapter(
+        scheduler=scheduler or get_request_scheduler(),
+        retry_rate_limited=retry_rate_limited,
+        max_retries=retry or 0,
+        pool_maxsize=pool_maxsize,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
 
     if auth:
         logger.debug("setting up default session authentication")
@@ -88,3 +113,276 @@ def suppress_http_error_for_codes(
 
 
 suppress_not_found = suppress_http_error_for_codes(404)
+
+
+class RateLimitGate:
+    """
+    Track the rate limit reported by the responses of a remote VCS API, so that
+    callers sharing a session can hold off their requests until the limit resets.
+
+    The gate observes the ``Retry-After`` header and the (``X-``)``RateLimit-Remaining``
+    & (``X-``)``RateLimit-Reset`` headers sent by GitHub, Gitea & GitLab. The
+    `RequestScheduler` keeps one gate per host and feeds it every response.
+    """
+
+    def __init__(self, default_wait: float = 60.0, max_wait: float = 900.0) -> None:
+        self.default_wait = default_wait
+        self.max_wait = max_wait
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def is_limited(self) -> bool:
+        return self._resume_at > time.monotonic()
+
+    def observe(self, response: Response, *_args: Any, **_kwargs: Any) -> None:
+        headers = response.headers
+        remaining = headers.get(
+            "X-RateLimit-Remaining", headers.get("RateLimit-Remaining")
+        )
+        reset = headers.get("X-RateLimit-Reset", headers.get("RateLimit-Reset"))
+        retry_after = headers.get("Retry-After")
+
+        if retry_after is not None and retry_after.isdigit():
+            wait = float(retry_after)
+        elif remaining == "0" and reset is not None and reset.isdigit():
+            # The reset header is an epoch timestamp, with a second of leeway for clock skew
+            wait = int(reset) - time.time() + 1
+        elif response.status_code == 429:
+            wait = self.default_wait
+        else:
+            return
+
+        wait = min(max(wait, 0.0), self.max_wait)
+        logger.warning("API rate limit reached, holding off requests for %.0fs", wait)
+
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + wait)
+
+    def wait(self) -> float:
+        """
+        Block until the rate limit observed so far has been reset
+
+        :returns: The number of seconds spent waiting
+        """
+        waited = 0.0
+        while (delay := self._resume_at - time.monotonic()) > 0:
+            time.sleep(delay)
+            waited += delay
+        return waited
+
+
+class RemoteReleaseCache:
+    """
+    Cache the release objects of the remote VCS by their API url for a single run of
+    the command line, so that the many calls made while creating a release, updating
+    its notes & uploading its assets share the same release instead of fetching it
+    again each time. One cache is shared by all of the clients, see
+    `get_remote_release_cache()`.
+
+    Any response read through `get_json()` is kept with its ``ETag``, so reading it
+    again is a conditional request which the server answers with a bodiless
+    ``304 Not Modified`` while the resource is unchanged. Lookups which must see
+    changes made by others, like finding a release by its tag, always go through
+    `get_json()`.
+    """
+
+    def __init__(self) -> None:
+        self._releases: dict[str, dict[str, Any]] = {}
+        self._responses: dict[str, tuple[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, release_url: str) -> dict[str, Any] | None:
+        with self._lock:
+            return self._releases.get(release_url)
+
+    def set(self, release_url: str, release: Any) -> None:
+        """Cache the release object at the url, ignoring anything but a JSON object"""
+        if not isinstance(release, dict):
+            return
+
+        with self._lock:
+            self._releases[release_url] = release
+
+    def get_json(self, session: Session, url: str) -> Any:
+        """
+        GET the JSON document at `url`, revalidating the previous response of the
+        same url with ``If-None-Match`` when it came with an ``ETag``.
+
+        :raises HTTPError: When the request was not successful
+        :raises JSONDecodeError: When the response is not a JSON document
+        """
+        with self._lock:
+            etag, cached_json = self._responses.get(url, ("", None))
+
+        response = session.get(url, headers={"If-None-Match": etag} if etag else None)
+
+        if response.status_code == 304 and etag:
+            logger.debug("%s is unchanged since the last request", url)
+            return cached_json
+
+        # Raise an error if the request was not successful
+        response.raise_for_status()
+        data = response.json()
+
+        if etag := response.headers.get("ETag", ""):
+            with self._lock:
+                self._responses[url] = (etag, data)
+
+        return data
+
+
+class RequestSchedulerStats(NamedTuple):
+    requests: int
+    """The number of requests sent"""
+    throttled_requests: int
+    """The number of requests which were held off by a rate limit"""
+    throttled_seconds: float
+    """The total time requests were held off by a rate limit"""
+
+
+class RequestScheduler:
+    """
+    Pace the requests sent to remote VCS APIs by host, so that the clients of
+    many threads (or many clients) sharing a scheduler respect the rate limits of
+    the server instead of retrying blindly.
+
+    For each host, at most `max_requests_per_host` requests are in flight at the
+    same time, and a `RateLimitGate` holds off new requests until the rate limit
+    reported by the previous responses resets. A response rejected because of the
+    rate limit (429, or 403 with a rate limit header) is sent again once the limit
+    resets, up to `max_rate_limit_retries` times.
+    """
+
+    def __init__(
+        self,
+        max_requests_per_host: int = 8,
+        max_rate_limit_retries: int = 3,
+        max_wait: float = 900.0,
+    ) -> None:
+        self.max_requests_per_host = max_requests_per_host
+        self.max_rate_limit_retries = max_rate_limit_retries
+        self.max_wait = max_wait
+        self._hosts: dict[str, tuple[threading.BoundedSemaphore, RateLimitGate]] = {}
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._throttled_requests = 0
+        self._throttled_seconds = 0.0
+
+    @property
+    def stats(self) -> RequestSchedulerStats:
+        with self._lock:
+            return RequestSchedulerStats(
+                requests=self._requests,
+                throttled_requests=self._throttled_requests,
+                throttled_seconds=self._throttled_seconds,
+            )
+
+    def log_stats(self) -> None:
+        """Log a summary of the requests sent so far, if any"""
+        if not (stats := self.stats).requests:
+            return
+
+        logger.debug(
+            "sent %s requests to remote VCS APIs, %s of them were held off by a "
+            "rate limit for %.1fs in total",
+            stats.requests,
+            stats.throttled_requests,
+            stats.throttled_seconds,
+        )
+
+    @staticmethod
+    def is_rate_limited(response: Response) -> bool:
+        """Check if the server rejected the request because of its rate limit"""
+        if response.status_code == 429:
+            return True
+
+        headers = response.headers
+        return response.status_code == 403 and (
+            "Retry-After" in headers
+            or headers.get("X-RateLimit-Remaining", headers.get("RateLimit-Remaining"))
+            == "0"
+        )
+
+    def _get_host(self, host: str) -> tuple[threading.BoundedSemaphore, RateLimitGate]:
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = (
+                    threading.BoundedSemaphore(self.max_requests_per_host),
+                    RateLimitGate(max_wait=self.max_wait),
+                )
+            return self._hosts[host]
+
+    def send(
+        self,
+        host: str,
+        send_request: Callable[[], Response],
+        retry_rate_limited: bool = True,
+    ) -> Response:
+        """
+        Send a request to `host` once the scheduler allows it
+
+        :param send_request: Sends the request & returns its response, it is called
+            again when the response was rejected because of the rate limit
+        :param retry_rate_limited: If False, a response rejected because of the rate
+            limit is returned as is, the limit still holds off the next requests
+        """
+        slot, rate_limit = self._get_host(host)
+        max_retries = self.max_rate_limit_retries if retry_rate_limited else 0
+
+        for attempt in range(max_retries + 1):
+            if (waited := rate_limit.wait()) > 0:
+                with self._lock:
+                    self._throttled_requests += 1
+                    self._throttled_seconds += waited
+
+            with slot:
+                response = send_request()
+
+            with self._lock:
+                self._requests += 1
+
+            rate_limit.observe(response)
+
+            if attempt == max_retries or not self.is_rate_limited(response):
+                break
+
+            logger.info("request to %s was rate limited, retrying", host)
+            response.close()
+
+        return response
+
+
+@lru_cache(maxsize=1)
+def get_request_scheduler() -> RequestScheduler:
+    """Get the scheduler shared by all of the sessions of the remote VCS clients"""
+    return RequestScheduler()
+
+
+@lru_cache(maxsize=1)
+def get_remote_release_cache() -> RemoteReleaseCache:
+    """Get the release cache shared by all of the remote VCS clients"""
+    return RemoteReleaseCache()
+
+
+class ScheduledHTTPAdapter(HTTPAdapter):
+    """A transport adapter which sends every request through a `RequestScheduler`"""
+
+    def __init__(
+        self,
+        scheduler: RequestScheduler,
+        retry_rate_limited: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        self.scheduler = scheduler
+        self.retry_rate_limited = retry_rate_limited
+        super().__init__(**kwargs)
+
+    def send(  # type: ignore[override]
+        self, request: PreparedRequest, *args: Any, **kwargs: Any
+    ) -> Response:
+        return self.scheduler.send(
+            urlsplit(request.url or "").netloc,
+            lambda: super(ScheduledHTTPAdapter, self).send(request, *args, **kwargs),
+            retry_rate_limited=self.retry_rate_limited,
+        )
@@ -10,10 +10,13 @@ from re import (
 )
 from typing import TYPE_CHECKING
 
-from deprecated.sphinx import deprecated
-
 from semantic_release.cli.util import noop_report
 from semantic_release.const import SEMVER_REGEX
+from semantic_release.helpers import (
+    atomic_write_text,
+    find_files_w_pattern,
+    has_glob_pattern,
+)
 from semantic_release.version.declarations.enum import VersionStampType
 from semantic_release.version.declarations.i_version_replacer import IVersionReplacer
 from semantic_release.version.version import Version
@@ -87,15 +90,20 @@ class PatternVersionDeclaration(IVersionReplacer):
 
         return self._content
 
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content = value
+
     @content.deleter
     def content(self) -> None:
         self._content = None
 
-    @deprecated(
-        version="9.20.0",
-        reason="Function is unused and will be removed in a future release",
-    )
-    def parse(self) -> set[Version]:  # pragma: no cover
+    @property
+    def path(self) -> Path:
+        """The resolved path of the configured source file."""
+        return self._path
+
+    def parse(self) -> set[Version]:
         """
         Return the versions matching this pattern.
         Because a pattern can match in multiple places, this method returns a
@@ -104,10 +112,19 @@ class PatternVersionDeclaration(IVersionReplacer):
         should be the same version in each place), but it falls on the caller
         to check for this condition.
         """
-        versions = {
-            Version.parse(m.group(self._VERSION_GROUP_NAME))
+        version_strs = (
+            m.group(self._VERSION_GROUP_NAME)
             for m in self._search_pattern.finditer(self.content)
-        }
+        )
+        if self._stamp_format == VersionStampType.TAG_FORMAT:
+            # Strip the tag format prefix & suffix from around the version number
+            version_strs = (
+                semver_match.group(0)
+                for version_str in version_strs
+                if (semver_match := SEMVER_REGEX.search(version_str))
+            )
+
+        versions = {Version.parse(version_str) for version_str in version_strs}
 
         log.debug(
             "Parsing current version: path=%r pattern=%r num_matches=%s",
@@ -167,7 +184,7 @@ class PatternVersionDeclaration(IVersionReplacer):
         if new_content == self.content:
             return None
 
-        self._path.write_text(new_content)
+        atomic_write_text(self._path, new_content)
         del self.content
 
         return self._path
@@ -180,6 +197,13 @@ class PatternVersionDeclaration(IVersionReplacer):
         create an instance of self from a string representing one item
         of the "version_variables" list in the configuration
         """
+        return cls(*cls._parse_string_definition(replacement_def, tag_format))
+
+    @classmethod
+    def _parse_string_definition(
+        cls, replacement_def: str, tag_format: str
+    ) -> tuple[str, str, VersionStampType]:
+        """Split & validate a "version_variables" item into the constructor arguments"""
         parts = replacement_def.split(":", maxsplit=2)
 
         if len(parts) <= 1:
@@ -238,4 +262,35 @@ class PatternVersionDeclaration(IVersionReplacer):
             ],
         )
 
-        return cls(path, search_text, stamp_type)
+        return path, search_text, stamp_type
+
+    @classmethod
+    def from_glob_definition(
+        cls,
+        replacement_def: str,
+        tag_format: str,
+        root_dir: Path | str | None = None,
+    ) -> list[PatternVersionDeclaration]:
+        """
+        create instances of self from a string item of the "version_variables" list
+        in the configuration, whose path may be a (recursive ``**``) glob pattern.
+
+        The glob is expanded once and only the files which contain the variable name
+        are kept, so files that could never match are not read or rewritten.
+        A relative glob is expanded from `root_dir` (default: the working directory).
+        """
+        path_glob, search_text, stamp_type = cls._parse_string_definition(
+            replacement_def, tag_format
+        )
+
+        if not has_glob_pattern(path_glob):
+            return [cls(path_glob, search_text, stamp_type)]
+
+        variable = replacement_def.split(":", maxsplit=2)[1]
+
+        return [
+            cls(filepath, search_text, stamp_type)
+            for filepath in find_files_w_pattern(
+                path_glob, regexp(regex_escape(variable).encode()), root_dir=root_dir
+            )
+        ]
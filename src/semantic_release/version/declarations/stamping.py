@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+from functools import partial
+from logging import getLogger
+from typing import TYPE_CHECKING, Union
+
+from semantic_release.errors import InvalidVersion
+from semantic_release.helpers import atomic_write_text, run_ordered_in_pool
+from semantic_release.version.declarations.pattern import PatternVersionDeclaration
+from semantic_release.version.declarations.toml import TomlVersionDeclaration
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+    from typing import Iterable, Sequence
+
+    from semantic_release.version.declarations.i_version_replacer import (
+        IVersionReplacer,
+    )
+    from semantic_release.version.version import Version
+
+
+# globals
+log = getLogger(__name__)
+
+FileVersionReplacer = Union[PatternVersionDeclaration, TomlVersionDeclaration]
+"""Version replacers whose content can be shared with other replacers of the same file"""
+
+
+def group_declarations_by_file(
+    version_declarations: Iterable[IVersionReplacer],
+) -> list[list[IVersionReplacer]]:
+    """
+    Group the declarations which target the same file together, preserving the
+    order in which each file first appears in the declarations.
+
+    Custom `IVersionReplacer` implementations cannot share their file content, so
+    they are always kept in a group of their own.
+    """
+    groups: dict[Path | int, list[IVersionReplacer]] = {}
+
+    for index, declaration in enumerate(version_declarations):
+        group_key = (
+            declaration.path
+            if isinstance(
+                declaration, (PatternVersionDeclaration, TomlVersionDeclaration)
+            )
+            else index
+        )
+        groups.setdefault(group_key, []).append(declaration)
+
+    return list(groups.values())
+
+
+def stamp_version_in_file(
+    declarations: Sequence[IVersionReplacer],
+    new_version: Version,
+    noop: bool = False,
+) -> Path | None:
+    """
+    Apply all the declarations of a single file to its content in memory, so the
+    file is read once and written (atomically) at most once.
+
+    :param declarations: Declarations which all target the same file, as grouped by
+        `group_declarations_by_file()`
+    :param new_version: The new version number as a `Version` instance
+    :param noop: Only report what would be changed instead of writing the file
+
+    :returns: The path of the file if it was (or would be) modified, otherwise None
+    """
+    file_declarations: list[FileVersionReplacer] = [
+        decl
+        for decl in declarations
+        if isinstance(decl, (PatternVersionDeclaration, TomlVersionDeclaration))
+    ]
+
+    if len(declarations) == 1 or len(file_declarations) != len(declarations):
+        modified_paths = [
+            decl.update_file_w_version(new_version=new_version, noop=noop)
+            for decl in declarations
+        ]
+        return next((path for path in modified_paths if path is not None), None)
+
+    file_path = file_declarations[0].path
+
+    if noop:
+        if file_path.exists():
+            shared_content = file_declarations[0].content
+            for decl in file_declarations:
+                decl.content = shared_content
+
+        noop_paths = [
+            decl.update_file_w_version(new_version=new_version, noop=noop)
+            for decl in file_declarations
+        ]
+        for decl in file_declarations:
+            del decl.content
+
+        return next((path for path in noop_paths if path is not None), None)
+
+    original_content = file_declarations[0].content
+    new_content = original_content
+
+    try:
+        for decl in file_declarations:
+            decl.content = new_content
+            new_content = decl.replace(new_version)
+    finally:
+        for decl in file_declarations:
+            del decl.content
+
+    log.debug(
+        "applied %s version declarations to %s in a single pass",
+        len(file_declarations),
+        file_path,
+    )
+
+    if new_content == original_content:
+        return None
+
+    atomic_write_text(file_path, new_content)
+    return file_path
+
+
+def stamp_version_in_files(
+    version_declarations: Iterable[IVersionReplacer],
+    new_version: Version,
+    noop: bool = False,
+    max_workers: int | None = None,
+) -> list[Path]:
+    """
+    Update every configured version declaration with `new_version`, grouping the
+    declarations by file so each file is only read and written once.
+
+    Files are independent of each other, so they are stamped concurrently on a
+    thread pool. Results are collected in declaration order, which means the
+    returned paths and any raised error (the one of the first failing file) are
+    the same regardless of which thread finishes first. In noop mode, files are
+    processed sequentially to keep the report output in order.
+
+    :param max_workers: The maximum number of threads used to stamp files, the
+        default of `ThreadPoolExecutor` is used when not provided
+
+    :returns: The paths of the modified files in the order they were first declared
+    """
+    file_groups = group_declarations_by_file(version_declarations)
+
+    if noop:
+        modified_paths = [
+            stamp_version_in_file(group, new_version=new_version, noop=noop)
+            for group in file_groups
+        ]
+    else:
+        modified_paths = run_ordered_in_pool(
+            partial(stamp_version_in_file, new_version=new_version),
+            file_groups,
+            max_workers=max_workers,
+            thread_name_prefix="psr-stamp",
+        )
+
+    return [path for path in modified_paths if path is not None]
+
+
+def parse_declaration(declaration: IVersionReplacer) -> set[Version] | InvalidVersion:
+    """Parse the current versions of a declaration, returning the error of an invalid one"""
+    try:
+        return declaration.parse()
+    except InvalidVersion as err:
+        return err
+
+
+def read_versions_in_file(
+    declarations: Sequence[IVersionReplacer],
+) -> list[set[Version] | InvalidVersion]:
+    """
+    Parse the current versions of all the declarations of a single file, sharing
+    the file content between them so the file is only read once.
+
+    :param declarations: Declarations which all target the same file, as grouped by
+        `group_declarations_by_file()`
+
+    :returns: The versions found by each declaration, in the order of `declarations`,
+        or the error raised by a declaration whose value is not a valid version
+    """
+    file_declarations: list[FileVersionReplacer] = [
+        decl
+        for decl in declarations
+        if isinstance(decl, (PatternVersionDeclaration, TomlVersionDeclaration))
+    ]
+
+    if len(declarations) == 1 or len(file_declarations) != len(declarations):
+        return [parse_declaration(decl) for decl in declarations]
+
+    shared_content = file_declarations[0].content
+
+    try:
+        for decl in file_declarations:
+            decl.content = shared_content
+        return [parse_declaration(decl) for decl in file_declarations]
+    finally:
+        for decl in file_declarations:
+            del decl.content
+
+
+def read_versions_in_files(
+    version_declarations: Iterable[IVersionReplacer],
+    max_workers: int | None = None,
+) -> list[tuple[IVersionReplacer, set[Version] | InvalidVersion]]:
+    """
+    Parse the current versions of every configured version declaration, reading
+    each file only once and the files concurrently on a thread pool.
+
+    :param max_workers: The maximum number of threads used to read files, the
+        default of `ThreadPoolExecutor` is used when not provided
+
+    :returns: Each declaration paired with the versions it found (or the error of an
+        invalid version), grouped by file in the order the files were first declared
+    """
+    file_groups = group_declarations_by_file(version_declarations)
+
+    versions_per_group = run_ordered_in_pool(
+        read_versions_in_file,
+        file_groups,
+        max_workers=max_workers,
+        thread_name_prefix="psr-verify",
+    )
+
+    return [
+        (decl, versions)
+        for group, group_versions in zip(file_groups, versions_per_group)
+        for decl, versions in zip(group, group_versions)
+    ]
@@ -2,20 +2,96 @@ from __future__ import annotations
 
 from logging import getLogger
 from pathlib import Path
-from typing import Any, Dict, cast
+from re import MULTILINE, compile as regexp, escape as regex_escape
+from typing import TYPE_CHECKING, Any, Dict, cast
 
 import tomlkit
-from deprecated.sphinx import deprecated
 from dotty_dict import Dotty
 
 from semantic_release.cli.util import noop_report
+from semantic_release.const import SEMVER_REGEX
+from semantic_release.helpers import (
+    atomic_write_text,
+    find_files_w_pattern,
+    has_glob_pattern,
+    tomllib,
+)
 from semantic_release.version.declarations.enum import VersionStampType
 from semantic_release.version.declarations.i_version_replacer import IVersionReplacer
 from semantic_release.version.version import Version
 
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Iterator
+
+
 # globals
 log = getLogger(__name__)
 
+_BARE_OR_QUOTED_KEY = r"""(?:[A-Za-z0-9_-]+|"[^"\\\n]*"|'[^'\n]*')"""
+_DOTTED_KEY = rf"{_BARE_OR_QUOTED_KEY}(?:[ \t]*\.[ \t]*{_BARE_OR_QUOTED_KEY})*"
+_SIMPLE_TOML_LINE = regexp(
+    str.join(
+        "|",
+        [
+            # Array of tables header, ex. [[tool.poetry.source]]
+            r"^[ \t]*\[\[(?P<array_table>[^\]\n]*)\]\]",
+            # Table header, ex. [tool.poetry]
+            rf"^[ \t]*\[[ \t]*(?P<table>{_DOTTED_KEY})[ \t]*\]",
+            # Single-line string assignment, ex. version = "1.2.3"
+            str.join(
+                "",
+                [
+                    rf"^[ \t]*(?P<key>{_DOTTED_KEY})[ \t]*=[ \t]*",
+                    r"""(?P<value>"[^"\\\n]*"|'[^'\n]*')""",
+                ],
+            ),
+        ],
+    ),
+    flags=MULTILINE,
+)
+_KEY_PART = regexp(_BARE_OR_QUOTED_KEY)
+_SAFE_BASIC_STRING = regexp(r"""[^"\\\x00-\x1f\x7f]*""")
+
+
+def _split_dotted_key(dotted_key: str) -> list[str]:
+    return [part.strip("\"'") for part in _KEY_PART.findall(dotted_key)]
+
+
+def _iter_simple_assignments(
+    content: str,
+) -> Iterator[tuple[list[str], str, tuple[int, int]]]:
+    """
+    Yield the full key path, unquoted value and value span of each simple single-line
+    string assignment in the TOML text. Keys within arrays of tables are skipped.
+    """
+    table: list[str] | None = []
+    for match in _SIMPLE_TOML_LINE.finditer(content):
+        if match.group("array_table") is not None:
+            table = None
+        elif (table_key := match.group("table")) is not None:
+            table = _split_dotted_key(table_key)
+        elif table is not None:
+            yield (
+                [*table, *_split_dotted_key(match.group("key"))],
+                match.group("value")[1:-1],
+                match.span("value"),
+            )
+
+
+def _get_nested_value(document: dict[str, Any], keys: list[str]) -> Any:
+    value: Any = document
+    for key in keys:
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def _set_nested_value(document: dict[str, Any], keys: list[str], value: Any) -> None:
+    for key in keys[:-1]:
+        document = document[key]
+    document[keys[-1]] = value
+
 
 class TomlVersionDeclaration(IVersionReplacer):
     def __init__(
@@ -39,15 +115,20 @@ class TomlVersionDeclaration(IVersionReplacer):
 
         return self._content
 
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content = value
+
     @content.deleter
     def content(self) -> None:
         self._content = None
 
-    @deprecated(
-        version="9.20.0",
-        reason="Function is unused and will be removed in a future release",
-    )
-    def parse(self) -> set[Version]:  # pragma: no cover
+    @property
+    def path(self) -> Path:
+        """The resolved path of the configured source file."""
+        return self._path
+
+    def parse(self) -> set[Version]:
         """Look for the version in the source content"""
         content = self._load()
         maybe_version: str = content.get(self._search_text)  # type: ignore[return-value]
@@ -57,6 +138,12 @@ class TomlVersionDeclaration(IVersionReplacer):
                 self._search_text,
                 maybe_version,
             )
+            if self._stamp_format == VersionStampType.TAG_FORMAT:
+                # Strip the tag format prefix & suffix from around the version number
+                if not (semver_match := SEMVER_REGEX.search(maybe_version)):
+                    return set()
+                maybe_version = semver_match.group(0)
+
             valid_version = Version.parse(maybe_version)
             return {valid_version} if valid_version else set()
         # Maybe in future raise error if not found?
@@ -66,7 +153,19 @@ class TomlVersionDeclaration(IVersionReplacer):
         """
         Replace the version in the source content with `new_version`, and return the
         updated content.
+
+        When possible, only the span of the existing value is rewritten in the
+        original text, otherwise the whole document is round-tripped through tomlkit.
         """
+        new_version_str = (
+            new_version.as_tag()
+            if self._stamp_format == VersionStampType.TAG_FORMAT
+            else str(new_version)
+        )
+
+        if (new_content := self._splice_version(new_version_str)) is not None:
+            return new_content
+
         content = self._load()
         if self._search_text in content:
             log.info(
@@ -74,11 +173,7 @@ class TomlVersionDeclaration(IVersionReplacer):
                 self._search_text,
                 new_version,
             )
-            content[self._search_text] = (
-                new_version.as_tag()
-                if self._stamp_format == VersionStampType.TAG_FORMAT
-                else str(new_version)
-            )
+            content[self._search_text] = new_version_str
 
         return tomlkit.dumps(cast(Dict[str, Any], content))
 
@@ -86,6 +181,83 @@ class TomlVersionDeclaration(IVersionReplacer):
         """Load the content of the source file into a Dotty for easier searching"""
         return Dotty(tomlkit.loads(self.content))
 
+    def _search_keys(self) -> list[str] | None:
+        """
+        The search text split into its keys, or None if it uses any notation (escaped
+        separators, list indexes) that only the Dotty lookup understands
+        """
+        keys = self._search_text.split(".")
+        if "\\" in self._search_text or any(not k or k.isdigit() for k in keys):
+            return None
+        return keys
+
+    def _contains_search_key(self) -> bool:
+        """Check whether the search key exists in the content, using the fast parser"""
+        if tomllib is None or (keys := self._search_keys()) is None:
+            return self._search_text in self._load()
+
+        try:
+            return _get_nested_value(tomllib.loads(self.content), keys) is not None
+        except tomllib.TOMLDecodeError:
+            return self._search_text in self._load()
+
+    def _splice_version(self, new_version_str: str) -> str | None:
+        """
+        Rewrite only the span of the existing version value in the original text.
+
+        The key is located with a fast read-only parser and a line scan of simple
+        `key = "value"` assignments. The result is verified by parsing it again, so
+        any ambiguous case (multi-line strings, inline tables, duplicated candidates,
+        non-string values, etc.) returns None to fallback to a full tomlkit rewrite.
+        """
+        if (
+            tomllib is None
+            or (keys := self._search_keys()) is None
+            or not _SAFE_BASIC_STRING.fullmatch(new_version_str)
+        ):
+            return None
+
+        try:
+            document = tomllib.loads(self.content)
+        except tomllib.TOMLDecodeError:
+            return None
+
+        current_value = _get_nested_value(document, keys)
+        if current_value is None:
+            # Key does not exist, nothing to replace
+            return self.content
+
+        if not isinstance(current_value, str):
+            return None
+
+        candidate_spans = [
+            value_span
+            for key_path, value, value_span in _iter_simple_assignments(self.content)
+            if key_path == keys and value == current_value
+        ]
+        if len(candidate_spans) != 1:
+            return None
+
+        start, end = candidate_spans[0]
+        new_content = str.join(
+            "", [self.content[:start], f'"{new_version_str}"', self.content[end:]]
+        )
+
+        # Verify that the only change to the document is the expected new version
+        _set_nested_value(document, keys, new_version_str)
+        try:
+            if tomllib.loads(new_content) != document:
+                return None
+        except tomllib.TOMLDecodeError:
+            return None
+
+        log.info(
+            "found %r in source file contents, replacing with %s",
+            self._search_text,
+            new_version_str,
+        )
+        return new_content
+
     def update_file_w_version(
         self, new_version: Version, noop: bool = False
     ) -> Path | None:
@@ -96,7 +268,7 @@ class TomlVersionDeclaration(IVersionReplacer):
                 )
                 return None
 
-            if self._search_text not in self._load():
+            if not self._contains_search_key():
                 noop_report(
                     f"VERSION PATTERN NOT FOUND: no version to stamp in file {self._path!r}",
                 )
@@ -108,7 +280,7 @@ class TomlVersionDeclaration(IVersionReplacer):
         if new_content == self.content:
             return None
 
-        self._path.write_text(new_content)
+        atomic_write_text(self._path, new_content)
         del self.content
 
         return self._path
@@ -119,6 +291,13 @@ class TomlVersionDeclaration(IVersionReplacer):
         create an instance of self from a string representing one item
         of the "version_toml" list in the configuration
         """
+        return cls(*cls._parse_string_definition(replacement_def))
+
+    @classmethod
+    def _parse_string_definition(
+        cls, replacement_def: str
+    ) -> tuple[str, str, VersionStampType]:
+        """Split & validate a "version_toml" item into the constructor arguments"""
         parts = replacement_def.split(":", maxsplit=2)
 
         if len(parts) <= 1:
@@ -145,4 +324,39 @@ class TomlVersionDeclaration(IVersionReplacer):
                 )
             ) from err
 
-        return cls(path, search_text, stamp_type)
+        return path, search_text, stamp_type
+
+    @classmethod
+    def from_glob_definition(
+        cls, replacement_def: str, root_dir: Path | str | None = None
+    ) -> list[TomlVersionDeclaration]:
+        """
+        create instances of self from a string item of the "version_toml" list
+        in the configuration, whose path may be a (recursive ``**``) glob pattern.
+
+        The glob is expanded once and only the files which contain the last key of
+        the search text are kept, so files that could never match are not parsed.
+        A relative glob is expanded from `root_dir` (default: the working directory).
+        """
+        path_glob, search_text, stamp_type = cls._parse_string_definition(
+            replacement_def
+        )
+
+        if not has_glob_pattern(path_glob):
+            return [cls(path_glob, search_text, stamp_type)]
+
+        keys = search_text.split(".")
+        # Keys with escaped separators or list indexes cannot be searched for
+        # literally, so every file that matches the glob has to be parsed
+        key_pattern = (
+            ""
+            if "\\" in search_text or any(not k or k.isdigit() for k in keys)
+            else regex_escape(keys[-1])
+        )
+
+        return [
+            cls(filepath, search_text, stamp_type)
+            for filepath in find_files_w_pattern(
+                path_glob, regexp(key_pattern.encode()), root_dir=root_dir
+            )
+        ]
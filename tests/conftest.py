@@ -16,6 +16,8 @@ from click.testing import CliRunner
 from filelock import FileLock
 from git import Commit, Repo
 
+from semantic_release.hvcs.util import get_remote_release_cache
+
 from tests.const import PROJ_DIR
 from tests.fixtures import *
 from tests.util import copy_dir_tree, remove_dir_tree
@@ -165,6 +167,14 @@ def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item
                 item.add_marker(comprehensive_test_skip_marker)
 
 
+@pytest.fixture(autouse=True)
+def clear_remote_release_cache() -> Generator[None, None, None]:
+    # The cache is shared by the clients of a whole run, which is a single test here
+    get_remote_release_cache.cache_clear()
+    yield
+    get_remote_release_cache.cache_clear()
+
+
 @pytest.fixture
 def cli_runner() -> CliRunner:
     return CliRunner(mix_stderr=False)
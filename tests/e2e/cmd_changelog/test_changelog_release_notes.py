@@ -17,7 +17,7 @@ from tests.fixtures.repos import (
     repo_w_trunk_only_emoji_commits,
     repo_w_trunk_only_scipy_commits,
 )
-from tests.util import assert_successful_exit_code
+from tests.util import assert_exit_code, assert_successful_exit_code
 
 if TYPE_CHECKING:
     from click.testing import CliRunner
@@ -330,3 +330,81 @@ def test_changelog_release_notes_license_change(
     assert expected_prev_release_notes == actual_prev_posted_notes
 
     assert actual_prev_posted_notes != actual_new_posted_notes
+
+
+@pytest.mark.parametrize(
+    "repo_result",
+    [lazy_fixture(repo_w_trunk_only_conventional_commits.__name__)],
+)
+def test_changelog_release_notes_for_tag_range(
+    repo_result: BuiltRepoResult,
+    get_cfg_value_from_def: GetCfgValueFromDefFn,
+    get_versions_from_repo_build_def: GetVersionsFromRepoBuildDefFn,
+    get_hvcs_client_from_repo_def: GetHvcsClientFromRepoDefFn,
+    cli_runner: CliRunner,
+    post_mocker: Mocker,
+    split_repo_actions_by_release_tags: SplitRepoActionsByReleaseTagsFn,
+    generate_default_release_notes_from_def: GenerateDefaultReleaseNotesFromDefFn,
+):
+    # Setup
+    repo_def = repo_result["definition"]
+    tag_format_str: str = get_cfg_value_from_def(repo_def, "tag_format_str")  # type: ignore[assignment]
+    repo_actions_per_version = split_repo_actions_by_release_tags(
+        repo_definition=repo_def,
+        tag_format_str=tag_format_str,
+    )
+    all_versions = get_versions_from_repo_build_def(repo_def)
+    all_tags = [tag_format_str.format(version=version) for version in all_versions]
+
+    expected_release_notes = {
+        tag: generate_default_release_notes_from_def(
+            version_actions=repo_actions_per_version[tag],
+            hvcs=get_hvcs_client_from_repo_def(repo_def),
+            previous_version=Version.parse(all_versions[i - 1]) if i > 0 else None,
+            license_name=EXAMPLE_PROJECT_LICENSE,
+            mask_initial_release=get_cfg_value_from_def(
+                repo_def, "mask_initial_release"
+            ),
+        )
+        for i, tag in enumerate(all_tags)
+    }
+    tag_range = f"{all_tags[0]}..{all_tags[-1]}"
+
+    # Act
+    cli_cmd = [
+        MAIN_PROG_NAME,
+        CHANGELOG_SUBCMD,
+        "--post-to-release-range",
+        tag_range,
+    ]
+    result = cli_runner.invoke(main, cli_cmd[1:])
+
+    # Evaluate
+    assert_successful_exit_code(result, cli_cmd)
+    assert len(expected_release_notes) == post_mocker.call_count
+
+    actual_posted_notes = {
+        request.json()["tag_name"]: request.json()["body"]
+        for request in post_mocker.request_history
+    }
+    assert expected_release_notes == actual_posted_notes
+
+
+@pytest.mark.usefixtures(repo_w_trunk_only_conventional_commits.__name__)
+@pytest.mark.parametrize(
+    "tag_range, expected_exit_code",
+    [("v0.1.0", 1), ("v0.1.0..bad-tag", 1), ("v99.0.0..", 2)],
+)
+def test_changelog_release_notes_for_invalid_tag_range(
+    tag_range: str,
+    expected_exit_code: int,
+    cli_runner: CliRunner,
+    post_mocker: Mocker,
+):
+    # Act
+    cli_cmd = [MAIN_PROG_NAME, CHANGELOG_SUBCMD, "--post-to-release-range", tag_range]
+    result = cli_runner.invoke(main, cli_cmd[1:])
+
+    # Evaluate
+    assert_exit_code(expected_exit_code, result, cli_cmd)
+    assert not post_mocker.called
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
+
+from semantic_release.cli.commands.main import main
+from semantic_release.version.declarations.enum import VersionStampType
+
+from tests.const import MAIN_PROG_NAME, VERSION_SUBCMD
+from tests.fixtures.repos import (
+    repo_w_no_tags_conventional_commits,
+    repo_w_trunk_only_conventional_commits,
+)
+from tests.util import assert_exit_code, assert_successful_exit_code
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+    from click.testing import CliRunner
+    from requests_mock import Mocker
+
+    from tests.fixtures.example_project import UpdatePyprojectTomlFn
+    from tests.fixtures.git_repo import (
+        BuiltRepoResult,
+        GetVersionsFromRepoBuildDefFn,
+    )
+
+
+VERSION_VERIFY_CMD = [MAIN_PROG_NAME, VERSION_SUBCMD, "--verify"]
+
+
+@pytest.mark.parametrize(
+    "repo_result",
+    [lazy_fixture(repo_w_trunk_only_conventional_commits.__name__)],
+)
+def test_version_verify_passes_when_declarations_match(
+    repo_result: BuiltRepoResult,
+    get_versions_from_repo_build_def: GetVersionsFromRepoBuildDefFn,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+    default_tag_format_str: str,
+    cli_runner: CliRunner,
+    mocked_git_push: MagicMock,
+    post_mocker: Mocker,
+):
+    repo = repo_result["repo"]
+    latest_release_version = get_versions_from_repo_build_def(
+        repo_result["definition"]
+    )[-1]
+    latest_release_tag = default_tag_format_str.format(version=latest_release_version)
+
+    # Setup: declare the tag formatted version in a second place of an existing file
+    target_file = Path("release.toml")
+    target_file.write_text(
+        f'version = "{latest_release_version}"\nrelease = "{latest_release_tag}"\n'
+    )
+    update_pyproject_toml(
+        "tool.semantic_release.version_toml",
+        [
+            "pyproject.toml:tool.poetry.version",
+            f"{target_file}:version",
+            f"{target_file}:release:{VersionStampType.TAG_FORMAT.value}",
+        ],
+    )
+
+    # Setup: take measurement before running the version command
+    head_before = repo.head.commit.hexsha
+    tags_before = {tag.name for tag in repo.tags}
+
+    # Act
+    result = cli_runner.invoke(main, VERSION_VERIFY_CMD[1:])
+
+    # Evaluate
+    assert_successful_exit_code(result, VERSION_VERIFY_CMD)
+    assert not result.stdout
+    assert latest_release_tag in result.stderr
+
+    # assert nothing else happened (no commit, no tag, no push, no vcs release)
+    assert head_before == repo.head.commit.hexsha
+    assert tags_before == {tag.name for tag in repo.tags}
+    assert mocked_git_push.call_count == 0
+    assert post_mocker.call_count == 0
+
+
+@pytest.mark.parametrize(
+    "repo_result",
+    [lazy_fixture(repo_w_trunk_only_conventional_commits.__name__)],
+)
+def test_version_verify_reports_mismatched_declarations(
+    repo_result: BuiltRepoResult,
+    get_versions_from_repo_build_def: GetVersionsFromRepoBuildDefFn,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+    cli_runner: CliRunner,
+):
+    latest_release_version = get_versions_from_repo_build_def(
+        repo_result["definition"]
+    )[-1]
+
+    # Setup: one outdated declaration & one declaration without a version
+    stale_file = Path("stale.py")
+    stale_file.write_text('__version__ = "0.0.1"\n')
+    unversioned_file = Path("unversioned.py")
+    unversioned_file.write_text("__name__ = 'example'\n")
+    update_pyproject_toml(
+        "tool.semantic_release.version_variables",
+        [f"{stale_file}:__version__", f"{unversioned_file}:__version__"],
+    )
+
+    # Act
+    result = cli_runner.invoke(main, VERSION_VERIFY_CMD[1:])
+
+    # Evaluate
+    assert_exit_code(1, result, VERSION_VERIFY_CMD)
+    assert (
+        f"{stale_file}: found 0.0.1, expected {latest_release_version}" in result.stderr
+    )
+    assert (
+        f"{unversioned_file}: found no version, expected {latest_release_version}"
+        in result.stderr
+    )
+    # matching declarations are not reported
+    assert "pyproject.toml" not in result.stderr
+
+
+@pytest.mark.parametrize(
+    "repo_result",
+    [lazy_fixture(repo_w_trunk_only_conventional_commits.__name__)],
+)
+def test_version_verify_reports_invalid_declared_versions(
+    repo_result: BuiltRepoResult,
+    get_versions_from_repo_build_def: GetVersionsFromRepoBuildDefFn,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+    cli_runner: CliRunner,
+):
+    latest_release_version = get_versions_from_repo_build_def(
+        repo_result["definition"]
+    )[-1]
+
+    # Setup: a declaration whose value is not a valid version, next to a matching one
+    target_file = Path("release.toml")
+    target_file.write_text(
+        f'version = "1.0"\n[tool]\nversion = "{latest_release_version}"\n'
+    )
+    update_pyproject_toml(
+        "tool.semantic_release.version_toml",
+        [f"{target_file}:version", f"{target_file}:tool.version"],
+    )
+
+    # Act
+    result = cli_runner.invoke(main, VERSION_VERIFY_CMD[1:])
+
+    # Evaluate
+    assert_exit_code(1, result, VERSION_VERIFY_CMD)
+    assert "Traceback" not in result.stderr
+    assert (
+        f"{target_file}: found an invalid version ('1.0' is not a valid Version), "
+        f"expected {latest_release_version}"
+    ) in result.stderr
+    # the valid declaration of the same file is still verified
+    assert result.stderr.count(str(target_file)) == 1
+
+
+@pytest.mark.parametrize(
+    "repo_result",
+    [lazy_fixture(repo_w_no_tags_conventional_commits.__name__)],
+)
+def test_version_verify_fails_without_release_tags(
+    repo_result: BuiltRepoResult,
+    cli_runner: CliRunner,
+):
+    # Act
+    result = cli_runner.invoke(main, VERSION_VERIFY_CMD[1:])
+
+    # Evaluate
+    assert_exit_code(1, result, VERSION_VERIFY_CMD)
+    assert "No release tags found" in result.stderr
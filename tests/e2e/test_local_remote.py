@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
+
+from semantic_release.cli.commands.main import main
+from semantic_release.hvcs.local import Local
+
+from tests.const import (
+    CHANGELOG_SUBCMD,
+    MAIN_PROG_NAME,
+    PUBLISH_SUBCMD,
+    VERSION_SUBCMD,
+)
+from tests.fixtures.repos import repo_w_trunk_only_conventional_commits
+from tests.util import assert_successful_exit_code
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from unittest.mock import MagicMock
+
+    from click.testing import CliRunner
+
+    from tests.fixtures.example_project import ExProjectDir, UpdatePyprojectTomlFn
+    from tests.fixtures.git_repo import BuiltRepoResult
+
+
+@pytest.mark.parametrize(
+    "repo_result", [lazy_fixture(repo_w_trunk_only_conventional_commits.__name__)]
+)
+def test_release_to_local_remote(
+    repo_result: BuiltRepoResult,
+    cli_runner: CliRunner,
+    example_project_dir: ExProjectDir,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+    mocked_git_push: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+):
+    repo = repo_result["repo"]
+    release_dir = tmp_path / "local-hvcs"
+    monkeypatch.setenv(Local.ENV_RELEASE_DIR, str(release_dir))
+
+    # setup: select the local remote through the configuration
+    update_pyproject_toml("tool.semantic_release.remote.type", "local")
+    repo.git.commit(m="chore: release to the local remote", a=True)
+
+    # setup: a built distribution to publish
+    dist_file = example_project_dir / "dist" / "pkg-1.0.0.tar.gz"
+    dist_file.parent.mkdir(parents=True, exist_ok=True)
+    dist_file.write_text("distribution content")
+
+    def read_releases() -> list[dict]:
+        return list(
+            json.loads(
+                release_dir.joinpath("releases.json").read_text(encoding="utf-8")
+            ).values()
+        )
+
+    # Act: create the release
+    cli_cmd = [MAIN_PROG_NAME, VERSION_SUBCMD, "--patch"]
+    result = cli_runner.invoke(main, cli_cmd[1:])
+    assert_successful_exit_code(result, cli_cmd)
+
+    new_tag = repo.git.describe(tags=True, abbrev=0)
+    (release,) = read_releases()
+    assert new_tag == release["tag_name"]
+    assert not release["assets"]
+    assert mocked_git_push.call_count == 2  # 1 for commit, 1 for tag
+
+    # Act: upload the distribution to the release
+    cli_cmd = [MAIN_PROG_NAME, PUBLISH_SUBCMD, "--tag", new_tag]
+    result = cli_runner.invoke(main, cli_cmd[1:])
+    assert_successful_exit_code(result, cli_cmd)
+
+    (release,) = read_releases()
+    # Along with the wheel built by the build command of the version command
+    assert {file.name for file in dist_file.parent.iterdir()} == {
+        asset["name"] for asset in release["assets"]
+    }
+    assert (
+        dist_file.read_bytes()
+        == release_dir.joinpath(
+            "assets", str(release["id"]), dist_file.name
+        ).read_bytes()
+    )
+
+    # Act: post the release notes again, which updates the existing release
+    release_dir.joinpath("releases.json").write_text(
+        json.dumps({str(release["id"]): {**release, "body": ""}}), encoding="utf-8"
+    )
+    cli_cmd = [MAIN_PROG_NAME, CHANGELOG_SUBCMD, "--post-to-release-tag", new_tag]
+    result = cli_runner.invoke(main, cli_cmd[1:])
+    assert_successful_exit_code(result, cli_cmd)
+
+    (updated_release,) = read_releases()
+    assert release["id"] == updated_release["id"]
+    assert release["body"] == updated_release["body"]
+    assert release["assets"] == updated_release["assets"]
@@ -9,7 +9,11 @@ from unittest import mock
 import pytest
 from git import Commit, Object, Repo
 
-from semantic_release.changelog.context import ChangelogMode, make_changelog_context
+from semantic_release.changelog.context import (
+    ChangelogMode,
+    make_changelog_context,
+    memoize_filter,
+)
 from semantic_release.changelog.release_history import Release, ReleaseHistory
 from semantic_release.changelog.template import environment
 from semantic_release.commit_parser import ParsedCommit
@@ -750,3 +754,58 @@ def test_changelog_context_format_w_official_name_filter(
 
     # Evaluate
     assert expected_changelog == actual_changelog
+
+
+def test_memoize_filter_caches_results_per_arguments():
+    filter_fn = mock.Mock(side_effect=lambda value, suffix="": f"{value}{suffix}")
+    filter_fn.__name__ = "my_filter"
+    memoized_filter = memoize_filter(filter_fn)
+
+    assert memoized_filter.__name__ == "my_filter"
+    assert [memoized_filter("a"), memoized_filter("a"), memoized_filter("b")] == [
+        "a",
+        "a",
+        "b",
+    ]
+    assert memoized_filter("a", suffix="!") == "a!"
+    assert memoized_filter("a", suffix="!") == "a!"
+    assert filter_fn.call_count == 3
+
+
+def test_memoize_filter_passes_through_unhashable_arguments():
+    filter_fn = mock.Mock(side_effect=lambda values: sorted(values))
+    filter_fn.__name__ = "my_filter"
+    memoized_filter = memoize_filter(filter_fn)
+
+    assert memoized_filter(["b", "a"]) == ["a", "b"]
+    assert memoized_filter(["b", "a"]) == ["a", "b"]
+    assert filter_fn.call_count == 2
+
+
+def test_changelog_context_memoizes_hvcs_filters(
+    example_git_https_url: str,
+    artificial_release_history: ReleaseHistory,
+    changelog_md_file: Path,
+):
+    hvcs_client = Github(remote_url=example_git_https_url)
+    expected_url = hvcs_client.pull_request_url("#1")
+    env = environment(autoescape=False)
+
+    with mock.patch.object(
+        Github, "pull_request_url", autospec=True, side_effect=Github.pull_request_url
+    ) as mock_pull_request_url:
+        make_changelog_context(
+            hvcs_client=hvcs_client,
+            release_history=artificial_release_history,
+            mode=ChangelogMode.INIT,
+            prev_changelog_file=changelog_md_file,
+            insertion_flag="",
+            mask_initial_release=False,
+        ).bind_to_environment(env)
+
+        actual_urls = env.from_string(
+            "{% for _ in range(3) %}{{ '#1' | pull_request_url }};{% endfor %}"
+        ).render()
+
+    assert actual_urls == f"{expected_url};" * 3
+    assert mock_pull_request_url.call_count == 1
@@ -10,7 +10,10 @@ from importlib_resources import files
 
 import semantic_release
 from semantic_release.changelog.context import ChangelogMode, make_changelog_context
-from semantic_release.cli.changelog_writer import render_default_changelog_file
+from semantic_release.cli.changelog_writer import (
+    render_default_changelog_file,
+    write_default_changelog,
+)
 from semantic_release.cli.config import ChangelogOutputFormat
 from semantic_release.commit_parser import ParsedCommit
 from semantic_release.hvcs import Bitbucket, Gitea, Github, Gitlab
@@ -1023,3 +1026,44 @@ def test_default_changelog_template_w_multiple_notices(
     )
 
     assert expected_changelog == actual_changelog
+
+
+@pytest.mark.parametrize(
+    "output_format",
+    [ChangelogOutputFormat.MARKDOWN, ChangelogOutputFormat.RESTRUCTURED_TEXT],
+)
+def test_write_default_changelog_init_streams_same_content_as_render(
+    output_format: ChangelogOutputFormat,
+    example_git_https_url: str,
+    artificial_release_history: ReleaseHistory,
+    tmp_path: Path,
+):
+    changelog_file = tmp_path / f"CHANGELOG.{output_format.value}"
+    changelog_file.write_text("previous content that is replaced\n")
+    changelog_context = make_changelog_context(
+        hvcs_client=Github(example_git_https_url),
+        release_history=artificial_release_history,
+        mode=ChangelogMode.INIT,
+        prev_changelog_file=changelog_file,
+        insertion_flag="",
+        mask_initial_release=False,
+    )
+    expected_changelog = render_default_changelog_file(
+        output_format=output_format,
+        changelog_context=changelog_context,
+        changelog_style="angular",
+    )
+
+    write_kwargs = {
+        "changelog_file": changelog_file,
+        "destination_dir": tmp_path,
+        "output_format": output_format,
+        "changelog_context": changelog_context,
+        "changelog_style": "angular",
+    }
+
+    assert str(changelog_file) == write_default_changelog(**write_kwargs)
+    assert f"{expected_changelog}\n" == changelog_file.read_text(encoding="utf-8")
+
+    # an unchanged changelog is not written nor reported again
+    assert write_default_changelog(**write_kwargs) is None
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from semantic_release.changelog.context import ChangelogMode, make_changelog_context
+from semantic_release.cli import changelog_writer
+from semantic_release.cli.changelog_writer import (
+    render_default_changelog_file,
+    update_default_changelog_file,
+    write_default_changelog,
+)
+from semantic_release.cli.config import ChangelogOutputFormat
+from semantic_release.hvcs import Github
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from semantic_release.changelog.release_history import ReleaseHistory
+
+
+INSERTION_FLAGS = {
+    ChangelogOutputFormat.MARKDOWN: "<!-- version list -->",
+    ChangelogOutputFormat.RESTRUCTURED_TEXT: "..\n    version list",
+}
+
+
+@pytest.mark.parametrize(
+    "output_format",
+    [ChangelogOutputFormat.MARKDOWN, ChangelogOutputFormat.RESTRUCTURED_TEXT],
+)
+@pytest.mark.parametrize(
+    "prev_changelog_template",
+    [
+        # header & previous release notes
+        "# CHANGELOG\n\n{flag}\n\n## v0.9.0 (2020-01-01)\n\n- Old change\n",
+        # flag at the very top & very bottom of the file
+        "{flag}\n\n## v0.9.0 (2020-01-01)\n\n- Old change\n",
+        "# CHANGELOG\n\n{flag}\n\n\n",
+        # windows line endings & trailing whitespace
+        "# CHANGELOG  \r\n\r\n{flag}\r\n\r\n## v0.9.0 (2020-01-01)\r\n\r\n- Old \r\n\r\n",
+        # latest release is already in the changelog
+        "# CHANGELOG\n\n{flag}\n\n## v{latest} (2020-01-01)\n\nv{latest} (2020-01-01)\n",
+    ],
+)
+@pytest.mark.parametrize("mask_initial_release", [True, False])
+@pytest.mark.parametrize("num_releases", [1, 2])
+def test_update_default_changelog_file_matches_full_render(
+    output_format: ChangelogOutputFormat,
+    prev_changelog_template: str,
+    mask_initial_release: bool,
+    num_releases: int,
+    example_git_https_url: str,
+    artificial_release_history: ReleaseHistory,
+    tmp_path: Path,
+):
+    artificial_release_history = artificial_release_history.latest_releases(
+        num_releases
+    )
+    changelog_file = tmp_path / f"CHANGELOG.{output_format.value}"
+    latest_version = next(iter(artificial_release_history.released.keys()))
+    changelog_file.write_bytes(
+        prev_changelog_template.format(
+            flag=INSERTION_FLAGS[output_format], latest=latest_version
+        ).encode("utf-8")
+    )
+    changelog_context = make_changelog_context(
+        hvcs_client=Github(example_git_https_url),
+        release_history=artificial_release_history,
+        mode=ChangelogMode.UPDATE,
+        prev_changelog_file=changelog_file,
+        insertion_flag=INSERTION_FLAGS[output_format],
+        mask_initial_release=mask_initial_release,
+    )
+
+    expected_changelog = render_default_changelog_file(
+        output_format=output_format,
+        changelog_context=changelog_context,
+        changelog_style="angular",
+    )
+
+    # Use a tiny chunk size to exercise text that spans across chunks
+    with mock.patch.object(changelog_writer, "_STREAM_CHUNK_SIZE", 3):
+        changed = update_default_changelog_file(
+            changelog_file=changelog_file,
+            output_format=output_format,
+            changelog_context=changelog_context,
+            changelog_style="angular",
+        )
+
+    assert changed is not None
+
+    assert f"{expected_changelog}\n" == changelog_file.read_text(encoding="utf-8")
+
+
+def test_write_default_changelog_update_wo_insertion_flag_renders_template(
+    example_git_https_url: str,
+    artificial_release_history: ReleaseHistory,
+    tmp_path: Path,
+):
+    changelog_file = tmp_path / "CHANGELOG.md"
+    prev_changelog = "# CHANGELOG\n\nNo insertion flag here\n"
+    changelog_file.write_text(prev_changelog)
+    changelog_context = make_changelog_context(
+        hvcs_client=Github(example_git_https_url),
+        release_history=artificial_release_history,
+        mode=ChangelogMode.UPDATE,
+        prev_changelog_file=changelog_file,
+        insertion_flag=INSERTION_FLAGS[ChangelogOutputFormat.MARKDOWN],
+        mask_initial_release=False,
+    )
+
+    with mock.patch.object(
+        changelog_writer,
+        "render_default_changelog_file",
+        wraps=render_default_changelog_file,
+    ) as mocked_render:
+        write_default_changelog(
+            changelog_file=changelog_file,
+            destination_dir=changelog_file.parent,
+            output_format=ChangelogOutputFormat.MARKDOWN,
+            changelog_context=changelog_context,
+            changelog_style="angular",
+        )
+
+    assert mocked_render.call_count == 1
+    assert prev_changelog == changelog_file.read_text()
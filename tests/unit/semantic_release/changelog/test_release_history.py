@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import logging
+import re
 from datetime import datetime
 from typing import TYPE_CHECKING, NamedTuple
+from unittest import mock
 
 import pytest
 from git import Actor
 from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
 
+import semantic_release.changelog.release_history as release_history_module
 from semantic_release.changelog.release_history import ReleaseHistory
+from semantic_release.changelog.template import environment
+from semantic_release.cli.changelog_writer import get_default_tpl_dir
+from semantic_release.commit_parser.token import ParsedCommit, ParseError
+from semantic_release.enums import LevelBump
 from semantic_release.version.translator import VersionTranslator
 from semantic_release.version.version import Version
 
@@ -300,3 +308,164 @@ def test_all_matching_repo_tags_are_released(
 
     for tag in repo.tags:
         assert translator.from_tag(tag.name) in release_history.released
+
+
+@pytest.mark.parametrize(
+    "repo_result",
+    [lazy_fixture(repo_w_trunk_only_conventional_commits.__name__)],
+)
+@pytest.mark.order("last")
+def test_release_history_logs_summary_per_release(
+    repo_result: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+    caplog: pytest.LogCaptureFixture,
+):
+    with caplog.at_level(logging.INFO, logger=release_history_module.__name__):
+        release_history = ReleaseHistory.from_git_history(
+            repo=repo_result["repo"],
+            translator=VersionTranslator(),
+            commit_parser=default_conventional_parser,  # type: ignore[arg-type]
+        )
+
+    history_records = [
+        record
+        for record in caplog.records
+        if record.name == release_history_module.__name__
+    ]
+
+    # only one summary line per release rather than lines per commit
+    assert len(release_history.released) == len(history_records)
+    assert all(record.levelno == logging.INFO for record in history_records)
+
+
+@pytest.mark.parametrize(
+    "repo_result",
+    [lazy_fixture(repo_w_trunk_only_conventional_commits.__name__)],
+)
+@pytest.mark.order("last")
+def test_release_history_skips_logging_when_disabled(
+    repo_result: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    mock_logger = mock.MagicMock(spec=logging.Logger)
+    mock_logger.isEnabledFor.return_value = False
+    monkeypatch.setattr(release_history_module, "log", mock_logger)
+
+    ReleaseHistory.from_git_history(
+        repo=repo_result["repo"],
+        translator=VersionTranslator(),
+        commit_parser=default_conventional_parser,  # type: ignore[arg-type]
+        exclude_commit_patterns=[re.compile(r"chore: .+")],
+    )
+
+    # No log arguments are evaluated or logging calls made while walking the history
+    assert mock_logger.debug.call_count == 0
+    assert mock_logger.info.call_count == 0
+
+
+def _parsed_commit(
+    type_: str,
+    scope: str,
+    description: str,
+    breaking_descriptions: tuple[str, ...] = (),
+    linked_issues: tuple[str, ...] = (),
+    linked_merge_request: str = "",
+) -> ParsedCommit:
+    return ParsedCommit(
+        bump=LevelBump.PATCH,
+        type=type_,
+        scope=scope,
+        descriptions=[description],
+        breaking_descriptions=list(breaking_descriptions),
+        commit=mock.Mock(hexsha=description),
+        linked_issues=linked_issues,
+        linked_merge_request=linked_merge_request,
+    )
+
+
+@pytest.fixture
+def views_elements() -> dict[str, list]:
+    return {
+        "fix": [
+            _parsed_commit("fix", "cli", "Zap a bug", linked_issues=("#10", "#9")),
+            _parsed_commit("fix", "", "fix the thing", linked_merge_request="#12"),
+            _parsed_commit("fix", "Api", "a bug", ("drop python 3.7",), ("#9",)),
+            _parsed_commit("fix", "cli", "b bug", linked_merge_request="#2"),
+        ],
+        "Feature": [
+            _parsed_commit("feature", "", "Add a thing", ("new API",), ("#100",)),
+            _parsed_commit("feature", "api", "add another thing"),
+        ],
+        "unknown": [ParseError(commit=mock.Mock(), error="not conventional")],
+    }
+
+
+def test_release_views_order_commits_like_default_templates(
+    views_elements: dict[str, list],
+):
+    env = environment(
+        template_dir=get_default_tpl_dir(style="angular", sub_dir="md"),
+        autoescape=False,
+    )
+    ordering_tpl = env.from_string(
+        str.join(
+            "",
+            [
+                "{% from '.components/macros.md.j2' import ",
+                "apply_alphabetical_ordering_by_descriptions %}",
+                "{% set ns = namespace(commits=commits) %}",
+                "{% set _ = apply_alphabetical_ordering_by_descriptions(ns) %}",
+                "{{ ns.commits | map(attribute='descriptions.0') | join('|') }}",
+            ],
+        )
+    )
+    views = ReleaseHistory(unreleased=views_elements, released={}).unreleased_views
+
+    assert [commit_type for commit_type, _ in views.commits_by_type] == [
+        "Feature",
+        "fix",
+        "unknown",
+    ]
+    assert all(
+        ordering_tpl.render(commits=commits)
+        == str.join("|", (commit.descriptions[0] for commit in ordered_commits))
+        for commits, ordered_commits in (
+            (views_elements[commit_type], ordered_commits)
+            for commit_type, ordered_commits in views.ordered_commits_by_type.items()
+        )
+    )
+
+
+def test_release_views_derived_groups(views_elements: dict[str, list]):
+    views = ReleaseHistory(unreleased=views_elements, released={}).unreleased_views
+
+    assert list(views.commits_by_scope) == ["", "api", "Api", "cli"]
+    assert [commit.descriptions[0] for commit in views.breaking_commits] == [
+        "Add a thing",
+        "a bug",
+    ]
+    assert views.linked_issues == ["#9", "#10", "#100"]
+    assert views.linked_merge_requests == ["#2", "#12"]
+
+
+def test_release_views_are_memoized_per_commit_group(
+    views_elements: dict[str, list], artificial_release_history: ReleaseHistory
+):
+    version = next(iter(artificial_release_history.released))
+    history = ReleaseHistory(
+        unreleased=views_elements, released=artificial_release_history.released
+    )
+
+    assert history.unreleased_views is history.views(history.unreleased)
+    assert history.release_views(version) is history.views(
+        history.released[version]["elements"]
+    )
+    assert history.unreleased_views is not history.release_views(version)
+    assert history.unreleased_views.linked_issues is (
+        history.unreleased_views.linked_issues
+    )
+
+    # A new group of commits gets its own views
+    history.unreleased = {}
+    assert not history.unreleased_views.commits_by_type
@@ -4,14 +4,23 @@ from __future__ import annotations
 # but not all of them. The testing can be expanded to cover all the options later.
 # It's not super essential as Jinja2 does most of the testing, we're just checking
 # that we can properly set the right strings in the template environment.
+import os
 from textwrap import dedent
 from typing import TYPE_CHECKING
+from unittest import mock
 
 import pytest
+from jinja2 import FileSystemLoader
+from jinja2.sandbox import SandboxedEnvironment, SecurityError
 
-from semantic_release.changelog.template import environment
+from semantic_release.changelog.template import (
+    ComplexDirectorySandboxedEnvironment,
+    TemplateBytecodeCache,
+    environment,
+)
 
 if TYPE_CHECKING:
+    from pathlib import Path
     from typing import Any
 
 EXAMPLE_TEMPLATE_FORMAT_STR = """
@@ -65,3 +74,91 @@ def test_template_env_configurable(format_map: dict[str, Any], subjects: tuple[s
     actual_result = template.render(title="important", subjects=subjects)
 
     assert expected_result == actual_result
+
+
+def test_template_bytecode_cache_skips_recompilation(tmp_path: Path):
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    template_dir.joinpath("example.j2").write_text("{{ title | upper }}")
+    cache_dir = tmp_path / "cache"
+
+    first_env = environment(template_dir=template_dir, bytecode_cache_dir=cache_dir)
+    assert first_env.get_template("example.j2").render(title="abc") == "ABC"
+    assert len(list(cache_dir.iterdir())) == 1
+
+    # A new environment (ie. the next run) loads the compiled code from the cache
+    with mock.patch.object(
+        ComplexDirectorySandboxedEnvironment,
+        "compile",
+        side_effect=AssertionError("template was recompiled"),
+    ):
+        second_env = environment(
+            template_dir=template_dir, bytecode_cache_dir=cache_dir
+        )
+        assert second_env.get_template("example.j2").render(title="xyz") == "XYZ"
+
+
+def test_template_bytecode_cache_keyed_by_source_n_environment(tmp_path: Path):
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    template_file = template_dir.joinpath("example.j2")
+    template_file.write_text("{{ title }}")
+    cache_dir = tmp_path / "cache"
+
+    def render(**env_options: Any) -> str:
+        env = environment(
+            template_dir=template_dir, bytecode_cache_dir=cache_dir, **env_options
+        )
+        return env.get_template("example.j2").render(title="<b>")
+
+    assert render(autoescape=True) == "&lt;b&gt;"
+    # The compiled code of an autoescaping environment must not be reused
+    assert render(autoescape=False) == "<b>"
+
+    template_file.write_text("title: {{ title }}")
+    assert render(autoescape=False) == "title: <b>"
+
+    assert len(list(cache_dir.iterdir())) == 3
+
+
+def test_template_bytecode_cache_prunes_least_recently_used(tmp_path: Path):
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    cache_dir = tmp_path / "cache"
+
+    def render(name: str) -> set[Path]:
+        template_dir.joinpath(name).write_text(f"{name}: {{{{ title }}}}")
+        # A new environment (ie. the next run) reads the template from the cache
+        env = ComplexDirectorySandboxedEnvironment(
+            loader=FileSystemLoader(template_dir),
+            bytecode_cache=TemplateBytecodeCache(cache_dir, max_entries=2),
+        )
+        env.get_template(name).render(title="abc")
+        return set(cache_dir.iterdir())
+
+    first_entry = render("first.j2")
+    second_entry = render("second.j2") - first_entry
+    for entry_mtime, entry in enumerate((*first_entry, *second_entry), start=1):
+        os.utime(entry, (entry_mtime, entry_mtime))
+
+    # Reading the first entry again marks it as used more recently than the second
+    assert first_entry | second_entry == render("first.j2")
+    third_entry = render("third.j2") - first_entry - second_entry
+
+    assert first_entry | third_entry == set(cache_dir.iterdir())
+
+
+def test_template_env_sandboxed_by_default():
+    env = environment()
+    assert isinstance(env, SandboxedEnvironment)
+
+    with pytest.raises(SecurityError):
+        env.from_string("{{ title.__class__.__mro__ }}").render(title="abc")
+
+
+def test_template_env_trusted_is_not_sandboxed():
+    env = environment(autoescape=False, sandboxed=False)
+    assert not isinstance(env, SandboxedEnvironment)
+    assert str(str.__mro__) == env.from_string("{{ title.__class__.__mro__ }}").render(
+        title="abc"
+    )
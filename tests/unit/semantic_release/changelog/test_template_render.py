@@ -2,11 +2,17 @@ from __future__ import annotations
 
 import itertools
 import os
+from io import StringIO
 from typing import TYPE_CHECKING
 
 import pytest
 
-from semantic_release.changelog.template import environment, recursive_render
+from semantic_release.changelog.context import read_file
+from semantic_release.changelog.template import (
+    environment,
+    recursive_render,
+    write_rendered_chunks,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -175,3 +181,173 @@ def test_recursive_render_with_top_level_dotfolder(
     assert set(example_project_dir.rglob("**/*")) == preexisting_paths.union(
         {example_project_dir / rendered_template}
     )
+
+
+def test_recursive_render_streams_over_file_read_by_template(
+    init_example_project: None,
+    example_project_dir: ExProjectDir,
+    example_project_template_dir: Path,
+):
+    output_file = example_project_dir / "CHANGELOG.md"
+    output_file.write_text("# CHANGELOG\n\n- previous release\n")
+    template_file = example_project_template_dir / f"{output_file.name}.j2"
+    template_file.parent.mkdir(parents=True, exist_ok=True)
+    template_file.write_text(
+        str.join(
+            "\n",
+            [
+                "{% set prev = output_file | read_file -%}",
+                "{{ prev.split('\\n\\n')[0] }}",
+                "",
+                "- new release",
+                "",
+                "{{ prev.split('\\n\\n')[1] }}",
+            ],
+        )
+    )
+    env = environment(template_dir=example_project_template_dir.resolve())
+    env.filters["read_file"] = read_file
+    env.globals["output_file"] = str(output_file.resolve())
+
+    recursive_render(
+        template_dir=example_project_template_dir.resolve(),
+        environment=env,
+        _root_dir=example_project_dir.resolve(),
+    )
+
+    expected_content = "# CHANGELOG\n\n- new release\n\n- previous release\n"
+    assert expected_content == output_file.read_text()
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        [],
+        [" \n", "\n"],
+        ["\n  # title", " ", "\n", "\n", "body\r\n", "\r\n", " \n"],
+        ["a", "b \t", "\n\nc \n", "  ", "d", "\n\n\n"],
+    ],
+)
+@pytest.mark.parametrize("remove_carriage_returns", [True, False])
+def test_write_rendered_chunks_matches_buffered_write(
+    chunks: list[str], remove_carriage_returns: bool
+):
+    expected_content = str.join("", chunks).rstrip()
+    if remove_carriage_returns:
+        expected_content = expected_content.replace("\r", "")
+
+    output = StringIO()
+    write_rendered_chunks(
+        chunks, output, remove_carriage_returns=remove_carriage_returns
+    )
+
+    assert f"{expected_content}\n" == output.getvalue()
+
+
+def test_recursive_render_concurrently_keeps_walk_order(
+    init_example_project: None,
+    example_project_dir: ExProjectDir,
+    example_project_template_dir: Path,
+):
+    for i in range(20):
+        template_file = example_project_template_dir / "releases" / f"v{i}.md.j2"
+        template_file.parent.mkdir(parents=True, exist_ok=True)
+        template_file.write_text(f"{{{{ {i} * 2 }}}}")
+        (example_project_template_dir / f"asset_{i}.txt").write_text(str(i))
+
+    env = environment(template_dir=example_project_template_dir.resolve())
+    sequential_dir = example_project_dir / "sequential"
+    concurrent_dir = example_project_dir / "concurrent"
+
+    sequential_paths = recursive_render(
+        template_dir=example_project_template_dir.resolve(),
+        environment=env,
+        _root_dir=sequential_dir.resolve(),
+        max_workers=1,
+    )
+    concurrent_paths = recursive_render(
+        template_dir=example_project_template_dir.resolve(),
+        environment=env,
+        _root_dir=concurrent_dir.resolve(),
+        max_workers=4,
+    )
+
+    assert len(concurrent_paths) == 40
+    assert [
+        os.path.relpath(path, sequential_dir.resolve()) for path in sequential_paths
+    ] == [os.path.relpath(path, concurrent_dir.resolve()) for path in concurrent_paths]
+    assert all(
+        f"{i * 2}\n" == (concurrent_dir / "releases" / f"v{i}.md").read_text()
+        for i in range(20)
+    )
+
+
+def test_recursive_render_skips_unchanged_files(
+    init_example_project: None,
+    example_project_dir: ExProjectDir,
+    example_project_template_dir: Path,
+):
+    example_project_template_dir.mkdir(parents=True, exist_ok=True)
+    for name in ("a", "b"):
+        (example_project_template_dir / f"{name}.txt.j2").write_text(name.upper())
+        (example_project_template_dir / f"{name}.cfg").write_text(name)
+
+    render_kwargs = {
+        "template_dir": example_project_template_dir.resolve(),
+        "environment": environment(template_dir=example_project_template_dir.resolve()),
+        "_root_dir": example_project_dir.resolve(),
+    }
+    assert len(recursive_render(**render_kwargs)) == 4
+    # Backdate the outputs to detect any rewrite
+    for file in ("a.txt", "a.cfg"):
+        os.utime(example_project_dir / file, ns=(0, 0))
+
+    (example_project_template_dir / "b.txt.j2").write_text("B changed")
+    (example_project_template_dir / "b.cfg").write_text("b changed")
+
+    written_paths = recursive_render(**render_kwargs)
+
+    assert sorted(
+        str((example_project_dir / file).resolve()) for file in ("b.txt", "b.cfg")
+    ) == sorted(written_paths)
+    assert (example_project_dir / "b.txt").read_text() == "B changed\n"
+    assert all(
+        (example_project_dir / file).stat().st_mtime_ns == 0
+        for file in ("a.txt", "a.cfg")
+    )
+
+
+def test_recursive_render_concurrently_raises_first_error_in_walk_order(
+    init_example_project: None,
+    example_project_dir: ExProjectDir,
+    example_project_template_dir: Path,
+):
+    example_project_template_dir.mkdir(parents=True, exist_ok=True)
+    for name in ("a", "b", "c", "ok"):
+        (example_project_template_dir / f"{name}.txt.j2").write_text(
+            f"{{{{ fail('{name}') }}}}"
+        )
+
+    def fail(name: str) -> str:
+        if name == "ok":
+            return name
+        raise ValueError(name)
+
+    env = environment(template_dir=example_project_template_dir.resolve())
+    env.globals["fail"] = fail
+
+    # os.walk() lists the files in directory order
+    first_failing_file = next(
+        file for file in os.listdir(example_project_template_dir) if file != "ok.txt.j2"
+    )
+
+    with pytest.raises(ValueError, match=f"^{first_failing_file[0]}$"):
+        recursive_render(
+            template_dir=example_project_template_dir.resolve(),
+            environment=env,
+            _root_dir=example_project_dir.resolve(),
+            max_workers=4,
+        )
+
+    # the other files are still rendered
+    assert (example_project_dir / "ok.txt").read_text() == "ok\n"
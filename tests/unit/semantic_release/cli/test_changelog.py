@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from contextlib import closing
+from typing import TYPE_CHECKING
+
+import pytest
+from git import Actor, Repo
+
+from semantic_release.cli.commands.changelog import (
+    ProjectMetadataReader,
+    get_license_name_for_release,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def repo_w_license_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    author = Actor("example", "example@example.com")
+    pyproject_toml = tmp_path / "pyproject.toml"
+
+    with Repo.init(tmp_path) as repo:
+        for tag, license_cfg in [
+            ("v1.0.0", '"MIT"'),
+            ("v1.1.0", '"MIT"'),
+            ("v2.0.0", '{ text = "BSD-3-Clause" }'),
+        ]:
+            pyproject_toml.write_text(
+                f'[project]\nname = "example"\nlicense = {license_cfg}\n'
+            )
+            (tmp_path / f"{tag}.txt").write_text(tag)
+            repo.index.add([str(pyproject_toml), f"{tag}.txt"])
+            repo.index.commit(tag, author=author, committer=author)
+            repo.create_tag(tag)
+
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_project_metadata_reader_parses_each_blob_once(repo_w_license_changes: Path):
+    with closing(ProjectMetadataReader(repo_w_license_changes)) as reader:
+        license_names = [
+            get_license_name_for_release(
+                tag_name=tag,
+                project_root=repo_w_license_changes,
+                metadata_reader=reader,
+            )
+            for tag in ("v1.0.0", "v1.1.0", "v2.0.0", "v1.0.0")
+        ]
+
+        # v1.0.0 & v1.1.0 share the same pyproject.toml blob
+        assert len(reader._metadata_by_blob_sha) == 2
+
+    assert license_names == ["MIT", "MIT", "BSD-3-Clause", "MIT"]
+
+
+def test_get_license_name_for_release_unknown_tag(repo_w_license_changes: Path):
+    assert (
+        get_license_name_for_release(
+            tag_name="v9.9.9", project_root=repo_w_license_changes
+        )
+        == ""
+    )
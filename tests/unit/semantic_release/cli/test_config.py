@@ -31,7 +31,7 @@ from semantic_release.commit_parser.scipy import ScipyParserOptions
 from semantic_release.commit_parser.tag import TagParserOptions
 from semantic_release.const import DEFAULT_COMMIT_AUTHOR
 from semantic_release.enums import LevelBump
-from semantic_release.errors import ParserLoadError
+from semantic_release.errors import InvalidConfiguration, ParserLoadError
 
 from tests.fixtures.repos import repo_w_no_tags_conventional_commits
 from tests.util import (
@@ -227,6 +227,120 @@ def test_load_valid_runtime_config(
     assert runtime_ctx
 
 
+def test_template_cache_dir_relative_to_repo_dir(
+    build_configured_base_repo: BuildRepoFn,
+    example_project_dir: ExProjectDir,
+    example_pyproject_toml: Path,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+    change_to_ex_proj_dir: None,
+):
+    build_configured_base_repo(example_project_dir)
+    update_pyproject_toml(
+        f"tool.{semantic_release.__name__}.changelog.template_cache_dir",
+        ".git/cache/psr",
+    )
+    # Pin the settings that must be inside the repository to absolute paths
+    update_pyproject_toml(
+        f"tool.{semantic_release.__name__}.changelog.template_dir",
+        str(example_project_dir.resolve() / "templates"),
+    )
+    update_pyproject_toml(
+        f"tool.{semantic_release.__name__}.changelog.default_templates.changelog_file",
+        str(example_project_dir.resolve() / "CHANGELOG.md"),
+    )
+
+    raw = RawConfig.model_validate(load_raw_config_file(example_pyproject_toml))
+    # Run from outside the repository, so the working directory is not the repo root
+    os.chdir(example_project_dir.parent)
+    runtime_ctx = RuntimeContext.from_raw_config(
+        raw, global_cli_options=GlobalCommandLineOptions()
+    )
+
+    assert (
+        raw.repo_dir.joinpath(".git", "cache", "psr").resolve()
+        == runtime_ctx.template_cache_dir
+    )
+
+
+@pytest.mark.parametrize(
+    "template_cache_dir", [".cache/psr", "~/.cache/psr", ".git/.."]
+)
+def test_template_cache_dir_outside_git_dir_is_invalid(
+    build_configured_base_repo: BuildRepoFn,
+    example_project_dir: ExProjectDir,
+    example_pyproject_toml: Path,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+    change_to_ex_proj_dir: None,
+    template_cache_dir: str,
+):
+    build_configured_base_repo(example_project_dir)
+    update_pyproject_toml(
+        f"tool.{semantic_release.__name__}.changelog.template_cache_dir",
+        template_cache_dir,
+    )
+
+    with pytest.raises(InvalidConfiguration, match="Template cache directory"):
+        RuntimeContext.from_raw_config(
+            RawConfig.model_validate(load_raw_config_file(example_pyproject_toml)),
+            global_cli_options=GlobalCommandLineOptions(),
+        )
+
+
+def test_version_declaration_globs_expanded_on_first_use(
+    build_configured_base_repo: BuildRepoFn,
+    example_project_dir: ExProjectDir,
+    example_pyproject_toml: Path,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+    change_to_ex_proj_dir: None,
+):
+    build_configured_base_repo(example_project_dir)
+    update_pyproject_toml(
+        f"tool.{semantic_release.__name__}.version_variables",
+        ["src/**/__init__.py:__version__"],
+    )
+    update_pyproject_toml(f"tool.{semantic_release.__name__}.version_toml", [])
+
+    with mock.patch(
+        "semantic_release.version.declarations.pattern.find_files_w_pattern",
+        return_value=[Path("src/pkg/__init__.py")],
+    ) as mock_find_files:
+        runtime_ctx = RuntimeContext.from_raw_config(
+            RawConfig.model_validate(load_raw_config_file(example_pyproject_toml)),
+            global_cli_options=GlobalCommandLineOptions(),
+        )
+
+        # Loading the configuration does not search the files of the glob
+        mock_find_files.assert_not_called()
+
+        declarations = runtime_ctx.version_declarations
+        assert declarations is runtime_ctx.version_declarations
+
+    mock_find_files.assert_called_once()
+    assert [Path("src/pkg/__init__.py").resolve()] == [
+        decl.path for decl in declarations
+    ]
+
+
+def test_invalid_version_declaration_glob_fails_on_load(
+    build_configured_base_repo: BuildRepoFn,
+    example_project_dir: ExProjectDir,
+    example_pyproject_toml: Path,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+    change_to_ex_proj_dir: None,
+):
+    build_configured_base_repo(example_project_dir)
+    update_pyproject_toml(
+        f"tool.{semantic_release.__name__}.version_variables",
+        ["src/**/__init__.py:__version__:unknown_stamp_type"],
+    )
+
+    with pytest.raises(InvalidConfiguration, match="version_variables"):
+        RuntimeContext.from_raw_config(
+            RawConfig.model_validate(load_raw_config_file(example_pyproject_toml)),
+            global_cli_options=GlobalCommandLineOptions(),
+        )
+
+
 @pytest.mark.parametrize(
     "commit_parser",
     [
@@ -231,3 +231,70 @@ def test_non_strings_are_returned(default_masking_filter, obj):
     )
 
     assert default_masking_filter.mask(rec.getMessage()) == str(obj)
+
+
+def test_log_record_without_secrets_is_untouched(default_masking_filter):
+    for secret in _secrets:
+        default_masking_filter.add_mask_for(secret)
+
+    args = (15, ["not", "a", "secret"], object())
+    rec = LogRecord(
+        name=__name__,
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=10,
+        args=args,
+        msg="message with %d, %r and %s",
+        exc_info=None,
+    )
+
+    assert default_masking_filter.filter(rec)
+    assert rec.args is args
+
+
+def test_overlapping_secrets_are_masked_whole():
+    masker = MaskingFilter(_use_named_masks=True)
+    masker.add_mask_for(_secrets[0], "token")
+    masker.add_mask_for(repr(_secrets[0]), "token")
+
+    test_str = f"str: {_secrets[0]}, repr: {_secrets[0]!r}"
+
+    assert masker.mask(test_str) == str.join(
+        ", ", ("str: <'token' (value removed)>", "repr: <'token' (value removed)>")
+    )
+
+
+def test_mask_added_after_first_use_is_applied(default_masking_filter):
+    default_masking_filter.add_mask_for(_secrets[0])
+    assert _secrets[1] in default_masking_filter.mask(_secrets[1])
+
+    default_masking_filter.add_mask_for(_secrets[1])
+    assert default_masking_filter.mask(_secrets[1]) == MaskingFilter.REPLACE_STR
+
+
+def test_non_string_arg_containing_secret_is_masked(default_masking_filter):
+    default_masking_filter.add_mask_for(_secrets[0])
+    str_calls = []
+
+    class RemoteUrl:
+        def __str__(self) -> str:
+            str_calls.append(self)
+            return f"https://{_secrets[0]}@example.com"
+
+    rec = LogRecord(
+        name=__name__,
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=10,
+        args=(RemoteUrl(), 15),
+        msg="pushing to %s, attempt %d",
+        exc_info=None,
+    )
+
+    assert default_masking_filter.filter(rec)
+    assert (
+        f"pushing to https://{MaskingFilter.REPLACE_STR}@example.com, attempt 15"
+        == rec.getMessage()
+    )
+    # the argument is only stringified once, for both the search and the masking
+    assert len(str_calls) == 1
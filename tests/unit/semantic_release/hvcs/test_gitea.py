@@ -13,7 +13,9 @@ import requests_mock
 from requests import HTTPError, Response, Session
 from requests.auth import _basic_auth_str
 
+from semantic_release.errors import IncompleteReleaseError
 from semantic_release.hvcs.gitea import Gitea
+from semantic_release.hvcs.remote_hvcs_base import ReleaseAsset
 from semantic_release.hvcs.token_auth import TokenAuth
 
 from tests.const import (
@@ -812,6 +814,10 @@ def test_upload_dists_when_release_id_found(
         default_gitea_client.get_release_id_by_tag.__name__,
         return_value=release_id,
     ) as mock_get_release_id_by_tag, mock.patch.object(
+        default_gitea_client,
+        default_gitea_client.get_release_assets.__name__,
+        return_value={},
+    ), mock.patch.object(
         default_gitea_client,
         default_gitea_client.upload_release_asset.__name__,
         side_effect=upload_statuses,
@@ -822,4 +828,113 @@ def test_upload_dists_when_release_id_found(
         # Evaluate (expected -> actual)
         assert expected_num_uploads == num_uploads
         mock_get_release_id_by_tag.assert_called_once_with(tag=tag)
-        assert expected_files_uploaded == mock_upload_release_asset.call_args_list
+        # Uploads are concurrent, so they can be started in any order
+        assert len(expected_files_uploaded) == mock_upload_release_asset.call_count
+        mock_upload_release_asset.assert_has_calls(
+            expected_files_uploaded, any_order=True
+        )
+
+
+def test_upload_dists_concurrently_counts_failed_uploads(default_gitea_client: Gitea):
+    release_id = 420
+    files = [f"dist/pkg-{i}.whl" for i in range(10)]
+    failing_files = {files[2], files[7]}
+
+    def upload_release_asset(_release_id: int, file: str) -> bool:
+        if file in failing_files:
+            raise HTTPError(f"failed to upload {file}")
+        return True
+
+    with mock.patch.object(glob, "glob", return_value=files), mock.patch.object(
+        os.path, "isfile", return_value=True
+    ), mock.patch.object(
+        default_gitea_client,
+        default_gitea_client.get_release_id_by_tag.__name__,
+        return_value=release_id,
+    ), mock.patch.object(
+        default_gitea_client,
+        default_gitea_client.get_release_assets.__name__,
+        return_value={},
+    ), mock.patch.object(
+        default_gitea_client,
+        default_gitea_client.upload_release_asset.__name__,
+        side_effect=upload_release_asset,
+    ) as mock_upload_release_asset:
+        num_uploads = default_gitea_client.upload_dists("v1.0.0", "dist/*.whl")
+
+    assert len(files) - len(failing_files) == num_uploads
+    assert len(files) == mock_upload_release_asset.call_count
+
+
+def test_create_release_uploads_all_assets_before_failing(default_gitea_client: Gitea):
+    release_id = 420
+    assets = [f"dist/pkg-{i}.whl" for i in range(10)]
+
+    def upload_release_asset(_release_id: int, file: str) -> bool:
+        if file == assets[3]:
+            raise HTTPError(f"failed to upload {file}")
+        return True
+
+    with requests_mock.Mocker(
+        session=default_gitea_client.session
+    ) as m, mock.patch.object(
+        default_gitea_client,
+        default_gitea_client.upload_release_asset.__name__,
+        side_effect=upload_release_asset,
+    ) as mock_upload_release_asset:
+        m.register_uri("POST", requests_mock.ANY, json={"id": release_id})
+
+        with pytest.raises(IncompleteReleaseError):
+            default_gitea_client.create_release("v1.0.0", RELEASE_NOTES, assets=assets)
+
+    assert len(assets) == mock_upload_release_asset.call_count
+
+
+def test_get_release_assets(default_gitea_client: Gitea):
+    release_id = 420
+
+    with requests_mock.Mocker(session=default_gitea_client.session) as m:
+        m.get(
+            default_gitea_client.asset_upload_url(release_id),
+            json=[{"id": 1, "name": "pkg.whl", "size": 10, "uuid": "abc"}],
+        )
+
+        assets = default_gitea_client.get_release_assets(release_id)
+
+    assert assets == {"pkg.whl": ReleaseAsset(id=1, name="pkg.whl", size=10)}
+
+
+def test_upload_dists_skips_assets_already_attached(
+    default_gitea_client: Gitea, tmp_path: Path
+):
+    release_id = 420
+    dist_dir = tmp_path / "dist"
+    dist_dir.mkdir()
+    for file_name in ("uploaded.whl", "outdated.whl", "missing.whl"):
+        dist_dir.joinpath(file_name).write_text(file_name)
+
+    existing_assets = {
+        "uploaded.whl": ReleaseAsset(1, "uploaded.whl", 12),
+        "outdated.whl": ReleaseAsset(2, "outdated.whl", 100),
+    }
+
+    with mock.patch.object(
+        default_gitea_client,
+        default_gitea_client.get_release_id_by_tag.__name__,
+        return_value=release_id,
+    ), mock.patch.object(
+        default_gitea_client,
+        default_gitea_client.get_release_assets.__name__,
+        return_value=existing_assets,
+    ), mock.patch.object(
+        default_gitea_client, default_gitea_client.delete_release_asset.__name__
+    ) as mock_delete_release_asset, mock.patch.object(
+        default_gitea_client,
+        default_gitea_client.upload_release_asset.__name__,
+        return_value=True,
+    ) as mock_upload_release_asset:
+        num_uploads = default_gitea_client.upload_dists("v1.0.0", str(dist_dir / "*"))
+
+    assert num_uploads == 3
+    mock_delete_release_asset.assert_called_once_with(release_id, 2)
+    assert mock_upload_release_asset.call_count == 2
@@ -4,6 +4,8 @@ import fnmatch
 import glob
 import os
 import re
+import threading
+from hashlib import sha256
 from typing import TYPE_CHECKING
 from unittest import mock
 from urllib.parse import urlencode
@@ -13,7 +15,13 @@ import requests_mock
 from requests import HTTPError, Response, Session
 from requests.auth import _basic_auth_str
 
+from semantic_release.errors import IncompleteReleaseError
 from semantic_release.hvcs.github import Github
+from semantic_release.hvcs.remote_hvcs_base import (
+    ReleaseAsset,
+    RemoteReleaseJob,
+    RemoteReleaseResult,
+)
 from semantic_release.hvcs.token_auth import TokenAuth
 
 from tests.const import (
@@ -26,7 +34,7 @@ from tests.fixtures.example_project import init_example_project
 
 if TYPE_CHECKING:
     from pathlib import Path
-    from typing import Generator
+    from typing import Any, Generator
 
     from tests.conftest import NetrcFileFn
 
@@ -1059,6 +1067,10 @@ def test_upload_dists_when_release_id_found(
         default_gh_client.get_release_id_by_tag.__name__,
         return_value=release_id,
     ) as mock_get_release_id_by_tag, mock.patch.object(
+        default_gh_client,
+        default_gh_client.get_release_assets.__name__,
+        return_value={},
+    ), mock.patch.object(
         default_gh_client,
         default_gh_client.upload_release_asset.__name__,
         side_effect=upload_statuses,
@@ -1069,4 +1081,259 @@ def test_upload_dists_when_release_id_found(
         # Evaluate (expected -> actual)
         assert expected_num_uploads == num_uploads
         mock_get_release_id_by_tag.assert_called_once_with(tag=tag)
-        assert expected_files_uploaded == mock_upload_release_asset.call_args_list
+        # Uploads are concurrent, so they can be started in any order
+        assert len(expected_files_uploaded) == mock_upload_release_asset.call_count
+        mock_upload_release_asset.assert_has_calls(
+            expected_files_uploaded, any_order=True
+        )
+
+
+def test_upload_dists_concurrently_counts_failed_uploads(default_gh_client: Github):
+    release_id = 420
+    files = [f"dist/pkg-{i}.whl" for i in range(10)]
+    failing_files = {files[2], files[7]}
+
+    def upload_release_asset(_release_id: int, file: str) -> bool:
+        if file in failing_files:
+            raise HTTPError(f"failed to upload {file}")
+        return True
+
+    with mock.patch.object(glob, "glob", return_value=files), mock.patch.object(
+        os.path, "isfile", return_value=True
+    ), mock.patch.object(
+        default_gh_client,
+        default_gh_client.get_release_id_by_tag.__name__,
+        return_value=release_id,
+    ), mock.patch.object(
+        default_gh_client,
+        default_gh_client.get_release_assets.__name__,
+        return_value={},
+    ), mock.patch.object(
+        default_gh_client,
+        default_gh_client.upload_release_asset.__name__,
+        side_effect=upload_release_asset,
+    ) as mock_upload_release_asset:
+        num_uploads = default_gh_client.upload_dists("v1.0.0", "dist/*.whl")
+
+    assert len(files) - len(failing_files) == num_uploads
+    assert len(files) == mock_upload_release_asset.call_count
+
+
+def test_create_release_uploads_all_assets_before_failing(default_gh_client: Github):
+    release_id = 420
+    assets = [f"dist/pkg-{i}.whl" for i in range(10)]
+
+    def upload_release_asset(_release_id: int, file: str) -> bool:
+        if file == assets[3]:
+            raise HTTPError(f"failed to upload {file}")
+        return True
+
+    with requests_mock.Mocker(
+        session=default_gh_client.session
+    ) as m, mock.patch.object(
+        default_gh_client,
+        default_gh_client.upload_release_asset.__name__,
+        side_effect=upload_release_asset,
+    ) as mock_upload_release_asset:
+        m.register_uri("POST", requests_mock.ANY, json={"id": release_id})
+
+        with pytest.raises(IncompleteReleaseError):
+            default_gh_client.create_release("v1.0.0", RELEASE_NOTES, assets=assets)
+
+    assert len(assets) == mock_upload_release_asset.call_count
+
+
+def test_get_release_assets_follows_pagination(default_gh_client: Github):
+    release_id = 420
+    assets_url = (
+        "{api_url}/repos/{owner}/{repo_name}/releases/{release_id}/assets".format(
+            api_url=default_gh_client.api_url,
+            owner=default_gh_client.owner,
+            repo_name=default_gh_client.repo_name,
+            release_id=release_id,
+        )
+    )
+    next_page_url = f"{assets_url}?per_page=100&page=2"
+
+    with requests_mock.Mocker(session=default_gh_client.session) as m:
+        m.get(
+            next_page_url,
+            complete_qs=True,
+            json=[{"id": 2, "name": "pkg.tar.gz", "size": 20}],
+        )
+        m.get(
+            f"{assets_url}?per_page=100",
+            complete_qs=True,
+            json=[
+                {"id": 1, "name": "pkg.whl", "size": 10, "digest": "sha256:abc"},
+            ],
+            headers={"Link": f'<{next_page_url}>; rel="next"'},
+        )
+
+        assets = default_gh_client.get_release_assets(release_id)
+
+    assert assets == {
+        "pkg.whl": ReleaseAsset(id=1, name="pkg.whl", size=10, digest="sha256:abc"),
+        "pkg.tar.gz": ReleaseAsset(id=2, name="pkg.tar.gz", size=20),
+    }
+    assert m.call_count == 2
+
+
+def test_upload_dists_skips_assets_already_attached(
+    default_gh_client: Github, tmp_path: Path
+):
+    release_id = 420
+    dist_dir = tmp_path / "dist"
+    dist_dir.mkdir()
+    for file_name in ("uploaded.whl", "outdated.whl", "missing.whl"):
+        dist_dir.joinpath(file_name).write_text(file_name)
+
+    uploaded_digest = f"sha256:{sha256(b'uploaded.whl').hexdigest()}"
+    existing_assets = {
+        "uploaded.whl": ReleaseAsset(1, "uploaded.whl", 12, uploaded_digest),
+        # Same size but different content
+        "outdated.whl": ReleaseAsset(2, "outdated.whl", 12, "sha256:0123"),
+    }
+
+    with mock.patch.object(
+        default_gh_client,
+        default_gh_client.get_release_id_by_tag.__name__,
+        return_value=release_id,
+    ), mock.patch.object(
+        default_gh_client,
+        default_gh_client.get_release_assets.__name__,
+        return_value=existing_assets,
+    ), mock.patch.object(
+        default_gh_client, default_gh_client.delete_release_asset.__name__
+    ) as mock_delete_release_asset, mock.patch.object(
+        default_gh_client,
+        default_gh_client.upload_release_asset.__name__,
+        return_value=True,
+    ) as mock_upload_release_asset:
+        num_uploads = default_gh_client.upload_dists("v1.0.0", str(dist_dir / "*"))
+
+    assert num_uploads == 3
+    mock_delete_release_asset.assert_called_once_with(release_id, 2)
+    assert mock_upload_release_asset.call_count == 2
+    mock_upload_release_asset.assert_has_calls(
+        [
+            mock.call(release_id, str(dist_dir / "outdated.whl")),
+            mock.call(release_id, str(dist_dir / "missing.whl")),
+        ],
+        any_order=True,
+    )
+
+
+def test_release_is_revalidated_and_shared_by_clients(default_gh_client: Github):
+    tag = "v1.0.0"
+    release_id = 420
+    upload_url = "https://uploads.github.com/repos/owner/repo/releases/420/assets"
+    release = {"id": release_id, "upload_url": f"{upload_url}{{?name,label}}"}
+    tag_url = default_gh_client.create_api_url(
+        endpoint=f"/repos/{EXAMPLE_REPO_OWNER}/{EXAMPLE_REPO_NAME}/releases/tags/{tag}"
+    )
+    with mock.patch.dict(os.environ, {}, clear=True):
+        other_client = Github(
+            remote_url=f"git@{Github.DEFAULT_DOMAIN}:{EXAMPLE_REPO_OWNER}/{EXAMPLE_REPO_NAME}.git"
+        )
+
+    with requests_mock.Mocker() as m:
+        m.get(
+            tag_url,
+            [
+                {"json": release, "headers": {"ETag": '"v1"'}},
+                {"status_code": 304, "headers": {"ETag": '"v1"'}},
+            ],
+        )
+
+        assert release_id == default_gh_client.get_release_id_by_tag(tag)
+        # The lookup by tag is revalidated, even by another client of the same run
+        assert release_id == other_client.get_release_id_by_tag(tag)
+        # While the release found by its tag is reused as is
+        assert upload_url == other_client.asset_upload_url(str(release_id))
+
+    assert m.call_count == 2
+    assert "If-None-Match" not in m.request_history[0].headers
+    assert m.request_history[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_publish_releases_overlaps_jobs(default_gh_client: Github):
+    jobs = [RemoteReleaseJob(f"v1.{i}.0", RELEASE_NOTES) for i in range(4)]
+    # Each release waits for another one to be in progress at the same time
+    barrier = threading.Barrier(2, timeout=5)
+
+    def create_release(tag: str, *_args: Any, **_kwargs: Any) -> int:
+        barrier.wait()
+        return int(tag.split(".")[1])
+
+    with mock.patch.object(
+        default_gh_client,
+        default_gh_client.create_release.__name__,
+        side_effect=create_release,
+    ):
+        results = default_gh_client.publish_releases(jobs, max_concurrent_jobs=2)
+
+    assert [
+        RemoteReleaseResult(job.tag, release_id) for release_id, job in enumerate(jobs)
+    ] == results
+
+
+def test_publish_releases_captures_failed_jobs(default_gh_client: Github):
+    error = HTTPError("failed to create release")
+    jobs = [RemoteReleaseJob(tag, RELEASE_NOTES) for tag in ("v1.0.0", "v2.0.0")]
+
+    with mock.patch.object(
+        default_gh_client,
+        default_gh_client.create_release.__name__,
+        side_effect=[error, 2],
+    ):
+        results = default_gh_client.publish_releases(jobs, max_concurrent_jobs=1)
+
+    assert [
+        RemoteReleaseResult("v1.0.0", error=error),
+        RemoteReleaseResult("v2.0.0", 2),
+    ] == results
+
+
+def test_publish_releases_updates_existing_release(default_gh_client: Github):
+    release_id = 420
+    assets = ["dist/pkg.whl"]
+    job = RemoteReleaseJob("v1.0.0", RELEASE_NOTES, assets=assets, update_existing=True)
+
+    with mock.patch.object(
+        default_gh_client,
+        default_gh_client.create_or_update_release.__name__,
+        return_value=release_id,
+    ) as mock_create_or_update_release, mock.patch.object(
+        default_gh_client,
+        default_gh_client._upload_missing_assets.__name__,
+        return_value=1,
+    ) as mock_upload_missing_assets:
+        results = default_gh_client.publish_releases([job])
+
+    assert [RemoteReleaseResult(job.tag, release_id)] == results
+    mock_create_or_update_release.assert_called_once_with(
+        job.tag, RELEASE_NOTES, prerelease=False
+    )
+    mock_upload_missing_assets.assert_called_once_with(release_id, assets)
+
+
+def test_publish_releases_warns_when_assets_cannot_be_attached(
+    default_gh_client: Github, caplog: pytest.LogCaptureFixture
+):
+    job = RemoteReleaseJob(
+        "v1.0.0", RELEASE_NOTES, assets=["dist/pkg.whl"], update_existing=True
+    )
+
+    with mock.patch.object(
+        default_gh_client,
+        default_gh_client.create_or_update_release.__name__,
+        return_value="v1.0.0",
+    ), mock.patch.object(
+        default_gh_client, default_gh_client._upload_missing_assets.__name__
+    ) as mock_upload_missing_assets:
+        results = default_gh_client.publish_releases([job])
+
+    assert [RemoteReleaseResult(job.tag, "v1.0.0")] == results
+    mock_upload_missing_assets.assert_not_called()
+    assert "Not uploading the assets of the release for tag v1.0.0" in caplog.text
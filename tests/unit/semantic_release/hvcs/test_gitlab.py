@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from io import BytesIO
 from typing import TYPE_CHECKING
 from unittest import mock
 
@@ -9,6 +10,8 @@ import gitlab.exceptions
 import gitlab.mixins
 import gitlab.v4.objects
 import pytest
+from requests import Response
+from requests.adapters import HTTPAdapter
 
 from semantic_release.hvcs.gitlab import Gitlab
 
@@ -20,7 +23,7 @@ from tests.const import (
 )
 
 if TYPE_CHECKING:
-    from typing import Generator
+    from typing import Any, Generator
 
 
 # Note: there's nothing special about the value of these variables,
@@ -139,6 +142,26 @@ def test_gitlab_client_init(
         assert remote_url == client._remote_url
 
 
+def test_gitlab_client_retries_rate_limited_requests_once(example_git_https_url: str):
+    client = Gitlab(remote_url=example_git_https_url, token="abc123")
+
+    def send_rate_limited(*_args: Any, **_kwargs: Any) -> Response:
+        response = Response()
+        response.status_code = 429
+        response.headers.update({"Retry-After": "0"})
+        response.raw = BytesIO()
+        return response
+
+    with mock.patch.object(
+        HTTPAdapter, "send", side_effect=send_rate_limited
+    ) as mock_send, pytest.raises(gitlab.exceptions.GitlabGetError):
+        client._client.projects.get(client.project_namespace)
+
+    # Only python-gitlab retries the request (10 times by default), the scheduler of
+    # its session does not retry it again
+    assert mock_send.call_count == 11
+
+
 @pytest.mark.parametrize(
     "hvcs_domain, insecure",
     [
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+from requests import HTTPError
+
+from semantic_release.errors import IncompleteReleaseError
+from semantic_release.hvcs.local import Local
+from semantic_release.hvcs.util import RequestScheduler
+
+from tests.const import EXAMPLE_REPO_NAME, EXAMPLE_REPO_OWNER, RELEASE_NOTES
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+REMOTE_URL = f"git@example.com:{EXAMPLE_REPO_OWNER}/{EXAMPLE_REPO_NAME}.git"
+
+
+@pytest.fixture
+def local_client(tmp_path: Path) -> Local:
+    return Local(remote_url=REMOTE_URL, release_dir=tmp_path / "releases")
+
+
+@pytest.fixture
+def dist_files(tmp_path: Path) -> list[str]:
+    dist_dir = tmp_path / "dist"
+    dist_dir.mkdir()
+    files = []
+    for name in ("pkg-1.0.0.tar.gz", "pkg-1.0.0-py3-none-any.whl"):
+        file = dist_dir / name
+        file.write_text(f"content of {name}")
+        files.append(str(file))
+    return files
+
+
+def test_local_client_init_from_env(tmp_path: Path):
+    with mock.patch.dict(
+        os.environ,
+        {
+            Local.ENV_RELEASE_DIR: str(tmp_path),
+            Local.ENV_LATENCY: "0.5",
+            Local.ENV_BANDWIDTH: "1024",
+            Local.ENV_FAILURE_RATE: "0.25",
+            Local.ENV_RATE_LIMIT_RATE: "0.1",
+        },
+    ):
+        client = Local(remote_url=REMOTE_URL)
+
+    assert tmp_path == client.release_dir
+    assert client.latency == 0.5
+    assert client.bandwidth == 1024
+    assert client.failure_rate == 0.25
+    assert client.rate_limit_rate == 0.1
+    assert client.remote_url(use_token=True) == REMOTE_URL
+    assert (
+        f"https://{Local.DEFAULT_DOMAIN}/{EXAMPLE_REPO_OWNER}/{EXAMPLE_REPO_NAME}/commit/abc"
+        == client.commit_hash_url("abc")
+    )
+
+
+@pytest.mark.parametrize(
+    "latency, failure_rate, rate_limit_rate", [(-1, 0, 0), (0, 1.5, 0), (0, 0, -0.5)]
+)
+def test_local_client_init_with_invalid_simulation(
+    tmp_path: Path, latency: float, failure_rate: float, rate_limit_rate: float
+):
+    with pytest.raises(ValueError):
+        Local(
+            remote_url=REMOTE_URL,
+            release_dir=tmp_path,
+            latency=latency,
+            failure_rate=failure_rate,
+            rate_limit_rate=rate_limit_rate,
+        )
+
+
+def test_create_release_persists_release_n_assets(
+    local_client: Local, dist_files: list[str]
+):
+    release_id = local_client.create_release(
+        "v1.0.0", RELEASE_NOTES, prerelease=True, assets=dist_files
+    )
+
+    assert release_id == local_client.get_release_id_by_tag("v1.0.0")
+    assert local_client.get_release_id_by_tag("v2.0.0") is None
+
+    release = local_client._read_releases()[str(release_id)]
+    assert release["body"] == RELEASE_NOTES
+    assert release["prerelease"]
+    assert {os.path.basename(file) for file in dist_files} == set(
+        local_client.get_release_assets(release_id)
+    )
+    for file in dist_files:
+        asset = local_client._assets_dir(release_id) / os.path.basename(file)
+        assert asset.read_bytes() == open(file, "rb").read()  # noqa: SIM115
+
+
+def test_create_or_update_release_edits_existing_release(local_client: Local):
+    release_id = local_client.create_release("v1.0.0", RELEASE_NOTES)
+
+    assert release_id == local_client.create_or_update_release("v1.0.0", "new notes")
+    assert local_client._read_releases()[str(release_id)]["body"] == "new notes"
+
+
+def test_upload_dists_skips_attached_assets(local_client: Local, dist_files: list[str]):
+    local_client.create_release("v1.0.0", RELEASE_NOTES, assets=dist_files[:1])
+    dist_glob = os.path.join(os.path.dirname(dist_files[0]), "*")
+
+    with mock.patch.object(
+        local_client,
+        local_client.upload_release_asset.__name__,
+        wraps=local_client.upload_release_asset,
+    ) as mock_upload_release_asset:
+        num_uploads = local_client.upload_dists("v1.0.0", dist_glob)
+
+    assert len(dist_files) == num_uploads
+    mock_upload_release_asset.assert_called_once_with(mock.ANY, dist_files[1])
+
+
+def test_injected_failures_n_latency(tmp_path: Path, dist_files: list[str]):
+    client = Local(
+        remote_url=REMOTE_URL, release_dir=tmp_path, latency=1, failure_rate=1, seed=0
+    )
+
+    with mock.patch("time.sleep") as mock_sleep, pytest.raises(HTTPError) as exc_info:
+        client.create_release("v1.0.0", RELEASE_NOTES, assets=dist_files)
+
+    assert exc_info.value.response.status_code == 503
+    assert 0.5 <= mock_sleep.call_args.args[0] <= 1.5
+    assert not client._read_releases()
+
+
+def test_asset_upload_delayed_by_bandwidth(tmp_path: Path, dist_files: list[str]):
+    client = Local(remote_url=REMOTE_URL, release_dir=tmp_path, bandwidth=2)
+    release_id = client.create_release("v1.0.0", RELEASE_NOTES)
+
+    with mock.patch("time.sleep") as mock_sleep:
+        client.upload_release_asset(release_id, dist_files[0])
+
+    mock_sleep.assert_called_once_with(os.path.getsize(dist_files[0]) / 2)
+
+
+def test_injected_rate_limit_retried_by_scheduler(tmp_path: Path):
+    scheduler = RequestScheduler(max_rate_limit_retries=2)
+    client = Local(
+        remote_url=REMOTE_URL,
+        release_dir=tmp_path,
+        rate_limit_rate=1,
+        seed=0,
+        scheduler=scheduler,
+    )
+    clock = [1000.0]
+
+    def sleep(seconds: float) -> None:
+        clock[0] += seconds
+
+    with mock.patch("time.sleep", side_effect=sleep), mock.patch(
+        "time.monotonic", side_effect=lambda: clock[0]
+    ), pytest.raises(HTTPError) as exc_info:
+        client.create_release("v1.0.0", RELEASE_NOTES)
+
+    assert exc_info.value.response.status_code == 429
+    # Sent 3 times, held off by the rate limit before each of the 2 retries
+    assert scheduler.stats == (3, 2, 2 * Local.RATE_LIMIT_RETRY_AFTER)
+    assert not client._read_releases()
+
+
+def test_failed_asset_uploads_leave_an_incomplete_release(
+    local_client: Local, dist_files: list[str]
+):
+    failures = iter([False, True])
+
+    def simulate_request(method: str, endpoint: str, **_kwargs: int) -> None:
+        if method == "POST" and "/assets" in endpoint and next(failures):
+            local_client._raise_http_error(method, endpoint, 503, "Unavailable")
+
+    with mock.patch.object(
+        local_client, "_simulate_request", side_effect=simulate_request
+    ), pytest.raises(IncompleteReleaseError):
+        local_client.create_release("v1.0.0", RELEASE_NOTES, assets=dist_files)
+
+    release_id = local_client.get_release_id_by_tag("v1.0.0")
+    assert release_id is not None
+    assert len(local_client.get_release_assets(release_id)) == 1
@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from typing import Any
+from unittest import mock
+
+import pytest
+import requests_mock
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+
+from semantic_release.hvcs.util import (
+    RateLimitGate,
+    RemoteReleaseCache,
+    RequestScheduler,
+    ScheduledHTTPAdapter,
+    build_requests_session,
+    get_remote_release_cache,
+)
+
+
+def make_response(status_code: int, headers: dict[str, str]) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response.headers.update(headers)
+    response.raw = BytesIO()
+    return response
+
+
+@pytest.mark.parametrize(
+    "status_code, headers, expected_limited",
+    [
+        (200, {}, False),
+        (200, {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "0"}, False),
+        (403, {"Retry-After": "30"}, True),
+        (429, {}, True),
+        (
+            200,
+            {
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(int(time.time()) + 60),
+            },
+            True,
+        ),
+        (
+            200,
+            {
+                "RateLimit-Remaining": "0",
+                "RateLimit-Reset": str(int(time.time()) + 60),
+            },
+            True,
+        ),
+    ],
+)
+def test_rate_limit_gate_observes_response(
+    status_code: int, headers: dict[str, str], expected_limited: bool
+):
+    gate = RateLimitGate()
+
+    gate.observe(make_response(status_code, headers))
+
+    assert expected_limited == gate.is_limited
+
+
+def test_rate_limit_gate_waits_until_reset():
+    gate = RateLimitGate(max_wait=5)
+    gate.observe(make_response(429, {"Retry-After": "3600"}))
+
+    with mock.patch("time.sleep") as mock_sleep, mock.patch(
+        "time.monotonic", side_effect=[gate._resume_at - 5, gate._resume_at]
+    ):
+        waited = gate.wait()
+
+    # The wait is capped by the max_wait of the gate
+    mock_sleep.assert_called_once_with(5)
+    assert waited == 5
+
+
+def test_request_scheduler_retries_rate_limited_request():
+    scheduler = RequestScheduler()
+    responses = iter(
+        [
+            make_response(429, {"Retry-After": "2"}),
+            make_response(200, {}),
+        ]
+    )
+
+    clock = [1000.0]
+
+    def sleep(seconds: float) -> None:
+        clock[0] += seconds
+
+    with mock.patch("time.sleep", side_effect=sleep) as mock_sleep, mock.patch(
+        "time.monotonic", side_effect=lambda: clock[0]
+    ):
+        response = scheduler.send("example.com", lambda: next(responses))
+
+    assert response.status_code == 200
+    mock_sleep.assert_called_once_with(2)
+    assert scheduler.stats == (2, 1, 2)
+
+
+def test_request_scheduler_gives_up_after_max_retries():
+    scheduler = RequestScheduler(max_rate_limit_retries=2)
+    send_request = mock.Mock(return_value=make_response(403, {"Retry-After": "0"}))
+
+    response = scheduler.send("example.com", send_request)
+
+    assert response.status_code == 403
+    assert send_request.call_count == 3
+
+
+def test_request_scheduler_returns_rate_limited_response_wo_retry():
+    scheduler = RequestScheduler()
+    send_request = mock.Mock(return_value=make_response(429, {"Retry-After": "30"}))
+
+    response = scheduler.send("example.com", send_request, retry_rate_limited=False)
+
+    assert response.status_code == 429
+    assert send_request.call_count == 1
+    # The rate limit still holds off the next requests to the host
+    assert scheduler._get_host("example.com")[1].is_limited
+
+
+def test_request_scheduler_does_not_retry_forbidden_request():
+    scheduler = RequestScheduler()
+    send_request = mock.Mock(return_value=make_response(403, {}))
+
+    scheduler.send("example.com", send_request)
+
+    assert send_request.call_count == 1
+    assert scheduler.stats.throttled_requests == 0
+
+
+def test_request_scheduler_logs_stats(caplog: pytest.LogCaptureFixture):
+    scheduler = RequestScheduler()
+
+    with caplog.at_level(logging.DEBUG):
+        scheduler.log_stats()
+        assert not caplog.records
+
+        scheduler.send("example.com", lambda: make_response(200, {}))
+        scheduler.log_stats()
+
+    assert "sent 1 requests to remote VCS APIs, 0 of them" in caplog.text
+
+
+def test_request_scheduler_caps_requests_per_host():
+    scheduler = RequestScheduler(max_requests_per_host=2)
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def send_request() -> Response:
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return make_response(200, {})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for future in [
+            executor.submit(scheduler.send, "example.com", send_request)
+            for _ in range(16)
+        ]:
+            future.result()
+
+    assert max_in_flight == 2
+    assert scheduler.stats.requests == 16
+
+
+def test_build_requests_session_sends_through_scheduler():
+    scheduler = RequestScheduler()
+    session = build_requests_session(retry=False, scheduler=scheduler)
+
+    assert isinstance(session.get_adapter("https://example.com"), ScheduledHTTPAdapter)
+
+    with mock.patch.object(
+        HTTPAdapter,
+        "send",
+        side_effect=[make_response(429, {"Retry-After": "0"}), make_response(200, {})],
+    ) as mock_send:
+        response = session.get("https://example.com/api")
+
+    assert response.status_code == 200
+    assert mock_send.call_count == 2
+    assert scheduler.stats.requests == 2
+
+
+def test_build_requests_session_leaves_rate_limit_to_scheduler():
+    server_hits = []
+
+    class RateLimitedHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            server_hits.append(self.path)
+            self.send_response(429)
+            self.send_header("Retry-After", "1")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *_args: Any) -> None:
+            pass
+
+    scheduler = RequestScheduler(max_rate_limit_retries=1)
+    session = build_requests_session(raise_for_status=False, scheduler=scheduler)
+
+    with ThreadingHTTPServer(("127.0.0.1", 0), RateLimitedHandler) as server:
+        server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+        server_thread.start()
+        try:
+            response = session.get(f"http://127.0.0.1:{server.server_port}/api")
+        finally:
+            server.shutdown()
+
+    # urllib3 does not retry the response itself, the scheduler retries it once
+    assert response.status_code == 429
+    assert len(server_hits) == 2
+    assert scheduler.stats.requests == 2
+    assert scheduler.stats.throttled_requests == 1
+    assert scheduler.stats.throttled_seconds > 0
+    # The other requests to the host are held off until the limit resets
+    assert scheduler._get_host(f"127.0.0.1:{server.server_port}")[1].is_limited
+
+
+def test_remote_release_cache_revalidates_with_etag():
+    url = "https://example.com/api/releases/1"
+    release = {"id": 1, "body": "notes"}
+    cache = RemoteReleaseCache()
+    session = Session()
+
+    with requests_mock.Mocker(session=session) as m:
+        m.get(
+            url,
+            [
+                {"json": release, "headers": {"ETag": '"v1"'}},
+                {"status_code": 304, "headers": {"ETag": '"v1"'}},
+            ],
+        )
+
+        first_read = cache.get_json(session, url)
+        second_read = cache.get_json(session, url)
+
+    assert release == first_read
+    assert release == second_read
+    assert "If-None-Match" not in m.request_history[0].headers
+    assert m.request_history[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_remote_release_cache_ignores_non_release_objects():
+    url = "https://example.com/api/releases/1"
+    cache = RemoteReleaseCache()
+    cache.set(url, {"id": 1, "body": "old notes"})
+    cache.set(url, ["not", "a", "release"])
+
+    assert cache.get(url) == {"id": 1, "body": "old notes"}
+
+    cache.set(url, {"id": 1, "body": "new notes"})
+
+    assert cache.get(url) == {"id": 1, "body": "new notes"}
+    assert cache.get("https://example.com/api/releases/2") is None
+
+
+def test_remote_release_cache_shared_by_clients():
+    assert get_remote_release_cache() is get_remote_release_cache()
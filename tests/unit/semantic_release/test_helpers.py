@@ -1,8 +1,26 @@
-from typing import Iterable
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, Iterable
 
 import pytest
 
-from semantic_release.helpers import ParsedGitUrl, parse_git_url, sort_numerically
+from semantic_release.helpers import (
+    CombinedPatternMatcher,
+    ParsedGitUrl,
+    atomic_open_text,
+    atomic_write_text,
+    insert_sorted_numerically,
+    parse_git_url,
+    run_ordered_in_pool,
+    sort_numerically,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 @pytest.mark.parametrize(
@@ -278,6 +296,20 @@ def test_parse_invalid_git_urls(url: str):
                     True,
                     False,
                 ),
+                (
+                    "Item without a number equal to a prefix (ASC)",
+                    ["#1", "#", "#10", "#0"],
+                    ["#", "#0", "#1", "#10"],
+                    False,
+                    False,
+                ),
+                (
+                    "Item without a number equal to a prefix (DESC)",
+                    ["#1", "#", "#10", "#0"],
+                    ["#", "#10", "#1", "#0"],
+                    True,
+                    False,
+                ),
             ],
             start=1,
         )
@@ -295,3 +327,206 @@ def test_sort_numerically(
         allow_hex=allow_hex,
     )
     assert sorted_list == actual_list
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("allow_hex", [False, True])
+def test_insert_sorted_numerically_matches_full_sort(reverse: bool, allow_hex: bool):
+    batches = [
+        {"#10", "#2"},
+        {"ABC-1", "#2", "feature"},
+        {"0xff", "#100", "ABC-12", "PR#5"},
+        {"bugfix", "#10", "0x1a", "#1"},
+        {"#", "PR#", "#0"},
+    ]
+    accumulated: set[str] = set()
+    sorted_items: list[str] = []
+
+    for batch in batches:
+        accumulated.update(batch)
+        result = insert_sorted_numerically(
+            sorted_items, batch, reverse=reverse, allow_hex=allow_hex
+        )
+
+        assert result is sorted_items
+        assert (
+            sort_numerically(accumulated, reverse=reverse, allow_hex=allow_hex)
+            == sorted_items
+        )
+
+
+@pytest.mark.parametrize(
+    "patterns, string, expected_index",
+    [
+        pytest.param(
+            patterns,
+            string,
+            expected_index,
+            id=f"({i}) {test_id}",
+        )
+        for i, (test_id, patterns, string, expected_index) in enumerate(
+            [
+                (
+                    "No patterns",
+                    [],
+                    "chore: update deps",
+                    None,
+                ),
+                (
+                    "No match",
+                    [r"chore(?:\([^)]*?\))?: .+", r"ci: .+"],
+                    "feat: add feature",
+                    None,
+                ),
+                (
+                    "Anchored at start of string",
+                    [r"chore: .+"],
+                    "feat: add feature\n\nchore: not really",
+                    None,
+                ),
+                (
+                    "First matching pattern wins",
+                    [r"ci: .+", r"chore: .+", r"chore: update .+"],
+                    "chore: update deps",
+                    1,
+                ),
+                (
+                    "Duplicate named groups across patterns",
+                    [r"(?P<version>\d+\.\d+)", r"v(?P<version>\d+\.\d+)"],
+                    "v1.2.3",
+                    1,
+                ),
+                (
+                    "Numbered back-reference is evaluated individually",
+                    [r"(\w+) \1", r"(fix) .+"],
+                    "fix fix",
+                    0,
+                ),
+                (
+                    "Global inline flags are evaluated individually",
+                    [r"(?i)merge .+", r"Merge .+"],
+                    "MERGE branch",
+                    0,
+                ),
+                (
+                    "Individually evaluated pattern keeps priority",
+                    [r"chore: .+", r"(?i)fix: .+", r"FIX: .+"],
+                    "FIX: typo",
+                    1,
+                ),
+            ],
+            start=1,
+        )
+    ],
+)
+def test_combined_pattern_matcher(
+    patterns: list[str], string: str, expected_index: int | None
+):
+    compiled_patterns = [re.compile(pattern) for pattern in patterns]
+    matcher = CombinedPatternMatcher(compiled_patterns)
+
+    actual = matcher.match(string)
+
+    expected = None if expected_index is None else compiled_patterns[expected_index]
+    assert expected is actual
+    assert bool(actual) == any(p.match(string) for p in compiled_patterns)
+
+
+def test_combined_pattern_matcher_respects_compiled_flags():
+    patterns = [re.compile(r"merge .+", re.IGNORECASE), re.compile(r"x.y", re.DOTALL)]
+    matcher = CombinedPatternMatcher(patterns)
+
+    assert patterns[0] is matcher.match("MERGE branch")
+    assert patterns[1] is matcher.match("x\ny")
+    assert matcher.match("y") is None
+
+
+@pytest.mark.parametrize(
+    "new_content, expected_changed",
+    [("same\ncontent\n", False), ("new\ncontent\n", True), ("same\n", True)],
+)
+def test_atomic_write_text_skip_unchanged(
+    tmp_path: Path, new_content: str, expected_changed: bool
+):
+    filepath = tmp_path / "file.txt"
+    filepath.write_text("same\ncontent\n", encoding="utf-8")
+    os.utime(filepath, ns=(0, 0))
+
+    changed = atomic_write_text(
+        filepath, new_content, encoding="utf-8", skip_unchanged=True
+    )
+
+    assert expected_changed == changed
+    assert new_content == filepath.read_text(encoding="utf-8")
+    assert expected_changed == (filepath.stat().st_mtime_ns != 0)
+
+
+@pytest.mark.parametrize(
+    "chunks, expected_changed",
+    [(["same\n", "content\n"], False), (["new\n", "content\n"], True)],
+)
+def test_atomic_open_text_skip_unchanged(
+    tmp_path: Path, chunks: list[str], expected_changed: bool
+):
+    filepath = tmp_path / "file.txt"
+    filepath.write_text("same\ncontent\n", encoding="utf-8")
+    os.utime(filepath, ns=(0, 0))
+
+    atomic_file = atomic_open_text(filepath, encoding="utf-8", skip_unchanged=True)
+    with atomic_file as fd:
+        fd.writelines(chunks)
+
+    assert expected_changed == atomic_file.changed
+    assert str.join("", chunks) == filepath.read_text(encoding="utf-8")
+    assert expected_changed == (filepath.stat().st_mtime_ns != 0)
+    # the temporary file is always cleaned up
+    assert [filepath] == list(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize("max_workers", [None, 1, 2, 16])
+def test_run_ordered_in_pool_keeps_item_order(max_workers: int | None):
+    def slow_square(item: int) -> int:
+        # later items finish first
+        time.sleep((5 - item) / 1000)
+        return item * item
+
+    assert run_ordered_in_pool(slow_square, range(5), max_workers=max_workers) == [
+        0,
+        1,
+        4,
+        9,
+        16,
+    ]
+
+
+def test_run_ordered_in_pool_raises_error_of_first_failing_item():
+    processed: list[int] = []
+
+    def fail_on_odd(item: int) -> int:
+        # the first failing item is the last one to fail
+        time.sleep((5 - item) / 1000)
+        processed.append(item)
+        if item % 2:
+            raise ValueError(item)
+        return item
+
+    with pytest.raises(ValueError, match="^1$"):
+        run_ordered_in_pool(fail_on_odd, list(range(5)), max_workers=5)
+
+    # every item is processed before the error is raised
+    assert sorted(processed) == [0, 1, 2, 3, 4]
+
+
+def test_run_ordered_in_pool_clamps_workers_to_items():
+    thread_names: set[str] = set()
+    barrier = threading.Barrier(2, timeout=5)
+
+    def record_thread(_item: int) -> None:
+        thread_names.add(threading.current_thread().name)
+        barrier.wait()
+
+    run_ordered_in_pool(
+        record_thread, [1, 2], max_workers=32, thread_name_prefix="psr-test"
+    )
+
+    assert {"psr-test_0", "psr-test_1"} == thread_names
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 from pathlib import Path
 from re import compile as regexp
 from textwrap import dedent
@@ -284,6 +285,110 @@ def test_pattern_declaration_no_file_change(
     assert file_modified is None
 
 
+def test_pattern_declaration_from_glob_definition(
+    default_tag_format_str: str,
+    change_to_ex_proj_dir: None,
+):
+    """
+    Given a "version_variables" definition with a recursive glob path,
+    When the definition is expanded,
+    Then a declaration is created for each matching file which contains the variable
+    """
+    chart_files = [
+        Path("charts", *subdirs, "Chart.yaml").resolve()
+        for subdirs in (("api",), ("web",), ("web", "nested"))
+    ]
+    for chart_file in chart_files:
+        chart_file.parent.mkdir(parents=True, exist_ok=True)
+        chart_file.write_text("appVersion: 1.0.0\n")
+
+    unrelated_file = Path("charts", "db", "Chart.yaml").resolve()
+    unrelated_file.parent.mkdir(parents=True)
+    unrelated_file.write_text("name: db\n")
+    Path("charts", "empty", "Chart.yaml").parent.mkdir(parents=True)
+    Path("charts", "empty", "Chart.yaml").touch()
+
+    declarations = PatternVersionDeclaration.from_glob_definition(
+        "charts/**/Chart.yaml:appVersion", tag_format=default_tag_format_str
+    )
+
+    assert chart_files == [declaration.path for declaration in declarations]
+
+    for declaration in declarations:
+        declaration.update_file_w_version(
+            new_version=Version.parse("1.2.3", tag_format=default_tag_format_str),
+            noop=False,
+        )
+
+    assert all(
+        chart_file.read_text() == "appVersion: 1.2.3\n" for chart_file in chart_files
+    )
+    assert unrelated_file.read_text() == "name: db\n"
+
+
+def test_pattern_declaration_from_glob_definition_from_root_dir(
+    default_tag_format_str: str,
+    tmp_path: Path,
+):
+    """
+    Given a "version_variables" definition with a relative glob path,
+    When the definition is expanded with a root directory,
+    Then the glob is expanded from the root directory instead of the working directory
+    """
+    chart_file = tmp_path / "charts" / "api" / "Chart.yaml"
+    chart_file.parent.mkdir(parents=True)
+    chart_file.write_text("appVersion: 1.0.0\n")
+
+    declarations = PatternVersionDeclaration.from_glob_definition(
+        "charts/**/Chart.yaml:appVersion",
+        tag_format=default_tag_format_str,
+        root_dir=tmp_path,
+    )
+
+    assert [chart_file.resolve()] == [declaration.path for declaration in declarations]
+
+
+def test_pattern_declaration_from_glob_definition_warns_on_no_match(
+    default_tag_format_str: str,
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+):
+    """
+    Given a "version_variables" definition with a glob path which matches no file,
+    When the definition is expanded,
+    Then no declaration is created and a warning is logged
+    """
+    with caplog.at_level(logging.WARNING):
+        declarations = PatternVersionDeclaration.from_glob_definition(
+            "chrats/**/Chart.yaml:appVersion",
+            tag_format=default_tag_format_str,
+            root_dir=tmp_path,
+        )
+
+    assert not declarations
+    assert any(
+        record.levelno == logging.WARNING and "chrats" in record.getMessage()
+        for record in caplog.records
+    )
+
+
+def test_pattern_declaration_from_glob_definition_wo_glob(
+    default_tag_format_str: str,
+):
+    """
+    Given a "version_variables" definition without any glob,
+    When the definition is expanded,
+    Then a single declaration is created even when the file does not exist (yet)
+    """
+    declarations = PatternVersionDeclaration.from_glob_definition(
+        "nonexistent_file:__version__", tag_format=default_tag_format_str
+    )
+
+    assert [Path("nonexistent_file").resolve()] == [
+        declaration.path for declaration in declarations
+    ]
+
+
 def test_pattern_declaration_error_on_missing_file(
     default_tag_format_str: str,
 ):
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+from pathlib import Path
+from textwrap import dedent
+from unittest import mock
+
+import pytest
+
+from semantic_release import helpers
+from semantic_release.helpers import atomic_write_text
+from semantic_release.version.declarations.pattern import PatternVersionDeclaration
+from semantic_release.version.declarations.stamping import (
+    group_declarations_by_file,
+    read_versions_in_files,
+    stamp_version_in_files,
+)
+from semantic_release.version.declarations.toml import TomlVersionDeclaration
+from semantic_release.version.version import Version
+
+
+@pytest.fixture
+def multi_declaration_files(change_to_ex_proj_dir: None) -> tuple[Path, Path]:
+    py_file = Path("version_module.py").resolve()
+    py_file.write_text(
+        dedent(
+            """\
+            __version__ = "1.0.0"
+            VERSION = "1.0.0"
+            __release__ = "v1.0.0"
+            """
+        )
+    )
+    toml_file = Path("version_file.toml").resolve()
+    toml_file.write_text(
+        dedent(
+            """\
+            [project]
+            version = "1.0.0"
+
+            [tool.poetry]
+            version = "1.0.0"
+            """
+        )
+    )
+    return py_file, toml_file
+
+
+def test_group_declarations_by_file(multi_declaration_files: tuple[Path, Path]):
+    py_file, toml_file = multi_declaration_files
+    declarations = [
+        TomlVersionDeclaration.from_string_definition(f"{toml_file}:project.version"),
+        PatternVersionDeclaration.from_string_definition(
+            f"{py_file}:__version__", "v{version}"
+        ),
+        TomlVersionDeclaration.from_string_definition(
+            f"{toml_file}:tool.poetry.version"
+        ),
+        PatternVersionDeclaration.from_string_definition(
+            f"{py_file}:VERSION", "v{version}"
+        ),
+    ]
+
+    assert [
+        [declarations[0], declarations[2]],
+        [declarations[1], declarations[3]],
+    ] == group_declarations_by_file(declarations)
+
+
+def test_stamp_version_in_files_reads_n_writes_each_file_once(
+    multi_declaration_files: tuple[Path, Path],
+):
+    py_file, toml_file = multi_declaration_files
+    new_version = Version.parse("1.2.3")
+    declarations = [
+        TomlVersionDeclaration.from_string_definition(f"{toml_file}:project.version"),
+        TomlVersionDeclaration.from_string_definition(
+            f"{toml_file}:tool.poetry.version"
+        ),
+        *(
+            PatternVersionDeclaration.from_string_definition(definition, "v{version}")
+            for definition in (
+                f"{py_file}:__version__",
+                f"{py_file}:VERSION",
+                f"{py_file}:__release__:tf",
+            )
+        ),
+    ]
+
+    expected_py_contents = dedent(
+        """\
+        __version__ = "1.2.3"
+        VERSION = "1.2.3"
+        __release__ = "v1.2.3"
+        """
+    )
+    expected_toml_contents = dedent(
+        """\
+        [project]
+        version = "1.2.3"
+
+        [tool.poetry]
+        version = "1.2.3"
+        """
+    )
+
+    with mock.patch.object(
+        Path, "read_text", autospec=True, side_effect=Path.read_text
+    ) as mock_read, mock.patch(
+        "semantic_release.version.declarations.stamping.atomic_write_text",
+        wraps=atomic_write_text,
+    ) as mock_write:
+        modified_paths = stamp_version_in_files(declarations, new_version=new_version)
+
+    assert [toml_file, py_file] == modified_paths
+    assert mock_read.call_count == 2
+    assert mock_write.call_count == 2
+    assert expected_py_contents == py_file.read_text()
+    assert expected_toml_contents == toml_file.read_text()
+
+
+def test_stamp_version_in_files_skips_unchanged_file(
+    multi_declaration_files: tuple[Path, Path],
+):
+    py_file, _ = multi_declaration_files
+    starting_contents = py_file.read_text()
+    declarations = [
+        PatternVersionDeclaration.from_string_definition(
+            f"{py_file}:{variable}", "v{version}"
+        )
+        for variable in ("__version__", "VERSION")
+    ]
+
+    modified_paths = stamp_version_in_files(
+        declarations, new_version=Version.parse("1.0.0")
+    )
+
+    assert not modified_paths
+    assert starting_contents == py_file.read_text()
+
+
+def test_stamp_version_in_files_noop(multi_declaration_files: tuple[Path, Path]):
+    py_file, _ = multi_declaration_files
+    starting_contents = py_file.read_text()
+    declarations = [
+        PatternVersionDeclaration.from_string_definition(
+            f"{py_file}:{variable}", "v{version}"
+        )
+        for variable in ("__version__", "VERSION")
+    ]
+
+    modified_paths = stamp_version_in_files(
+        declarations, new_version=Version.parse("1.2.3"), noop=True
+    )
+
+    assert [py_file] == modified_paths
+    assert starting_contents == py_file.read_text()
+
+
+def test_stamp_version_in_files_concurrently_keeps_declaration_order(
+    change_to_ex_proj_dir: None,
+):
+    files = [Path(f"module_{i}.py").resolve() for i in range(20)]
+    for file in files:
+        file.write_text('__version__ = "1.0.0"\n')
+
+    declarations = [
+        PatternVersionDeclaration.from_string_definition(
+            f"{file}:__version__", "v{version}"
+        )
+        for file in reversed(files)
+    ]
+
+    modified_paths = stamp_version_in_files(
+        declarations, new_version=Version.parse("1.2.3"), max_workers=4
+    )
+
+    assert list(reversed(files)) == modified_paths
+    assert all(file.read_text() == '__version__ = "1.2.3"\n' for file in files)
+
+
+def test_stamp_version_in_files_sequentially_wo_thread_pool(
+    change_to_ex_proj_dir: None,
+):
+    files = [Path(f"module_{i}.py").resolve() for i in range(3)]
+    for file in files:
+        file.write_text('__version__ = "1.0.0"\n')
+
+    declarations = [
+        PatternVersionDeclaration.from_string_definition(
+            f"{file}:__version__", "v{version}"
+        )
+        for file in files
+    ]
+
+    with mock.patch.object(
+        helpers, "ThreadPoolExecutor", side_effect=AssertionError("thread pool used")
+    ):
+        modified_paths = stamp_version_in_files(
+            declarations, new_version=Version.parse("1.2.3"), max_workers=1
+        )
+        read_versions_in_files(declarations, max_workers=1)
+
+    assert files == modified_paths
+    assert all(file.read_text() == '__version__ = "1.2.3"\n' for file in files)
+
+
+def test_stamp_version_in_files_concurrently_raises_first_declared_error(
+    change_to_ex_proj_dir: None,
+):
+    existing_file = Path("module.py").resolve()
+    existing_file.write_text('__version__ = "1.0.0"\n')
+
+    declarations = [
+        PatternVersionDeclaration.from_string_definition(
+            f"{file}:__version__", "v{version}"
+        )
+        for file in ("missing_1.py", existing_file, "missing_2.py")
+    ]
+
+    with pytest.raises(FileNotFoundError, match="missing_1"):
+        stamp_version_in_files(declarations, new_version=Version.parse("1.2.3"))
+
+    # other files are still stamped
+    assert existing_file.read_text() == '__version__ = "1.2.3"\n'
+
+
+def test_read_versions_in_files_reads_each_file_once(
+    multi_declaration_files: tuple[Path, Path],
+):
+    py_file, toml_file = multi_declaration_files
+    declarations = [
+        PatternVersionDeclaration.from_string_definition(
+            f"{py_file}:__version__", "v{version}"
+        ),
+        TomlVersionDeclaration.from_string_definition(f"{toml_file}:project.version"),
+        PatternVersionDeclaration.from_string_definition(
+            f"{py_file}:__release__:tf", "v{version}"
+        ),
+        TomlVersionDeclaration.from_string_definition(
+            f"{toml_file}:tool.poetry.version"
+        ),
+    ]
+
+    with mock.patch.object(
+        Path, "read_text", autospec=True, side_effect=Path.read_text
+    ) as mock_read:
+        results = read_versions_in_files(declarations, max_workers=2)
+
+    assert mock_read.call_count == 2
+    assert [
+        declarations[0],
+        declarations[2],
+        declarations[1],
+        declarations[3],
+    ] == [declaration for declaration, _ in results]
+    assert all({Version.parse("1.0.0")} == versions for _, versions in results)
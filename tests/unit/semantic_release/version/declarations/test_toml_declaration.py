@@ -4,13 +4,18 @@ from pathlib import Path
 from re import compile as regexp
 from textwrap import dedent
 from typing import TYPE_CHECKING
+from unittest import mock
 
 import pytest
+import tomlkit
 from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
 
 from semantic_release.version.declarations.enum import VersionStampType
 from semantic_release.version.declarations.i_version_replacer import IVersionReplacer
-from semantic_release.version.declarations.toml import TomlVersionDeclaration
+from semantic_release.version.declarations.toml import (
+    TomlVersionDeclaration,
+    tomllib,
+)
 from semantic_release.version.version import Version
 
 from tests.fixtures.git_repo import default_tag_format_str
@@ -318,6 +323,99 @@ def test_toml_declaration_noop_warning_on_no_version_in_file(
     )
 
 
+@pytest.mark.skipif(tomllib is None, reason="requires the stdlib tomllib parser")
+def test_toml_declaration_splices_only_the_version_value(
+    change_to_ex_proj_dir: None,
+):
+    test_file = "test_file.toml"
+    starting_contents = dedent(
+        """\
+        [project]
+        name = "example"   # aligned   comment
+        version = '1.0.0'  # managed by semantic-release
+
+        [tool.example]
+        version = "1.0.0"
+        """
+    )
+    expected_contents = dedent(
+        """\
+        [project]
+        name = "example"   # aligned   comment
+        version = "1.2.3"  # managed by semantic-release
+
+        [tool.example]
+        version = "1.0.0"
+        """
+    )
+    Path(test_file).write_text(starting_contents)
+
+    version_replacer = TomlVersionDeclaration.from_string_definition(
+        f"{test_file}:project.version"
+    )
+
+    with mock.patch.object(tomlkit, "dumps", wraps=tomlkit.dumps) as mock_dumps:
+        actual_contents = version_replacer.replace(Version.parse("1.2.3"))
+
+    assert expected_contents == actual_contents
+    # No full document round-trip was needed
+    assert mock_dumps.call_count == 0
+
+
+@pytest.mark.parametrize(
+    "starting_contents, expected_contents",
+    [
+        pytest.param(
+            dedent(
+                '''\
+                [project]
+                description = """
+                version = "1.0.0"
+                """
+                version = "1.0.0"
+                '''
+            ),
+            dedent(
+                '''\
+                [project]
+                description = """
+                version = "1.0.0"
+                """
+                version = "1.2.3"
+                '''
+            ),
+            id="fake assignment in multi-line string",
+        ),
+        pytest.param(
+            dedent(
+                """\
+                project = { name = "example", version = "1.0.0" }
+                """
+            ),
+            dedent(
+                """\
+                project = { name = "example", version = "1.2.3" }
+                """
+            ),
+            id="inline table",
+        ),
+    ],
+)
+def test_toml_declaration_falls_back_on_ambiguous_content(
+    starting_contents: str,
+    expected_contents: str,
+    change_to_ex_proj_dir: None,
+):
+    test_file = "test_file.toml"
+    Path(test_file).write_text(starting_contents)
+
+    version_replacer = TomlVersionDeclaration.from_string_definition(
+        f"{test_file}:project.version"
+    )
+
+    assert expected_contents == version_replacer.replace(Version.parse("1.2.3"))
+
+
 @pytest.mark.parametrize(
     "replacement_def, error_msg",
     [
@@ -348,3 +446,27 @@ def test_toml_declaration_w_invalid_definition(
     """
     with pytest.raises(ValueError, match=error_msg):
         TomlVersionDeclaration.from_string_definition(replacement_def)
+
+
+def test_toml_declaration_from_glob_definition(change_to_ex_proj_dir: None):
+    """
+    Given a "version_toml" definition with a recursive glob path,
+    When the definition is expanded,
+    Then a declaration is only created for the matching files containing the key
+    """
+    package_files = [
+        Path("packages", name, "pyproject.toml").resolve() for name in ("a", "b")
+    ]
+    for package_file in package_files:
+        package_file.parent.mkdir(parents=True)
+        package_file.write_text('[project]\nversion = "1.0.0"\n')
+
+    unrelated_file = Path("packages", "c", "pyproject.toml").resolve()
+    unrelated_file.parent.mkdir(parents=True)
+    unrelated_file.write_text('[project]\nname = "c"\n')
+
+    declarations = TomlVersionDeclaration.from_glob_definition(
+        "packages/**/pyproject.toml:project.version"
+    )
+
+    assert package_files == [declaration.path for declaration in declarations]